@@ -40,6 +40,7 @@ Functions
     mesh_explode
     mesh_flip_cycles
     mesh_geodesic_distances_numpy
+    mesh_geometry_cache
     mesh_isolines_numpy
     mesh_offset
     mesh_oriented_bounding_box_numpy
@@ -49,8 +50,10 @@ Functions
     mesh_transform_numpy
     mesh_transformed_numpy
     mesh_weld
+    mesh_weld_numpy
     meshes_join
     meshes_join_and_weld
+    meshes_join_and_weld_numpy
     trimesh_descent
     trimesh_face_circle
     trimesh_gaussian_curvature
@@ -12,6 +12,17 @@ from compas.base import Base
 __all__ = ['Datastructure']
 
 
+try:
+    _ATOMIC = (bool, int, long, float, complex, basestring, type(None))  # noqa: F821
+except NameError:
+    _ATOMIC = (bool, int, float, complex, str, bytes, type(None))
+
+
+def _copy_attributes(attr):
+    """Copy an attribute dict, sharing its immutable values and deep-copying the others."""
+    return {name: value if isinstance(value, _ATOMIC) else deepcopy(value) for name, value in attr.items()}
+
+
 class Datastructure(Base):
 
     def __init__(self):
@@ -112,6 +123,12 @@ class Datastructure(Base):
         -------
         :class:`compas.datastructure.Datastructure`
             A separate, but identical datastructure object.
+
+        Notes
+        -----
+        The default implementation makes a deep copy of the data of the datastructure
+        and constructs the copy from that.
+        Subclasses may override this with a direct copy of their internal storage.
         """
         if not cls:
             cls = type(self)
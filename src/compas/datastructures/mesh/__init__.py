@@ -32,6 +32,8 @@ if not IPY:
     from .contours_numpy import *  # noqa: F401 F403
     from .descent_numpy import *  # noqa: F401 F403
     from .geodesics_numpy import *  # noqa: F401 F403
+    from .geometry_numpy import *  # noqa: F401 F403
+    from .join_numpy import *  # noqa: F401 F403
     from .pull_numpy import *  # noqa: F401 F403
     from .smoothing_numpy import *  # noqa: F401 F403
     from .transformations_numpy import *  # noqa: F401 F403
@@ -2,6 +2,8 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from compas import IPY
+
 from .core import BaseMesh
 from .core import mesh_collapse_edge
 from .core import mesh_split_edge
@@ -24,6 +26,9 @@ from .transformations import mesh_transform
 from .transformations import mesh_transformed
 from .triangulation import mesh_quads_to_triangles
 
+if not IPY:
+    from .geometry_numpy import mesh_geometry_cache
+
 
 __all__ = ['Mesh']
 
@@ -69,6 +74,9 @@ class Mesh(BaseMesh):
     unify_cycles = mesh_unify_cycles
     quads_to_triangles = mesh_quads_to_triangles
 
+    if not IPY:
+        geometry_cache = mesh_geometry_cache
+
 
 # =============================================================================
 # Main
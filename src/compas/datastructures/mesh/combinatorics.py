@@ -70,10 +70,8 @@ if __name__ == "__main__":
     xmin = min(x)
     xmax = max(x)
     points = translate_points_xy(points, [1.5 * (xmax - xmin), 0, 0])
-    for key, attr in m2.vertices(True):
-        attr['x'] = points[key][0]
-        attr['y'] = points[key][1]
-        attr['z'] = points[key][2]
+    for key in m2.vertices():
+        m2.vertex_attributes(key, 'xyz', points[key])
 
     m3 = meshes_join([m1, m2])
 
@@ -0,0 +1,603 @@
+"""
+Array-backed storage for the vertex, face and halfedge dictionaries of a :class:`HalfEdge` data structure.
+
+The classes in this module implement the mapping interface of the plain dictionaries
+of the default storage (``vertex``, ``face`` and ``halfedge``),
+but keep the vertex coordinates, the face vertices and the halfedges in flat,
+contiguous buffers of the :mod:`array` module.
+The buffers can be wrapped by NumPy without copying,
+for example ``numpy.frombuffer(mesh.vertex.xyz).reshape((-1, 3))``.
+
+Vertex and face identifiers are used directly as indices into the buffers.
+They therefore have to be non-negative integers,
+and they should be (more or less) contiguous to avoid wasting memory.
+Both, and the number of halfedges, are limited to the range of a C ``int``.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from array import array
+
+from compas.datastructures._mutablemapping import MutableMapping
+from compas.datastructures.datastructure import _copy_attributes
+
+
+__all__ = ['VertexArray', 'FaceArray', 'HalfedgeArray']
+
+
+AXES = {'x': 0, 'y': 1, 'z': 2}
+EXISTS = 8
+
+
+def _check_index(key):
+    if key < 0:
+        raise ValueError("Compact storage only supports non-negative integer identifiers: {}".format(key))
+
+
+# ==============================================================================
+# Vertices
+# ==============================================================================
+
+
+class VertexRecord(MutableMapping):
+    """Mutable mapping providing a read/write view of the attributes of a single vertex in a :class:`VertexArray`."""
+
+    __slots__ = ('_store', '_key')
+
+    def __init__(self, store, key):
+        self._store = store
+        self._key = key
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def __getitem__(self, name):
+        store = self._store
+        key = self._key
+        i = AXES.get(name)
+        if i is not None:
+            if store.flags[key] & (1 << i):
+                return store.xyz[3 * key + i]
+            raise KeyError(name)
+        attr = store.attr.get(key)
+        if attr is None:
+            raise KeyError(name)
+        return attr[name]
+
+    def __setitem__(self, name, value):
+        store = self._store
+        key = self._key
+        i = AXES.get(name)
+        if i is not None:
+            store.xyz[3 * key + i] = value
+            store.flags[key] |= 1 << i
+            return
+        attr = store.attr.get(key)
+        if attr is None:
+            attr = store.attr[key] = {}
+        attr[name] = value
+
+    def __delitem__(self, name):
+        store = self._store
+        key = self._key
+        i = AXES.get(name)
+        if i is not None:
+            if not store.flags[key] & (1 << i):
+                raise KeyError(name)
+            store.flags[key] &= ~(1 << i)
+            store.xyz[3 * key + i] = 0.0
+            return
+        attr = store.attr.get(key)
+        if attr is None:
+            raise KeyError(name)
+        del attr[name]
+        if not attr:
+            del store.attr[key]
+
+    def __iter__(self):
+        flags = self._store.flags[self._key]
+        for name in 'xyz':
+            if flags & (1 << AXES[name]):
+                yield name
+        attr = self._store.attr.get(self._key)
+        if attr:
+            for name in list(attr):
+                yield name
+
+    def __len__(self):
+        flags = self._store.flags[self._key]
+        return (flags & 1) + (flags >> 1 & 1) + (flags >> 2 & 1) + len(self._store.attr.get(self._key) or ())
+
+    def copy(self):
+        return dict(self.items())
+
+
+class VertexArray(MutableMapping):
+    """Array-backed replacement of the vertex dictionary of a halfedge data structure.
+
+    Attributes
+    ----------
+    xyz : array
+        The vertex coordinates as a flat buffer of doubles, with three values per vertex identifier.
+    flags : bytearray
+        Per vertex identifier, a bit mask marking the existence of the vertex
+        and of explicit values for its ``x``, ``y`` and ``z`` attributes.
+    attr : dict
+        The remaining attributes of the vertices that have them.
+
+    """
+
+    def __init__(self):
+        super(VertexArray, self).__init__()
+        self.xyz = array('d')
+        self.flags = bytearray()
+        self.attr = {}
+        self.count = 0
+
+    def _reserve(self, key):
+        _check_index(key)
+        n = len(self.flags)
+        if key >= n:
+            self.flags.extend(bytearray(key + 1 - n))
+            self.xyz.extend(array('d', [0.0]) * (3 * (key + 1 - n)))
+
+    def __contains__(self, key):
+        try:
+            return key >= 0 and bool(self.flags[key] & EXISTS)
+        except (TypeError, IndexError):
+            return False
+
+    def __getitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        return VertexRecord(self, key)
+
+    def __setitem__(self, key, attr):
+        attr = list(attr.items())
+        if key in self:
+            self.attr.pop(key, None)
+        else:
+            self._reserve(key)
+            self.count += 1
+        self.flags[key] = EXISTS
+        self.xyz[3 * key:3 * key + 3] = array('d', [0.0, 0.0, 0.0])
+        record = VertexRecord(self, key)
+        for name, value in attr:
+            record[name] = value
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self.flags[key] = 0
+        self.xyz[3 * key:3 * key + 3] = array('d', [0.0, 0.0, 0.0])
+        self.attr.pop(key, None)
+        self.count -= 1
+
+    def __iter__(self):
+        return iter([key for key, flags in enumerate(self.flags) if flags & EXISTS])
+
+    def __len__(self):
+        return self.count
+
+    def copy(self):
+        """Make an independent copy of the store."""
+        other = VertexArray()
+        other.xyz = self.xyz[:]
+        other.flags = self.flags[:]
+        other.attr = {key: _copy_attributes(attr) for key, attr in self.attr.items()}
+        other.count = self.count
+        return other
+
+    def coordinates(self, keys=None, axes='xyz', defaults=None):
+        """Get the coordinates of multiple vertices directly from the buffer.
+
+        Parameters
+        ----------
+        keys : list of int, optional
+            The identifiers of the vertices.
+            Default is all vertices.
+        axes : str or list of str, optional
+            The coordinate axes.
+            Default is ``'xyz'``.
+        defaults : dict, optional
+            The values of coordinates that were not set explicitly.
+            Default is ``0.0`` for every axis.
+
+        Returns
+        -------
+        list
+            A list of coordinate values per vertex.
+
+        Raises
+        ------
+        KeyError
+            If any of the vertices does not exist.
+        """
+        defaults = defaults or {}
+        axes = [(AXES[name], defaults.get(name, 0.0)) for name in axes]
+        if keys is None:
+            keys = self
+        xyz = self.xyz
+        flags = self.flags
+        coordinates = []
+        for key in keys:
+            if key not in self:
+                raise KeyError(key)
+            flag = flags[key]
+            coordinates.append([xyz[3 * key + i] if flag & (1 << i) else default for i, default in axes])
+        return coordinates
+
+
+# ==============================================================================
+# Faces
+# ==============================================================================
+
+
+class FaceArray(MutableMapping):
+    """Array-backed replacement of the face dictionary of a halfedge data structure.
+
+    The vertices of all faces are stored in one flat buffer.
+    Per face identifier, the offset and size of the corresponding range of the buffer are stored.
+
+    Attributes
+    ----------
+    vertices : array
+        The vertices of all faces, one after the other.
+    offset : array
+        Per face identifier, the start of its vertices in the buffer, or ``-1`` if the face does not exist.
+    size : array
+        Per face identifier, the number of vertices of the face.
+
+    Notes
+    -----
+    Accessing a face returns a new list of vertices.
+    Modifications of the face therefore have to be written back by assignment,
+    for example ``mesh.face[fkey] = vertices``.
+
+    """
+
+    def __init__(self):
+        super(FaceArray, self).__init__()
+        self.vertices = array('i')
+        self.offset = array('i')
+        self.size = array('i')
+        self.count = 0
+        self.garbage = 0
+
+    def _reserve(self, fkey):
+        _check_index(fkey)
+        n = len(self.offset)
+        if fkey >= n:
+            self.offset.extend(array('i', [-1]) * (fkey + 1 - n))
+            self.size.extend(array('i', [0]) * (fkey + 1 - n))
+
+    def _collect(self):
+        vertices = array('i')
+        for fkey, start in enumerate(self.offset):
+            if start < 0:
+                continue
+            self.offset[fkey] = len(vertices)
+            vertices.extend(self.vertices[start:start + self.size[fkey]])
+        self.vertices = vertices
+        self.garbage = 0
+
+    def __contains__(self, fkey):
+        try:
+            return fkey >= 0 and self.offset[fkey] >= 0
+        except (TypeError, IndexError):
+            return False
+
+    def __getitem__(self, fkey):
+        if fkey not in self:
+            raise KeyError(fkey)
+        start = self.offset[fkey]
+        return self.vertices[start:start + self.size[fkey]].tolist()
+
+    def __setitem__(self, fkey, vertices):
+        vertices = array('i', vertices)
+        if fkey in self:
+            start = self.offset[fkey]
+            if self.size[fkey] == len(vertices):
+                self.vertices[start:start + len(vertices)] = vertices
+                return
+            self.garbage += self.size[fkey]
+        else:
+            self._reserve(fkey)
+            self.count += 1
+        self.offset[fkey] = len(self.vertices)
+        self.size[fkey] = len(vertices)
+        self.vertices.extend(vertices)
+        if self.garbage > len(self.vertices) // 2:
+            self._collect()
+
+    def __delitem__(self, fkey):
+        if fkey not in self:
+            raise KeyError(fkey)
+        self.garbage += self.size[fkey]
+        self.offset[fkey] = -1
+        self.size[fkey] = 0
+        self.count -= 1
+
+    def __iter__(self):
+        return iter([fkey for fkey, start in enumerate(self.offset) if start >= 0])
+
+    def __len__(self):
+        return self.count
+
+    def copy(self):
+        """Make an independent copy of the store."""
+        other = FaceArray()
+        other.vertices = self.vertices[:]
+        other.offset = self.offset[:]
+        other.size = self.size[:]
+        other.count = self.count
+        other.garbage = self.garbage
+        return other
+
+
+# ==============================================================================
+# Halfedges
+# ==============================================================================
+
+
+class HalfedgeRow(MutableMapping):
+    """Mutable mapping providing a read/write view of the outgoing halfedges of a single vertex in a :class:`HalfedgeArray`."""
+
+    __slots__ = ('_store', '_key')
+
+    def __init__(self, store, key):
+        self._store = store
+        self._key = key
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def _find(self, v):
+        store = self._store
+        target = store.target
+        h = store.first[self._key]
+        while h >= 0:
+            if target[h] == v:
+                return h
+            h = store.next[h]
+        return -1
+
+    def __contains__(self, v):
+        try:
+            return self._find(v) >= 0
+        except TypeError:
+            return False
+
+    def __getitem__(self, v):
+        h = self._find(v)
+        if h < 0:
+            raise KeyError(v)
+        fkey = self._store.face[h]
+        return None if fkey < 0 else fkey
+
+    def __setitem__(self, v, fkey):
+        if fkey is None:
+            fkey = -1
+        else:
+            _check_index(fkey)
+        h = self._find(v)
+        if h >= 0:
+            self._store.face[h] = fkey
+        else:
+            _check_index(v)
+            self._store._append(self._key, v, fkey)
+
+    def __delitem__(self, v):
+        self._store._remove(self._key, v)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        store = self._store
+        count = 0
+        h = store.first[self._key]
+        while h >= 0:
+            count += 1
+            h = store.next[h]
+        return count
+
+    def keys(self):
+        store = self._store
+        keys = []
+        h = store.first[self._key]
+        while h >= 0:
+            keys.append(store.target[h])
+            h = store.next[h]
+        return keys
+
+    def values(self):
+        store = self._store
+        values = []
+        h = store.first[self._key]
+        while h >= 0:
+            fkey = store.face[h]
+            values.append(None if fkey < 0 else fkey)
+            h = store.next[h]
+        return values
+
+    def items(self):
+        return list(zip(self.keys(), self.values()))
+
+    def copy(self):
+        return dict(self.items())
+
+
+class HalfedgeArray(MutableMapping):
+    """Array-backed replacement of the halfedge dictionary of a halfedge data structure.
+
+    Every halfedge ``(u, v)`` occupies one slot in the buffers ``target``, ``face`` and ``next``.
+    The outgoing halfedges of a vertex form a linked list through ``next``,
+    in the order in which they were added,
+    starting at ``first[u]`` and ending at ``last[u]``.
+    Deleted slots are recycled through a free list.
+
+    Attributes
+    ----------
+    first : array
+        Per vertex identifier, the first outgoing halfedge,
+        ``-1`` if the vertex has no outgoing halfedges,
+        or ``-2`` if the vertex is not part of the mapping.
+    last : array
+        Per vertex identifier, the last outgoing halfedge.
+    target : array
+        Per halfedge, the identifier of the vertex it points to.
+    face : array
+        Per halfedge, the identifier of the face on its left, or ``-1`` for the *outside* face.
+    next : array
+        Per halfedge, the next outgoing halfedge of the same vertex, or ``-1``.
+
+    """
+
+    def __init__(self):
+        super(HalfedgeArray, self).__init__()
+        self.first = array('i')
+        self.last = array('i')
+        self.target = array('i')
+        self.face = array('i')
+        self.next = array('i')
+        self.free = -1
+        self.count = 0
+
+    def _reserve(self, key):
+        _check_index(key)
+        n = len(self.first)
+        if key >= n:
+            self.first.extend(array('i', [-2]) * (key + 1 - n))
+            self.last.extend(array('i', [-2]) * (key + 1 - n))
+
+    def _append(self, u, v, fkey):
+        h = self.free
+        if h >= 0:
+            self.free = self.next[h]
+            self.target[h] = v
+            self.face[h] = fkey
+            self.next[h] = -1
+        else:
+            h = len(self.target)
+            self.target.append(v)
+            self.face.append(fkey)
+            self.next.append(-1)
+        if self.last[u] < 0:
+            self.first[u] = h
+        else:
+            self.next[self.last[u]] = h
+        self.last[u] = h
+
+    def _remove(self, u, v):
+        previous = -1
+        h = self.first[u]
+        while h >= 0:
+            if self.target[h] == v:
+                break
+            previous = h
+            h = self.next[h]
+        else:
+            raise KeyError(v)
+        if previous < 0:
+            self.first[u] = self.next[h]
+        else:
+            self.next[previous] = self.next[h]
+        if self.last[u] == h:
+            self.last[u] = previous
+        self.target[h] = -1
+        self.next[h] = self.free
+        self.free = h
+
+    def _release(self, u):
+        h = self.first[u]
+        while h >= 0:
+            following = self.next[h]
+            self.target[h] = -1
+            self.next[h] = self.free
+            self.free = h
+            h = following
+
+    def add_face(self, vertices, fkey):
+        """Add the halfedges of a face cycle.
+
+        This is equivalent to setting ``halfedge[u][v] = fkey`` for every halfedge ``(u, v)`` of the face,
+        and ``halfedge[v][u] = None`` if the opposite halfedge does not exist yet.
+
+        Parameters
+        ----------
+        vertices : list of int
+            The vertices of the face.
+            All vertices should already be part of the mapping.
+        fkey : int
+            The identifier of the face.
+        """
+        _check_index(fkey)
+        first = self.first
+        target = self.target
+        face = self.face
+        next_ = self.next
+        for u, v in zip(vertices, vertices[1:] + vertices[:1]):
+            h = first[u]
+            while h >= 0 and target[h] != v:
+                h = next_[h]
+            if h >= 0:
+                face[h] = fkey
+            else:
+                self._append(u, v, fkey)
+            h = first[v]
+            while h >= 0 and target[h] != u:
+                h = next_[h]
+            if h < 0:
+                self._append(v, u, -1)
+
+    def __contains__(self, key):
+        try:
+            return key >= 0 and self.first[key] > -2
+        except (TypeError, IndexError):
+            return False
+
+    def __getitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        return HalfedgeRow(self, key)
+
+    def __setitem__(self, key, nbrs):
+        nbrs = list(nbrs.items())
+        if key in self:
+            self._release(key)
+        else:
+            self._reserve(key)
+            self.count += 1
+        self.first[key] = -1
+        self.last[key] = -1
+        row = HalfedgeRow(self, key)
+        for nbr, fkey in nbrs:
+            row[nbr] = fkey
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._release(key)
+        self.first[key] = -2
+        self.last[key] = -2
+        self.count -= 1
+
+    def __iter__(self):
+        return iter([key for key, h in enumerate(self.first) if h > -2])
+
+    def __len__(self):
+        return self.count
+
+    def copy(self):
+        """Make an independent copy of the store."""
+        other = HalfedgeArray()
+        other.first = self.first[:]
+        other.last = self.last[:]
+        other.target = self.target[:]
+        other.face = self.face[:]
+        other.next = self.next[:]
+        other.free = self.free
+        other.count = self.count
+        return other
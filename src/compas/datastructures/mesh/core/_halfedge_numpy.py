@@ -0,0 +1,157 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from array import array
+
+from numpy import arange
+from numpy import asarray
+from numpy import bincount
+from numpy import concatenate
+from numpy import cumsum
+from numpy import flatnonzero
+from numpy import full
+from numpy import intc
+from numpy import lexsort
+from numpy import maximum
+from numpy import ones
+from numpy import roll
+from numpy import where
+from numpy import zeros
+
+from ._compact import EXISTS
+
+
+__all__ = ['halfedge_build_numpy']
+
+
+def _array(typecode, values):
+    buffer = array(typecode)
+    buffer.frombytes(values.tobytes())
+    return buffer
+
+
+def halfedge_wiring_numpy(faces, number_of_vertices):
+    """Compute the halfedges of a set of faces in one vectorised pass.
+
+    Parameters
+    ----------
+    faces : array
+        The faces as an array of vertex indices with one row per face.
+    number_of_vertices : int
+        The number of vertices.
+
+    Returns
+    -------
+    tuple
+        The source vertex, the target vertex and the face of every halfedge,
+        with ``-1`` for halfedges on the *outside* of the boundary,
+        sorted per source vertex in the order in which :meth:`HalfEdge.add_face` would add them.
+    """
+    m, k = faces.shape
+    h = m * k
+    u = faces.ravel()
+    v = roll(faces, -1, axis=1).ravel()
+    # every halfedge of a face sets halfedge[u][v] = fkey
+    # and adds halfedge[v][u] = None if it does not exist yet
+    # the events are numbered in the order in which add_face would process them
+    src = concatenate((u, v))
+    dst = concatenate((v, u))
+    seq = concatenate((2 * arange(h), 2 * arange(h) + 1))
+    fkey = concatenate((arange(h) // k, full(h, -1)))
+    inside = concatenate((ones(h, dtype=bool), zeros(h, dtype=bool)))
+    order = lexsort((seq, dst, src))
+    src = src[order]
+    dst = dst[order]
+    seq = seq[order]
+    fkey = fkey[order]
+    inside = inside[order]
+    # a halfedge is inserted by its first event
+    # and points at the face of the last event that belongs to a face
+    start = ones(2 * h, dtype=bool)
+    start[1:] = (src[1:] != src[:-1]) | (dst[1:] != dst[:-1])
+    groups = flatnonzero(start)
+    last = maximum.reduceat(where(inside, arange(2 * h), -1), groups)
+    fkey = where(last >= 0, fkey[last], -1)
+    src = src[groups]
+    dst = dst[groups]
+    order = lexsort((seq[groups], src))
+    return src[order], dst[order], fkey[order]
+
+
+def halfedge_build_numpy(mesh, vertices, faces):
+    """Build the vertices, faces and halfedges of an empty mesh in bulk.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.HalfEdge`
+        An empty mesh.
+    vertices : list
+        The XYZ coordinates of the vertices.
+    faces : list or array
+        The faces as lists of vertex indices.
+
+    Returns
+    -------
+    bool
+        ``True`` if the mesh was built.
+        ``False`` if the faces can't be processed in bulk,
+        because they don't all have the same number of vertices,
+        or because some of them are degenerate or refer to vertices that don't exist.
+        In that case the mesh is not modified.
+    """
+    if not len(faces):
+        return False
+    if not hasattr(faces, 'shape'):
+        k = len(faces[0])
+        if any(len(face) != k for face in faces):
+            return False
+    faces = asarray(faces)
+    n = len(vertices)
+    if faces.ndim != 2 or faces.dtype.kind not in 'iu' or faces.shape[1] < 3:
+        return False
+    if faces.min() < 0 or faces.max() >= n:
+        return False
+    if (faces == roll(faces, -1, axis=1)).any():
+        return False
+    m, k = faces.shape
+    src, dst, fkey = halfedge_wiring_numpy(faces, n)
+    counts = bincount(src, minlength=n)
+    ends = cumsum(counts)
+
+    if mesh._compact:
+        xyz = asarray(vertices, dtype=float)
+        if xyz.shape != (n, 3):
+            return False
+        mesh.vertex.xyz = _array('d', xyz)
+        mesh.vertex.flags = bytearray([EXISTS | 7]) * n
+        mesh.vertex.count = n
+        mesh.face.vertices = _array('i', faces.astype(intc).ravel())
+        mesh.face.offset = _array('i', arange(0, m * k, k, dtype=intc))
+        mesh.face.size = _array('i', full(m, k, dtype=intc))
+        mesh.face.count = m
+        following = arange(1, len(src) + 1, dtype=intc)
+        following[ends[counts > 0] - 1] = -1
+        mesh.halfedge.first = _array('i', where(counts > 0, ends - counts, -1).astype(intc))
+        mesh.halfedge.last = _array('i', where(counts > 0, ends - 1, -1).astype(intc))
+        mesh.halfedge.target = _array('i', dst.astype(intc))
+        mesh.halfedge.face = _array('i', fkey.astype(intc))
+        mesh.halfedge.next = _array('i', following)
+        mesh.halfedge.count = n
+    else:
+        mesh.vertex = {key: {'x': x, 'y': y, 'z': z} for key, (x, y, z) in enumerate(vertices)}
+        mesh.face = dict(enumerate(faces.tolist()))
+        mesh.facedata = {key: {} for key in range(m)}
+        fkey = fkey.astype(object)
+        fkey[fkey == -1] = None
+        dst = dst.tolist()
+        fkey = fkey.tolist()
+        halfedge = mesh.halfedge = {}
+        start = 0
+        for key, end in enumerate(ends.tolist()):
+            halfedge[key] = dict(zip(dst[start:end], fkey[start:end]))
+            start = end
+    mesh._max_vertex = n - 1
+    mesh._max_face = m - 1
+    mesh._revision += 1
+    return True
@@ -72,6 +72,7 @@ def mesh_delete_duplicate_vertices(mesh, precision=None):
                 seen.add(key)
                 face.append(key)
         mesh.face[fkey] = face
+        mesh._revision += 1
         for u, v in mesh.face_halfedges(fkey):
             mesh.halfedge[u][v] = fkey
             if u not in mesh.halfedge[v]:
@@ -10,10 +10,15 @@ from distutils.version import LooseVersion
 import compas
 
 from ...datastructure import Datastructure
+from ...datastructure import _copy_attributes
 from ...attributes import VertexAttributeView
 from ...attributes import EdgeAttributeView
 from ...attributes import FaceAttributeView
 
+from ._compact import VertexArray
+from ._compact import FaceArray
+from ._compact import HalfedgeArray
+
 from compas.utilities import pairwise
 from compas.utilities import window
 
@@ -24,6 +29,13 @@ __all__ = ['HalfEdge']
 class HalfEdge(Datastructure):
     """Base half-edge data structure for representing meshes.
 
+    Parameters
+    ----------
+    compact : bool, optional
+        If ``True``, the vertex coordinates, the face vertices and the halfedges are stored
+        in flat, array-backed buffers instead of nested dictionaries.
+        Default is ``False``.
+
     Attributes
     ----------
     attributes : dict
@@ -44,6 +56,16 @@ class HalfEdge(Datastructure):
 
         .. deprecated:: 0.17.0
 
+    Notes
+    -----
+    The compact storage mode reduces the memory footprint of large meshes considerably.
+    The ``vertex``, ``face`` and ``halfedge`` dictionaries are replaced by mappings
+    with the same interface, which are backed by the buffers of the :mod:`array` module.
+    In this mode, vertex and face identifiers have to be non-negative integers,
+    the coordinates of the vertices are stored as floats,
+    and ``mesh.face[fkey]`` returns a copy of the list of face vertices.
+    Changes to the vertices of a face therefore have to be written back by assignment.
+
     """
 
     @property
@@ -144,15 +166,13 @@ class HalfEdge(Datastructure):
             schema.update(meta)
         return schema
 
-    def __init__(self):
+    def __init__(self, compact=False):
         super(HalfEdge, self).__init__()
+        self._compact = compact
         self._max_vertex = -1
         self._max_face = -1
-        self.vertex = {}
-        self.halfedge = {}
-        self.face = {}
-        self.facedata = {}
-        self.edgedata = {}
+        self._revision = 0
+        self._reset()
         self.attributes = {'name': 'Mesh'}
         self.default_vertex_attributes = {'x': 0.0, 'y': 0.0, 'z': 0.0}
         self.default_edge_attributes = {}
@@ -192,6 +212,10 @@ class HalfEdge(Datastructure):
             'face': self.face,
             'facedata': self.facedata,
         }
+        if self._compact:
+            data['vertex'] = {key: attr.copy() for key, attr in self.vertex.items()}
+            data['face'] = dict(self.face.items())
+            data['facedata'] = {fkey: self.facedata.get(fkey, {}) for fkey in self.face}
         version = LooseVersion(compas.__version__)
         if version < LooseVersion('0.16.5'):
             data['edgedata'] = {repr(key): self.edgedata[key] for key in self.edgedata}
@@ -229,18 +253,11 @@ class HalfEdge(Datastructure):
             self.default_vertex_attributes.update(dva)
             self.default_face_attributes.update(dfa)
             self.default_edge_attributes.update(dea)
-            self.vertex = {}
-            self.face = {}
-            self.halfedge = {}
-            self.facedata = {}
-            self.edgedata = {}
+            self._reset()
             # this could be handled by the schema
             # but will not work in IronPython
-            for key, attr in iter(vertex.items()):
-                self.add_vertex(int(key), attr_dict=attr)
-            for fkey, vertices in iter(face.items()):
-                attr = facedata.get(fkey) or {}
-                self.add_face(vertices, fkey=int(fkey), attr_dict=attr)
+            self._add_vertices((key, attr or {}) for key, attr in iter(vertex.items()))
+            self._add_faces((int(fkey), vertices, facedata.get(fkey) or {}) for fkey, vertices in iter(face.items()))
             for uv, attr in iter(edgedata.items()):
                 self.edgedata[uv] = attr or {}
             self._max_vertex = max_vertex
@@ -260,18 +277,11 @@ class HalfEdge(Datastructure):
             self.default_vertex_attributes.update(dva)
             self.default_face_attributes.update(dfa)
             self.default_edge_attributes.update(dea)
-            self.vertex = {}
-            self.face = {}
-            self.halfedge = {}
-            self.facedata = {}
-            self.edgedata = {}
+            self._reset()
             # this could be handled by the schema
             # but will not work in IronPython
-            for key, attr in iter(vertex.items()):
-                self.add_vertex(int(key), attr_dict=attr)
-            for fkey, vertices in iter(face.items()):
-                attr = facedata.get(fkey) or {}
-                self.add_face(vertices, fkey=int(fkey), attr_dict=attr)
+            self._add_vertices((key, attr or {}) for key, attr in iter(vertex.items()))
+            self._add_faces((int(fkey), vertices, facedata.get(fkey) or {}) for fkey, vertices in iter(face.items()))
             for edge, attr in iter(edgedata.items()):
                 key = "-".join(map(str, sorted(literal_eval(edge))))
                 if key not in self.edgedata:
@@ -285,6 +295,19 @@ class HalfEdge(Datastructure):
     # helpers
     # --------------------------------------------------------------------------
 
+    def _reset(self):
+        if self._compact:
+            self.vertex = VertexArray()
+            self.halfedge = HalfedgeArray()
+            self.face = FaceArray()
+        else:
+            self.vertex = {}
+            self.halfedge = {}
+            self.face = {}
+        self.facedata = {}
+        self.edgedata = {}
+        self._revision += 1
+
     def clear(self):
         """Clear all the mesh data."""
         del self.vertex
@@ -292,14 +315,65 @@ class HalfEdge(Datastructure):
         del self.halfedge
         del self.face
         del self.facedata
-        self.vertex = {}
-        self.edgedata = {}
-        self.halfedge = {}
-        self.face = {}
-        self.facedata = {}
+        self._reset()
         self._max_vertex = -1
         self._max_face = -1
 
+    def copy(self, cls=None):
+        """Make an independent copy of the mesh.
+
+        Parameters
+        ----------
+        cls : :class:`compas.datastructures.HalfEdge`, optional
+            The type of mesh to return.
+            Defaults to the type of the current mesh.
+
+        Returns
+        -------
+        :class:`compas.datastructures.HalfEdge`
+            A separate, but identical mesh.
+
+        Notes
+        -----
+        The copy is made directly from the internal dictionaries (or arrays) of the mesh,
+        without a round trip through its data.
+        Attribute values of immutable types are shared between the mesh and the copy.
+        A compact mesh produces a compact copy.
+
+        Examples
+        --------
+        >>> from compas.datastructures import Mesh
+        >>> mesh = Mesh.from_polyhedron(6)
+        >>> other = mesh.copy()
+        >>> other.vertex_attribute(0, 'x', 1.0)
+        >>> mesh.vertex_attribute(0, 'x') == other.vertex_attribute(0, 'x')
+        False
+
+        """
+        if not cls:
+            cls = type(self)
+        if not issubclass(cls, HalfEdge):
+            return super(HalfEdge, self).copy(cls=cls)
+        other = cls()
+        other.attributes.update(_copy_attributes(self.attributes))
+        other.default_vertex_attributes.update(_copy_attributes(self.default_vertex_attributes))
+        other.default_edge_attributes.update(_copy_attributes(self.default_edge_attributes))
+        other.default_face_attributes.update(_copy_attributes(self.default_face_attributes))
+        other._compact = self._compact
+        if self._compact:
+            other.vertex = self.vertex.copy()
+            other.halfedge = self.halfedge.copy()
+            other.face = self.face.copy()
+        else:
+            other.vertex = {key: _copy_attributes(attr) for key, attr in self.vertex.items()}
+            other.halfedge = {key: nbrs.copy() for key, nbrs in self.halfedge.items()}
+            other.face = {fkey: vertices[:] for fkey, vertices in self.face.items()}
+        other.facedata = {fkey: _copy_attributes(attr) for fkey, attr in self.facedata.items()}
+        other.edgedata = {edge: _copy_attributes(attr) for edge, attr in self.edgedata.items()}
+        other._max_vertex = self._max_vertex
+        other._max_face = self._max_face
+        return other
+
     def get_any_vertex(self):
         """Get the identifier of a random vertex.
 
@@ -443,6 +517,7 @@ class HalfEdge(Datastructure):
         attr = attr_dict or {}
         attr.update(kwattr)
         self.vertex[key].update(attr)
+        self._revision += 1
         return key
 
     def add_face(self, vertices, fkey=None, attr_dict=None, **kwattr):
@@ -495,6 +570,12 @@ class HalfEdge(Datastructure):
         attr = attr_dict or {}
         attr.update(kwattr)
         self.face[fkey] = vertices
+        self._revision += 1
+        if self._compact:
+            if attr:
+                self.facedata.setdefault(fkey, attr)
+            self.halfedge.add_face(vertices, fkey)
+            return fkey
         self.facedata.setdefault(fkey, attr)
         for u, v in pairwise(vertices + vertices[:1]):
             self.halfedge[u][v] = fkey
@@ -502,6 +583,80 @@ class HalfEdge(Datastructure):
                 self.halfedge[v][u] = None
         return fkey
 
+    def _add_vertices(self, vertices):
+        """Add vertices in bulk, without the overhead of individual calls to :meth:`add_vertex`.
+
+        Parameters
+        ----------
+        vertices : iterable
+            The vertices as ``(key, attr)`` pairs.
+            If the key is ``None``, one is generated automatically.
+        """
+        vertex = self.vertex
+        halfedge = self.halfedge
+        max_vertex = self._max_vertex
+        for key, attr in vertices:
+            if key is None:
+                key = max_vertex = max_vertex + 1
+            else:
+                key = int(key)
+                if key > max_vertex:
+                    max_vertex = key
+            if key not in vertex:
+                vertex[key] = attr.copy()
+                halfedge[key] = {}
+            else:
+                vertex[key].update(attr)
+        self._max_vertex = max_vertex
+        self._revision += 1
+
+    def _add_faces(self, faces):
+        """Add faces in bulk, without the overhead of individual calls to :meth:`add_face`.
+
+        Parameters
+        ----------
+        faces : iterable
+            The faces as ``(fkey, vertices, attr)`` triples.
+            If the key is ``None``, one is generated automatically.
+
+        Notes
+        -----
+        The vertices of the faces are cleaned up in the same way as by :meth:`add_face`.
+        Faces with less than three vertices are ignored.
+        """
+        face = self.face
+        facedata = self.facedata
+        halfedge = self.halfedge
+        compact = self._compact
+        max_face = self._max_face
+        for fkey, vertices, attr in faces:
+            if vertices[-1] == vertices[0]:
+                vertices = vertices[:-1]
+            vertices = [int(key) for key in vertices]
+            following = vertices[1:] + vertices[:1]
+            if len(set(vertices)) < len(vertices):
+                vertices = [u for u, v in zip(vertices, following) if u != v]
+                following = vertices[1:] + vertices[:1]
+            if len(vertices) < 3:
+                continue
+            if fkey is None:
+                fkey = max_face = max_face + 1
+            elif fkey > max_face:
+                max_face = fkey
+            face[fkey] = vertices
+            if compact:
+                if attr:
+                    facedata.setdefault(fkey, attr)
+                halfedge.add_face(vertices, fkey)
+                continue
+            facedata.setdefault(fkey, attr)
+            for u, v in zip(vertices, following):
+                halfedge[u][v] = fkey
+                if u not in halfedge[v]:
+                    halfedge[v][u] = None
+        self._max_face = max_face
+        self._revision += 1
+
     # --------------------------------------------------------------------------
     # modifiers
     # --------------------------------------------------------------------------
@@ -549,6 +704,7 @@ class HalfEdge(Datastructure):
                         del self.edgedata[edge]
         del self.halfedge[key]
         del self.vertex[key]
+        self._revision += 1
 
     def delete_face(self, fkey):
         """Delete a face from the mesh object.
@@ -579,6 +735,7 @@ class HalfEdge(Datastructure):
         del self.face[fkey]
         if fkey in self.facedata:
             del self.facedata[fkey]
+        self._revision += 1
 
     def remove_unused_vertices(self):
         """Remove all unused vertices from the mesh object.
@@ -590,6 +747,7 @@ class HalfEdge(Datastructure):
                 if not self.halfedge[u]:
                     del self.vertex[u]
                     del self.halfedge[u]
+        self._revision += 1
 
     cull_vertices = remove_unused_vertices
 
@@ -1008,6 +1166,7 @@ class HalfEdge(Datastructure):
             raise KeyError(key)
         if value is not None:
             self.vertex[key][name] = value
+            self._revision += 1
             return None
         if name in self.vertex[key]:
             return self.vertex[key][name]
@@ -1037,6 +1196,7 @@ class HalfEdge(Datastructure):
         """
         if name in self.vertex[key]:
             del self.vertex[key][name]
+            self._revision += 1
 
     def vertex_attributes(self, key, names=None, values=None):
         """Get or set multiple attributes of a vertex.
@@ -1070,6 +1230,7 @@ class HalfEdge(Datastructure):
             # use it as a setter
             for name, value in zip(names, values):
                 self.vertex[key][name] = value
+            self._revision += 1
             return
         # use it as a getter
         if not names:
@@ -1151,6 +1312,12 @@ class HalfEdge(Datastructure):
             for key in keys:
                 self.vertex_attributes(key, names, values)
             return
+        if self._compact and names and all(name in ('x', 'y', 'z') for name in names):
+            return self.vertex.coordinates(keys, names, self.default_vertex_attributes)
+        if names and not self._compact:
+            vertex = self.vertex
+            defaults = [(name, self.default_vertex_attributes.get(name)) for name in names]
+            return [[attr.get(name, default) for name, default in defaults] for attr in (vertex[key] for key in keys)]
         return [self.vertex_attributes(key, names) for key in keys]
 
     def update_default_face_attributes(self, attr_dict=None, **kwattr):
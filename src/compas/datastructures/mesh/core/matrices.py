@@ -2,12 +2,32 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from itertools import chain
+
+from numpy import arange
 from numpy import asarray
-from numpy import zeros
-from numpy import cross
 from numpy import bincount
+from numpy import concatenate
+from numpy import cross
+from numpy import cumsum
+from numpy import diff
+from numpy import einsum
+from numpy import flatnonzero
+from numpy import float64
+from numpy import frombuffer
+from numpy import fromiter
+from numpy import full
+from numpy import intc
+from numpy import maximum
+from numpy import ones
+from numpy import repeat
+from numpy import uint8
+from numpy import unique
+from numpy import where
+from numpy import zeros
 
 from scipy.sparse import coo_matrix
+from scipy.sparse import identity
 from scipy.sparse import spdiags
 
 from compas.geometry import dot_vectors
@@ -15,10 +35,9 @@ from compas.geometry import length_vector
 from compas.geometry import cross_vectors
 
 from compas.numerical import normrow
-from compas.numerical import adjacency_matrix
-from compas.numerical import degree_matrix
 from compas.numerical import connectivity_matrix
-from compas.numerical import face_matrix
+
+from ._compact import EXISTS
 
 
 __all__ = [
@@ -32,6 +51,91 @@ __all__ = [
 ]
 
 
+def _return_matrix(M, rtype):
+    if rtype == 'list':
+        return M.toarray().tolist()
+    if rtype == 'array':
+        return M.toarray()
+    if rtype == 'csr':
+        return M.tocsr()
+    if rtype == 'csc':
+        return M.tocsc()
+    if rtype == 'coo':
+        return M.tocoo()
+    return M
+
+
+def _mesh_arrays(mesh):
+    """Collect the vertex coordinates and the face vertices of a mesh in flat arrays.
+
+    Parameters
+    ----------
+    mesh : compas.datastructures.Mesh
+        Instance of mesh.
+
+    Returns
+    -------
+    tuple
+        The identifiers of the vertices,
+        the identifiers of the faces,
+        the vertex coordinates as an array with one row per vertex,
+        the vertex indices of all face corners, face after face,
+        and the number of corners of every face.
+
+    Notes
+    -----
+    For meshes with compact storage, the arrays are read from the storage buffers without a loop over the elements.
+    """
+    if mesh._compact:
+        flags = frombuffer(mesh.vertex.flags, dtype=uint8)
+        keys = flatnonzero(flags & EXISTS)
+        if ((flags[keys] & 7) == 7).all():
+            xyz = frombuffer(mesh.vertex.xyz, dtype=float64).reshape((-1, 3))[keys]
+        else:
+            xyz = asarray(mesh.vertices_attributes('xyz'), dtype=float).reshape((-1, 3))
+        index = full(len(flags), -1)
+        index[keys] = arange(len(keys))
+        offset = frombuffer(mesh.face.offset, dtype=intc)
+        fkeys = flatnonzero(offset >= 0)
+        sizes = frombuffer(mesh.face.size, dtype=intc)[fkeys].astype(int)
+        starts = cumsum(sizes) - sizes
+        positions = repeat(offset[fkeys] - starts, sizes) + arange(sizes.sum())
+        corners = index[frombuffer(mesh.face.vertices, dtype=intc)[positions]]
+        return keys.tolist(), fkeys.tolist(), xyz, corners, sizes
+    vertices = list(mesh.vertices())
+    faces = list(mesh.faces())
+    xyz = asarray(mesh.vertices_attributes('xyz'), dtype=float).reshape((-1, 3))
+    cycles = [mesh.face_vertices(fkey) for fkey in faces]
+    sizes = fromiter((len(cycle) for cycle in cycles), dtype=int, count=len(cycles))
+    corners = chain.from_iterable(cycles)
+    if vertices != list(range(len(vertices))):
+        key_index = {key: index for index, key in enumerate(vertices)}
+        corners = (key_index[key] for key in corners)
+    corners = fromiter(corners, dtype=int, count=int(sizes.sum()))
+    return vertices, faces, xyz, corners, sizes
+
+
+def _corner_cycles(sizes):
+    """Compute, per face corner, the position of the next and the previous corner of the same face."""
+    ends = cumsum(sizes)
+    starts = ends - sizes
+    total = int(ends[-1]) if len(ends) else 0
+    following = arange(1, total + 1)
+    following[ends - 1] = starts
+    preceding = arange(-1, total - 1)
+    preceding[starts] = ends - 1
+    return following, preceding
+
+
+def _mesh_edges(n, corners, sizes):
+    """Compute the unique, sorted vertex index pairs of the edges of the faces, in both directions."""
+    following, _ = _corner_cycles(sizes)
+    u = concatenate((corners, corners[following]))
+    v = concatenate((corners[following], corners))
+    codes = unique(u * n + v)
+    return codes // n, codes % n
+
+
 def mesh_adjacency_matrix(mesh, rtype='array'):
     """Creates a vertex adjacency matrix from a Mesh datastructure.
 
@@ -58,9 +162,11 @@ def mesh_adjacency_matrix(mesh, rtype='array'):
     <class 'scipy.sparse.csr.csr_matrix'>
 
     """
-    key_index = mesh.key_index()
-    adjacency = [[key_index[nbr] for nbr in mesh.vertex_neighbors(key)] for key in mesh.vertices()]
-    return adjacency_matrix(adjacency, rtype=rtype)
+    vertices, _, _, corners, sizes = _mesh_arrays(mesh)
+    n = len(vertices)
+    rows, cols = _mesh_edges(n, corners, sizes)
+    A = coo_matrix((ones(len(rows)), (rows, cols)), shape=(n, n))
+    return _return_matrix(A, rtype)
 
 
 def mesh_connectivity_matrix(mesh, rtype='array'):
@@ -130,9 +236,12 @@ def mesh_degree_matrix(mesh, rtype='array'):
            3., 2.])
 
     """
-    key_index = mesh.key_index()
-    adjacency = [[key_index[nbr] for nbr in mesh.vertex_neighbors(key)] for key in mesh.vertices()]
-    return degree_matrix(adjacency, rtype=rtype)
+    vertices, _, _, corners, sizes = _mesh_arrays(mesh)
+    n = len(vertices)
+    rows, _ = _mesh_edges(n, corners, sizes)
+    degree = bincount(rows, minlength=n).astype(float)
+    D = coo_matrix((degree, (arange(n), arange(n))), shape=(n, n))
+    return _return_matrix(D, rtype)
 
 
 def mesh_face_matrix(mesh, rtype='array'):
@@ -187,9 +296,10 @@ def mesh_face_matrix(mesh, rtype='array'):
     True
 
     """
-    key_index = {key: index for index, key in enumerate(mesh.vertices())}
-    face_vertices = [[key_index[key] for key in mesh.face_vertices(fkey)] for fkey in mesh.faces()]
-    return face_matrix(face_vertices, rtype=rtype)
+    vertices, faces, _, corners, sizes = _mesh_arrays(mesh)
+    rows = repeat(arange(len(faces)), sizes)
+    F = coo_matrix((ones(len(corners)), (rows, corners)), shape=(len(faces), len(vertices)))
+    return _return_matrix(F, rtype)
 
 
 def mesh_laplacian_matrix(mesh, rtype='csr'):
@@ -248,34 +358,15 @@ def mesh_laplacian_matrix(mesh, rtype='csr'):
         `Laplacian Mesh Optimization <https://igl.ethz.ch/projects/Laplacian-mesh-processing/Laplacian-mesh-optimization/lmo.pdf>`_.
 
     """
-    data, rows, cols = [], [], []
-    key_index = mesh.key_index()
-
-    for key in mesh.vertices():
-        i = key_index[key]
-        nbrs = mesh.vertex_neighbors(key)
-        w = len(nbrs)
-        data.append(-1.0)
-        rows.append(i)
-        cols.append(i)
-        d = 1.0 / w
-        for nbr in nbrs:
-            j = key_index[nbr]
-            data.append(d)
-            rows.append(i)
-            cols.append(j)
-
-    L = coo_matrix((data, (rows, cols)))
-
-    if rtype == 'csr':
-        return L.tocsr()
-    if rtype == 'csc':
-        return L.tocsc()
-    if rtype == 'array':
-        return L.toarray()
-    if rtype == 'list':
-        return L.toarray().tolist()
-    return L
+    vertices, _, _, corners, sizes = _mesh_arrays(mesh)
+    n = len(vertices)
+    rows, cols = _mesh_edges(n, corners, sizes)
+    degree = bincount(rows, minlength=n)
+    rows = concatenate((arange(n), rows))
+    cols = concatenate((arange(n), cols))
+    data = concatenate((full(n, -1.0), 1.0 / degree[rows[n:]]))
+    L = coo_matrix((data, (rows, cols)), shape=(n, n))
+    return _return_matrix(L, rtype)
 
 
 def trimesh_edge_cotangent(mesh, u, v):
@@ -388,44 +479,28 @@ def trimesh_cotangent_laplacian_matrix(mesh, rtype='csr'):
         `Laplacian Mesh Optimization <https://igl.ethz.ch/projects/Laplacian-mesh-processing/Laplacian-mesh-optimization/lmo.pdf>`_.
 
     """
-    key_index = mesh.key_index()
-    n = mesh.number_of_vertices()
-    data = []
-    rows = []
-    cols = []
-
-    for key in mesh.vertices():
-        nbrs = mesh.vertex_neighbors(key)
-        i = key_index[key]
-        data.append(-1.0)
-        rows.append(i)
-        cols.append(i)
-
-        W = 0
-        for nbr in nbrs:
-            a, b = trimesh_edge_cotangents(mesh, key, nbr)
-            w = a + b
-            W += w
-
-        for nbr in nbrs:
-            j = key_index[nbr]
-            a, b = trimesh_edge_cotangents(mesh, key, nbr)
-            w = a + b
-            data.append(w / W)
-            rows.append(i)
-            cols.append(j)
-
-    L = coo_matrix((data, (rows, cols)), shape=(n, n))
-
-    if rtype == 'csr':
-        return L.tocsr()
-    if rtype == 'csc':
-        return L.tocsc()
-    if rtype == 'array':
-        return L.toarray()
-    if rtype == 'list':
-        return L.toarray().tolist()
-    return L
+    vertices, _, xyz, corners, sizes = _mesh_arrays(mesh)
+    n = len(vertices)
+    following, preceding = _corner_cycles(sizes)
+    # the cotangent of the angle opposite every halfedge (u, v) of every face,
+    # at the vertex w preceding u
+    u = corners
+    v = corners[following]
+    points = xyz[corners]
+    edges = points[following] - points
+    wu = edges[preceding]
+    wv = wu + edges
+    dot = einsum('ij,ij->i', wu, wv)
+    # the length of the cross product, from |a x b|^2 = |a|^2 |b|^2 - (a . b)^2
+    length = maximum(einsum('ij,ij->i', wu, wu) * einsum('ij,ij->i', wv, wv) - dot ** 2, 0.0) ** 0.5
+    cotangent = where(length > 0, dot / where(length > 0, length, 1.0), 0.0)
+    # the weight of an edge is the sum of the cotangents of the halfedges in both directions
+    # duplicate entries are summed by the conversion to CSR format
+    W = coo_matrix((concatenate((cotangent, cotangent)), (concatenate((u, v)), concatenate((v, u)))), shape=(n, n)).tocsr()
+    total = bincount(repeat(arange(n), diff(W.indptr)), weights=W.data, minlength=n)
+    W.data /= repeat(total, diff(W.indptr))
+    L = W - identity(n, format='csr')
+    return _return_matrix(L, rtype)
 
 
 def trimesh_positive_cotangent_laplacian_matrix(mesh):
@@ -475,9 +550,8 @@ def trimesh_vertexarea_matrix(mesh):
         plotter.show()
 
     """
-    key_index = mesh.key_index()
-    xyz = asarray(mesh.vertices_attributes('xyz'), dtype=float)
-    tris = asarray([[key_index[key] for key in mesh.face_vertices(fkey)] for fkey in mesh.faces()], dtype=int)
+    _, _, xyz, corners, _ = _mesh_arrays(mesh)
+    tris = corners.reshape((-1, 3))
     e1 = xyz[tris[:, 1]] - xyz[tris[:, 0]]
     e2 = xyz[tris[:, 2]] - xyz[tris[:, 0]]
     n = cross(e1, e2)
@@ -6,6 +6,8 @@ import collections
 import sys
 from math import pi
 
+from compas import IPY
+
 from .halfedge import HalfEdge
 
 from compas.files import OBJ
@@ -37,6 +39,9 @@ from compas.utilities import geometric_key
 from compas.utilities import pairwise
 from compas.utilities import window
 
+if not IPY:
+    from ._halfedge_numpy import halfedge_build_numpy
+
 
 __all__ = ['BaseMesh']
 
@@ -73,8 +78,8 @@ class BaseMesh(HalfEdge):
 
     """
 
-    def __init__(self):
-        super(BaseMesh, self).__init__()
+    def __init__(self, compact=False):
+        super(BaseMesh, self).__init__(compact=compact)
         self.attributes.update({'name': 'Mesh'})
         self.default_vertex_attributes.update({'x': 0.0, 'y': 0.0, 'z': 0.0})
 
@@ -365,7 +370,7 @@ class BaseMesh(HalfEdge):
         raise NotImplementedError
 
     @classmethod
-    def from_vertices_and_faces(cls, vertices, faces):
+    def from_vertices_and_faces(cls, vertices, faces, compact=False):
         """Construct a mesh object from a list of vertices and faces.
 
         Parameters
@@ -376,36 +381,53 @@ class BaseMesh(HalfEdge):
         faces : list, dict
             A list of faces, represented by a list of indices referencing the list of vertex coordinates,
             or a dictionary of face keys pointing to a list of indices referencing the list of vertex coordinates.
+        compact : bool, optional
+            If ``True``, construct a mesh with array-backed storage.
+            Default is ``False``.
 
         Returns
         -------
         Mesh
             A mesh object.
 
+        Notes
+        -----
+        The vertices and faces can also be provided as NumPy arrays.
+        The mesh is built in bulk, which is considerably faster than adding
+        the vertices and faces one by one with :meth:`add_vertex` and :meth:`add_face`.
+
         Examples
         --------
         >>>
         """
-        mesh = cls()
+        mesh = cls(compact=True) if compact else cls()
 
         if sys.version_info[0] < 3:
             mapping = collections.Mapping
         else:
             mapping = collections.abc.Mapping
 
+        if not isinstance(vertices, mapping) and not isinstance(faces, mapping):
+            vertices = vertices.tolist() if hasattr(vertices, 'tolist') else list(vertices)
+            if not hasattr(faces, 'tolist'):
+                faces = list(faces)
+            if not IPY and halfedge_build_numpy(mesh, vertices, faces):
+                return mesh
+
+        if hasattr(vertices, 'tolist'):
+            vertices = vertices.tolist()
+        if hasattr(faces, 'tolist'):
+            faces = faces.tolist()
+
         if isinstance(vertices, mapping):
-            for key, xyz in vertices.items():
-                mesh.add_vertex(key=key, attr_dict={i: j for i, j in zip(['x', 'y', 'z'], xyz)})
+            mesh._add_vertices((key, dict(zip('xyz', xyz))) for key, xyz in vertices.items())
         else:
-            for x, y, z in iter(vertices):
-                mesh.add_vertex(x=x, y=y, z=z)
+            mesh._add_vertices((None, {'x': x, 'y': y, 'z': z}) for x, y, z in iter(vertices))
 
         if isinstance(faces, mapping):
-            for fkey, vertices in faces.items():
-                mesh.add_face(vertices, fkey)
+            mesh._add_faces((fkey, vertices, {}) for fkey, vertices in faces.items())
         else:
-            for face in iter(faces):
-                mesh.add_face(face)
+            mesh._add_faces((None, face, {}) for face in iter(faces))
 
         return mesh
 
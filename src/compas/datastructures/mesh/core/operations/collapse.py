@@ -125,6 +125,7 @@ def mesh_collapse_edge(mesh, u, v, t=0.5, allow_boundary=False, fixed=None):
     mesh.vertex[u]['x'] = x
     mesh.vertex[u]['y'] = y
     mesh.vertex[u]['z'] = z
+    mesh._revision += 1
 
     # UV face
     fkey = mesh.halfedge[u][v]
@@ -195,6 +196,8 @@ def mesh_collapse_edge(mesh, u, v, t=0.5, allow_boundary=False, fixed=None):
             face = mesh.face[fkey]
             a = mesh.face_vertex_ancestor(fkey, v)
             face[face.index(v)] = u
+            mesh.face[fkey] = face
+            mesh._revision += 1
 
             if v in mesh.halfedge[a]:
                 del mesh.halfedge[a][v]
@@ -292,6 +295,7 @@ def trimesh_collapse_edge(mesh, u, v, t=0.5, allow_boundary=False, fixed=None):
     mesh.vertex[u]['x'] = x
     mesh.vertex[u]['y'] = y
     mesh.vertex[u]['z'] = z
+    mesh._revision += 1
 
     # UV face
     fkey = mesh.halfedge[u][v]
@@ -344,6 +348,7 @@ def trimesh_collapse_edge(mesh, u, v, t=0.5, allow_boundary=False, fixed=None):
             face = mesh.face[fkey]
             a = face[face.index(v) - 1]
             mesh.face[fkey] = [a, u, nbr]
+            mesh._revision += 1
 
             if v in mesh.halfedge[a]:
                 del mesh.halfedge[a][v]
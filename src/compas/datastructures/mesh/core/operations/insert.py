@@ -54,6 +54,8 @@ def mesh_add_vertex_to_face_edge(mesh, key, fkey, v):
     i = vertices.index(v)
     u = vertices[i - 1]
     vertices.insert(key, i - 1)
+    mesh.face[fkey] = vertices
+    mesh._revision += 1
     mesh.halfedge[u][key] = fkey
     mesh.halfedge[key][v] = fkey
     if u not in mesh.halfedge[key]:
@@ -65,8 +65,10 @@ def mesh_split_edge(mesh, u, v, t=0.5, allow_boundary=False):
 
     # update the UV face if it is not the `None` face
     if fkey_uv is not None:
-        j = mesh.face[fkey_uv].index(v)
-        mesh.face[fkey_uv].insert(j, w)
+        vertices = mesh.face[fkey_uv]
+        vertices.insert(vertices.index(v), w)
+        mesh.face[fkey_uv] = vertices
+        mesh._revision += 1
 
     # split half-edge VU
     mesh.halfedge[v][w] = fkey_vu
@@ -75,8 +77,10 @@ def mesh_split_edge(mesh, u, v, t=0.5, allow_boundary=False):
 
     # update the VU face if it is not the `None` face
     if fkey_vu is not None:
-        i = mesh.face[fkey_vu].index(u)
-        mesh.face[fkey_vu].insert(i, w)
+        vertices = mesh.face[fkey_vu]
+        vertices.insert(vertices.index(u), w)
+        mesh.face[fkey_vu] = vertices
+        mesh._revision += 1
 
     return w
 
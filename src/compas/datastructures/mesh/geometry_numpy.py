@@ -0,0 +1,266 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from numpy import add
+from numpy import arange
+from numpy import cross
+from numpy import cumsum
+from numpy import einsum
+from numpy import repeat
+from numpy import where
+from numpy import zeros
+from numpy.linalg import norm
+
+from compas.datastructures.mesh.core.matrices import _corner_cycles
+from compas.datastructures.mesh.core.matrices import _mesh_arrays
+
+
+__all__ = [
+    'MeshGeometryCache',
+    'mesh_geometry_cache',
+]
+
+
+class MeshGeometryCache(object):
+    """Vectorised computation and caching of the geometric properties of the vertices and faces of a mesh.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh`
+        The mesh.
+
+    Attributes
+    ----------
+    vertices : list
+        The identifiers of the vertices, in the order of the rows of the vertex arrays.
+    faces : list
+        The identifiers of the faces, in the order of the rows of the face arrays.
+    vertex_index : dict
+        The row of every vertex.
+    face_index : dict
+        The row of every face.
+    xyz : array
+        The vertex coordinates.
+
+    Notes
+    -----
+    The methods of the mesh that add or delete vertices or faces, or set vertex attributes,
+    and the mesh algorithms of :mod:`compas.datastructures` that modify a mesh in place,
+    such as the smoothing and planarisation functions,
+    increment a modification counter of the mesh.
+    Every request for a geometric property compares this counter with its value at the previous request.
+    If it has changed, all cached values are discarded and recomputed on demand.
+    Modifications that bypass the methods of the mesh, such as ``mesh.vertex[key]['x'] = x``,
+    are not detected, and require an explicit call to :meth:`invalidate`.
+
+    The values are the same as the values returned by
+    :meth:`Mesh.face_normal`, :meth:`Mesh.face_area`, :meth:`Mesh.face_centroid`,
+    :meth:`Mesh.vertex_normal` and :meth:`Mesh.vertex_area`, up to floating point round-off,
+    for meshes in which every halfedge belongs to at most one face.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Mesh
+    >>> mesh = Mesh.from_polyhedron(6)
+    >>> cache = mesh.geometry_cache()
+    >>> areas = cache.face_areas()
+    >>> abs(areas[cache.face_index[0]] - mesh.face_area(0)) < 1e-12
+    True
+
+    """
+
+    def __init__(self, mesh):
+        self.mesh = mesh
+        self._state = None
+        self._values = {}
+
+    @property
+    def vertices(self):
+        self._update()
+        return self._vertices
+
+    @property
+    def faces(self):
+        self._update()
+        return self._faces
+
+    @property
+    def vertex_index(self):
+        self._update()
+        return self._vertex_index
+
+    @property
+    def face_index(self):
+        self._update()
+        return self._face_index
+
+    @property
+    def xyz(self):
+        self._update()
+        return self._xyz
+
+    def invalidate(self):
+        """Discard all cached values.
+
+        This is only necessary after modifications of the mesh that bypass its methods,
+        such as writing directly to ``mesh.vertex`` or ``mesh.face``.
+        """
+        self._state = None
+
+    def _update(self):
+        state = self.mesh._revision
+        if state == self._state:
+            return
+        mesh = self.mesh
+        self._state = state
+        self._values = {}
+        self._vertices, self._faces, self._xyz, corners, sizes = _mesh_arrays(mesh)
+        self._vertex_index = {key: index for index, key in enumerate(self._vertices)}
+        self._face_index = {fkey: index for index, fkey in enumerate(self._faces)}
+        following, _ = _corner_cycles(sizes)
+        ends = cumsum(sizes)
+        # per corner, its vertex, the next vertex of the face, and its face
+        self._corners = corners
+        self._following = corners[following]
+        self._face = repeat(arange(len(self._faces)), sizes)
+        self._sizes = sizes
+        self._starts = ends - sizes
+
+    def _cached(self, name, compute):
+        self._update()
+        if name not in self._values:
+            self._values[name] = compute()
+        return self._values[name]
+
+    def _face_sum(self, values):
+        result = zeros((len(self._faces),) + values.shape[1:])
+        if len(values):
+            result[:] = add.reduceat(values, self._starts, axis=0)
+        return result
+
+    def _triangles(self):
+        # the cross products of the triangles between the face centroid and every face edge
+        def compute():
+            c = self.face_centroids()[self._face]
+            a = self._xyz[self._corners] - c
+            b = self._xyz[self._following] - c
+            return cross(a, b)
+        return self._cached('triangles', compute)
+
+    def face_centroids(self):
+        """Compute the centroids of all faces.
+
+        Returns
+        -------
+        array
+            The centroid of every face.
+        """
+        def compute():
+            return self._face_sum(self._xyz[self._corners]) / self._sizes[:, None]
+        return self._cached('face_centroids', compute)
+
+    def face_normals(self, unitized=True):
+        """Compute the normals of all faces.
+
+        Parameters
+        ----------
+        unitized : bool, optional
+            Unitize the normal vectors.
+            Default is ``True``.
+
+        Returns
+        -------
+        array
+            The normal vector of every face.
+        """
+        def compute():
+            return self._face_sum(self._triangles())
+
+        def unitize():
+            normals = self.face_normals(unitized=False)
+            lengths = norm(normals, axis=1)
+            return normals / where(lengths > 0, lengths, 1.0)[:, None]
+
+        if unitized:
+            return self._cached('face_normals', unitize)
+        return self._cached('face_normals_raw', compute)
+
+    def face_areas(self):
+        """Compute the areas of all faces.
+
+        Returns
+        -------
+        array
+            The area of every face.
+
+        Notes
+        -----
+        As in :func:`compas.geometry.area_polygon`, the area is the sum of the areas
+        of the triangles between the face centroid and the face edges,
+        with triangles that are oriented opposite to the triangle of the first corner counting negatively.
+        """
+        def compute():
+            n = self._triangles()
+            if not len(n):
+                return zeros(0)
+            n0 = n[self._starts][self._face]
+            signs = where(einsum('ij,ij->i', n, n0) > 0, 1.0, -1.0)
+            signs[self._starts] = 1.0
+            return 0.5 * self._face_sum(signs * norm(n, axis=1))
+        return self._cached('face_areas', compute)
+
+    def vertex_normals(self):
+        """Compute the normals of all vertices,
+        as the normalised sum of the normals of the connected faces.
+
+        Returns
+        -------
+        array
+            The normal vector of every vertex.
+        """
+        def compute():
+            normals = zeros((len(self._vertices), 3))
+            add.at(normals, self._corners, self.face_normals(unitized=False)[self._face])
+            lengths = norm(normals, axis=1)
+            return normals / where(lengths > 0, lengths, 1.0)[:, None]
+        return self._cached('vertex_normals', compute)
+
+    def vertex_areas(self):
+        """Compute the tributary areas of all vertices.
+
+        Returns
+        -------
+        array
+            The tributary area of every vertex.
+        """
+        def compute():
+            c = self.face_centroids()[self._face]
+            a = self._xyz[self._corners]
+            b = self._xyz[self._following]
+            areas = zeros(len(self._vertices))
+            add.at(areas, self._corners, norm(cross(b - a, c - a), axis=1))
+            add.at(areas, self._following, norm(cross(a - b, c - b), axis=1))
+            return 0.25 * areas
+        return self._cached('vertex_areas', compute)
+
+
+def mesh_geometry_cache(mesh):
+    """Get the geometry cache of a mesh.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh`
+        The mesh.
+
+    Returns
+    -------
+    :class:`MeshGeometryCache`
+        The geometry cache of the mesh.
+        The same cache is returned for every call on the same mesh.
+
+    """
+    cache = getattr(mesh, '_geometry_cache', None)
+    if cache is None:
+        cache = mesh._geometry_cache = MeshGeometryCache(mesh)
+    return cache
@@ -2,8 +2,11 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+from math import floor
+
+import compas
+
 from compas.utilities import pairwise
-from compas.utilities import geometric_key
 
 __all__ = [
     'mesh_weld',
@@ -12,7 +15,81 @@ __all__ = [
 ]
 
 
-def mesh_weld(mesh, precision=None, cls=None):
+def _precision_tolerance(precision):
+    """Convert a precision specification for geometric keys to a welding tolerance."""
+    if not precision:
+        precision = compas.PRECISION
+    if precision == 'd':
+        return 1.0
+    return 10 ** -int(precision.rstrip('f'))
+
+
+def _weld_points(points, tolerance):
+    """Cluster points that are within a tolerance distance of each other.
+
+    Parameters
+    ----------
+    points : list
+        The XYZ coordinates of the points.
+    tolerance : float
+        The welding tolerance.
+
+    Returns
+    -------
+    tuple
+        For every point the index of its cluster,
+        and for every cluster the index of its first point.
+        Clusters are numbered in order of their first point.
+
+    Notes
+    -----
+    Points are merged if they are within ``tolerance`` distance of each other,
+    and clusters are formed by merging transitively.
+    Candidates are found in a spatial hash with a cell size equal to the tolerance,
+    by checking the cell of every point and the neighbouring cells.
+
+    """
+    parent = []
+    first = {}
+    for index, xyz in enumerate(points):
+        parent.append(first.setdefault(tuple(xyz), index))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    if tolerance > 0:
+        tolerance2 = tolerance ** 2
+        offsets = [(i, j, k) for i in (-1, 0, 1) for j in (-1, 0, 1) for k in (-1, 0, 1)]
+        grid = {}
+        for (x, y, z), u in first.items():
+            a, b, c = int(floor(x / tolerance)), int(floor(y / tolerance)), int(floor(z / tolerance))
+            for i, j, k in offsets:
+                for v, (vx, vy, vz) in grid.get((a + i, b + j, c + k), ()):
+                    if (x - vx) ** 2 + (y - vy) ** 2 + (z - vz) ** 2 <= tolerance2:
+                        ru = find(u)
+                        rv = find(v)
+                        if ru < rv:
+                            parent[rv] = ru
+                        elif rv < ru:
+                            parent[ru] = rv
+            grid.setdefault((a, b, c), []).append((u, (x, y, z)))
+
+    cluster = {}
+    firsts = []
+    indices = []
+    for index in range(len(parent)):
+        root = find(index)
+        if root not in cluster:
+            cluster[root] = len(firsts)
+            firsts.append(root)
+        indices.append(cluster[root])
+    return indices, firsts
+
+
+def mesh_weld(mesh, precision=None, cls=None, tolerance=None):
     """Weld vertices of a mesh within some precision distance.
 
     Parameters
@@ -20,28 +97,50 @@ def mesh_weld(mesh, precision=None, cls=None):
     mesh : Mesh
         A mesh.
     precision: str (None)
-        Tolerance distance for welding.
+        Tolerance distance for welding,
+        as a precision specification for geometric keys.
+        For example, ``'3f'`` corresponds to a tolerance of ``0.001``.
+        Defaults to ``compas.PRECISION``.
     cls : type (None)
         Type of the welded mesh.
         This defaults to the type of the first mesh in the list.
+    tolerance : float (None)
+        Tolerance distance for welding.
+        If provided, this takes precedence over ``precision``.
 
     Returns
     -------
     mesh
         The welded mesh.
 
+    Notes
+    -----
+    Vertices within tolerance distance of each other are merged, transitively.
+    A welded vertex takes the coordinates of the first of the original vertices.
+    Faces are cleaned up by removing consecutive duplicate vertices,
+    and faces with less than three vertices are removed.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Mesh
+    >>> vertices = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [1.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.00001, 0.0, 0.0]]
+    >>> mesh = Mesh.from_vertices_and_faces(vertices, [[0, 1, 2], [3, 4, 5]])
+    >>> mesh = mesh_weld(mesh, tolerance=0.001)
+    >>> mesh.number_of_vertices()
+    4
+
     """
     if cls is None:
         cls = type(mesh)
+    if tolerance is None:
+        tolerance = _precision_tolerance(precision)
 
-    geo = geometric_key
-
-    key_xyz = {key: mesh.vertex_coordinates(key) for key in mesh.vertices()}
-    gkey_key = {geo(xyz, precision): key for key, xyz in key_xyz.items()}
-    gkey_index = {gkey: index for index, gkey in enumerate(gkey_key)}
+    key_index = mesh.key_index()
+    xyz = mesh.vertices_attributes('xyz')
+    indices, firsts = _weld_points(xyz, tolerance)
 
-    vertices = [key_xyz[key] for gkey, key in gkey_key.items()]
-    faces = [[gkey_index[geo(key_xyz[key], precision)] for key in mesh.face_vertices(fkey)] for fkey in mesh.faces()]
+    vertices = [xyz[index] for index in firsts]
+    faces = [[indices[key_index[key]] for key in mesh.face_vertices(fkey)] for fkey in mesh.faces()]
 
     faces[:] = [[u for u, v in pairwise(face + face[:1]) if u != v] for face in faces]
     faces[:] = [face for face in faces if len(face) > 2]  # make sure no face has less than 3 vertices
@@ -95,7 +194,7 @@ def meshes_join(meshes, cls=None):
     return cls.from_vertices_and_faces(vertices, faces)
 
 
-def meshes_join_and_weld(meshes, precision=None, cls=None):
+def meshes_join_and_weld(meshes, precision=None, cls=None, tolerance=None):
     """Join and and weld meshes within some precision distance.
 
     Parameters
@@ -103,7 +202,14 @@ def meshes_join_and_weld(meshes, precision=None, cls=None):
     meshes : list
         A list of meshes.
     precision: str
+        Tolerance distance for welding,
+        as a precision specification for geometric keys.
+    cls : type (None)
+        The type of the joined mesh.
+        This defaults to the type of the first mesh in the list.
+    tolerance : float (None)
         Tolerance distance for welding.
+        If provided, this takes precedence over ``precision``.
 
     Returns
     -------
@@ -111,7 +217,7 @@ def meshes_join_and_weld(meshes, precision=None, cls=None):
         The joined and welded mesh.
 
     """
-    return mesh_weld(meshes_join(meshes, cls=cls), precision=precision)
+    return mesh_weld(meshes_join(meshes, cls=cls), precision=precision, tolerance=tolerance)
 
 
 # ==============================================================================
@@ -0,0 +1,195 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from numpy import arange
+from numpy import argsort
+from numpy import array
+from numpy import asarray
+from numpy import concatenate
+from numpy import cumsum
+from numpy import flatnonzero
+from numpy import floor
+from numpy import full
+from numpy import int64
+from numpy import minimum
+from numpy import ones
+from numpy import repeat
+from numpy import searchsorted
+from numpy import unique
+from numpy import zeros
+
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+from compas.utilities import pairwise
+
+from compas.datastructures.mesh.join import _precision_tolerance
+from compas.datastructures.mesh.join import _weld_points
+from compas.datastructures.mesh.join import meshes_join
+
+
+__all__ = [
+    'mesh_weld_numpy',
+    'meshes_join_and_weld_numpy',
+]
+
+
+# the forward half of the 27 cells around a cell, including the cell itself
+OFFSETS = [(i, j, k) for i in (-1, 0, 1) for j in (-1, 0, 1) for k in (-1, 0, 1) if (i, j, k) >= (0, 0, 0)]
+
+
+def _close_pairs(points, tolerance):
+    # all pairs of points within tolerance distance of each other,
+    # found by comparing the points of every cell of a uniform grid
+    # with the points of the same cell and the neighbouring cells
+    cells = floor(points / tolerance).astype(int64)
+    cells -= cells.min(axis=0) - 1
+    span = [int(extent) + 2 for extent in cells.max(axis=0)]
+    if span[0] * span[1] * span[2] >= 2 ** 62:
+        return None
+    radix = array([span[1] * span[2], span[2], 1], dtype=int64)
+    code = cells.dot(radix)
+    order = argsort(code, kind='mergesort')
+    code, start, count = unique(code[order], return_index=True, return_counts=True)
+    points = points[order]
+    rows = []
+    cols = []
+    for offset in OFFSETS:
+        shift = int(array(offset).dot(radix))
+        a = arange(len(code))
+        b = searchsorted(code, code + shift)
+        found = b < len(code)
+        found[found] = code[b[found]] == code[found] + shift
+        a = a[found]
+        b = b[found]
+        if not len(a):
+            continue
+        sizes = count[a] * count[b]
+        pair = repeat(arange(len(a)), sizes)
+        local = arange(sizes.sum()) - repeat(cumsum(sizes) - sizes, sizes)
+        i = start[a][pair] + local // count[b][pair]
+        j = start[b][pair] + local % count[b][pair]
+        if shift == 0:
+            keep = i < j
+            i = i[keep]
+            j = j[keep]
+        close = ((points[i] - points[j]) ** 2).sum(axis=1) <= tolerance ** 2
+        rows.append(order[i[close]])
+        cols.append(order[j[close]])
+    if not rows:
+        return zeros(0, dtype=int64), zeros(0, dtype=int64)
+    return concatenate(rows), concatenate(cols)
+
+
+def _weld_points_numpy(xyz, tolerance):
+    """Vectorised equivalent of :func:`compas.datastructures.mesh.join._weld_points`."""
+    # adding zero turns negative zeros into zeros
+    xyz = asarray(xyz, dtype=float).reshape((-1, 3)) + 0.0
+    n = len(xyz)
+    # exact duplicates
+    points, first, inverse = unique(xyz, axis=0, return_index=True, return_inverse=True)
+    inverse = inverse.ravel()
+    m = len(points)
+    labels = arange(m)
+    if tolerance > 0 and m > 1:
+        pairs = _close_pairs(points, tolerance)
+        if pairs is None:
+            indices, firsts = _weld_points(xyz.tolist(), tolerance)
+            return asarray(indices), asarray(firsts)
+        i, j = pairs
+        graph = coo_matrix((ones(len(i)), (i, j)), shape=(m, m))
+        _, labels = connected_components(graph, directed=False)
+    # the first point of every cluster
+    root = full(labels.max() + 1, n)
+    minimum.at(root, labels, first)
+    root = root[labels[inverse]]
+    # number the clusters in order of their first point
+    firsts = flatnonzero(root == arange(n))
+    number = zeros(n, dtype=int64)
+    number[firsts] = arange(len(firsts))
+    return number[root], firsts
+
+
+def mesh_weld_numpy(mesh, precision=None, cls=None, tolerance=None):
+    """Weld vertices of a mesh within some precision distance, using NumPy.
+
+    Parameters
+    ----------
+    mesh : Mesh
+        A mesh.
+    precision: str (None)
+        Tolerance distance for welding,
+        as a precision specification for geometric keys.
+        Defaults to ``compas.PRECISION``.
+    cls : type (None)
+        Type of the welded mesh.
+        This defaults to the type of the mesh.
+    tolerance : float (None)
+        Tolerance distance for welding.
+        If provided, this takes precedence over ``precision``.
+
+    Returns
+    -------
+    mesh
+        The welded mesh.
+
+    Notes
+    -----
+    The result is the same as the result of :func:`compas.datastructures.mesh_weld`.
+    Candidate pairs of vertices are found per cell of a uniform grid with cell size equal to the tolerance,
+    and the clusters of welded vertices are the connected components of the pairs within tolerance distance.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Mesh
+    >>> vertices = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [1.0, 1.0, 0.0], [0.0, 1.0, 0.0], [0.00001, 0.0, 0.0]]
+    >>> mesh = Mesh.from_vertices_and_faces(vertices, [[0, 1, 2], [3, 4, 5]])
+    >>> mesh = mesh_weld_numpy(mesh, tolerance=0.001)
+    >>> mesh.number_of_vertices()
+    4
+
+    """
+    if cls is None:
+        cls = type(mesh)
+    if tolerance is None:
+        tolerance = _precision_tolerance(precision)
+
+    key_index = mesh.key_index()
+    xyz = mesh.vertices_attributes('xyz')
+    indices, firsts = _weld_points_numpy(xyz, tolerance)
+    indices = indices.tolist()
+
+    vertices = [xyz[index] for index in firsts.tolist()]
+    faces = [[indices[key_index[key]] for key in mesh.face_vertices(fkey)] for fkey in mesh.faces()]
+
+    faces[:] = [[u for u, v in pairwise(face + face[:1]) if u != v] for face in faces]
+    faces[:] = [face for face in faces if len(face) > 2]
+
+    return cls.from_vertices_and_faces(vertices, faces)
+
+
+def meshes_join_and_weld_numpy(meshes, precision=None, cls=None, tolerance=None):
+    """Join and and weld meshes within some precision distance, using NumPy.
+
+    Parameters
+    ----------
+    meshes : list
+        A list of meshes.
+    precision: str
+        Tolerance distance for welding,
+        as a precision specification for geometric keys.
+    cls : type (None)
+        The type of the joined mesh.
+        This defaults to the type of the first mesh in the list.
+    tolerance : float (None)
+        Tolerance distance for welding.
+        If provided, this takes precedence over ``precision``.
+
+    Returns
+    -------
+    mesh
+        The joined and welded mesh.
+
+    """
+    return mesh_weld_numpy(meshes_join(meshes, cls=cls), precision=precision, tolerance=tolerance)
@@ -3,6 +3,7 @@ from __future__ import absolute_import
 from __future__ import division
 
 from compas.topology import breadth_first_traverse
+from compas.topology.orientation import _face_adjacency
 
 
 __all__ = [
@@ -12,83 +13,6 @@ __all__ = [
 ]
 
 
-def _mesh_face_adjacency(mesh, nmax=10, radius=10.0):
-    fkey_index = {fkey: index for index, fkey in enumerate(mesh.faces())}
-    index_fkey = {index: fkey for index, fkey in enumerate(mesh.faces())}
-    points = [mesh.face_centroid(fkey) for fkey in mesh.faces()]
-
-    k = min(mesh.number_of_faces(), nmax)
-
-    try:
-        from scipy.spatial import cKDTree
-
-        tree = cKDTree(points)
-        _, closest = tree.query(points, k=k, n_jobs=-1)
-
-    except Exception:
-        # try:
-        #     from Rhino.Geometry import RTree
-        #     from Rhino.Geometry import Sphere
-        #     from Rhino.Geometry import Point3d
-
-        # except Exception:
-        from compas.geometry import KDTree
-
-        tree = KDTree(points)
-        closest = [tree.nearest_neighbors(point, k) for point in points]
-        closest = [[index for xyz, index, d in nnbrs] for nnbrs in closest]
-
-        # else:
-        #     tree = RTree()
-        #     for i, point in enumerate(points):
-        #         tree.Insert(Point3d(* point), i)
-
-        #     def callback(sender, e):
-        #         data = e.Tag
-        #         data.append(e.Id)
-
-        #     closest = []
-        #     for i, point in enumerate(points):
-        #         sphere = Sphere(Point3d(* point), radius)
-        #         data = []
-        #         tree.Search(sphere, callback, data)
-        #         closest.append(data)
-
-    adjacency = {}
-
-    for fkey in mesh.faces():
-        nbrs = []
-        index = fkey_index[fkey]
-        found = set()
-
-        nnbrs = set(closest[index])
-
-        for u, v in mesh.face_halfedges(fkey):
-            for index in nnbrs:
-                nbr = index_fkey[index]
-
-                if nbr == fkey:
-                    continue
-                if nbr in found:
-                    continue
-
-                for a, b in mesh.face_halfedges(nbr):
-                    if v == a and u == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-
-                for a, b in mesh.face_halfedges(nbr):
-                    if u == a and v == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-
-        adjacency[fkey] = nbrs
-
-    return adjacency
-
-
 def mesh_face_adjacency(mesh):
     """Build a face adjacency dict.
 
@@ -105,52 +29,13 @@ def mesh_face_adjacency(mesh):
     Notes
     -----
     This algorithm is used primarily to unify the cycle directions of a given mesh.
-    Therefore, the premise is that the topological information of the mesh is corrupt
-    and cannot be used to construct the adjacency structure. The algorithm is thus
-    purely geometrical, but uses a spatial indexing tree to speed up the search.
+    Therefore, the premise is that the halfedge information of the mesh is corrupt
+    and cannot be used to construct the adjacency structure.
+    Instead, the faces of every (undirected) edge of the face cycles are collected in a dictionary,
+    such that the adjacency is constructed in linear time.
 
     """
-    f = mesh.number_of_faces()
-
-    if f > 100:
-        return _mesh_face_adjacency(mesh)
-
-    adjacency = {}
-    faces = list(mesh.faces())
-
-    for fkey in mesh.faces():
-        # faces = []
-        # for key in mesh.face_vertices(fkey):
-        #     for nbr in mesh.halfedge[key]:
-        #         fnbr = mesh.halfedge[key][nbr]
-        #         if fnbr is not None:
-        #             faces.append(fnbr)
-
-        nbrs = []
-        found = set()
-
-        for u, v in mesh.face_halfedges(fkey):
-            for nbr in faces:
-                if nbr == fkey:
-                    continue
-                if nbr in found:
-                    continue
-
-                for a, b in mesh.face_halfedges(nbr):
-                    if v == a and u == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-
-                for a, b in mesh.face_halfedges(nbr):
-                    if u == a and v == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-
-        adjacency[fkey] = nbrs
-
-    return adjacency
+    return _face_adjacency((fkey, mesh.face_vertices(fkey)) for fkey in mesh.faces())
 
 
 def mesh_unify_cycles(mesh, root=None):
@@ -178,7 +63,8 @@ def mesh_unify_cycles(mesh, root=None):
                     # if the traversal of a neighboring halfedge
                     # is in the same direction
                     # flip the neighbor
-                    mesh.face[nbr][:] = mesh.face[nbr][::-1]
+                    mesh.face[nbr] = mesh.face[nbr][::-1]
+                    mesh._revision += 1
                     return
 
     if root is None:
@@ -190,7 +76,8 @@ def mesh_unify_cycles(mesh, root=None):
 
     assert len(list(visited)) == mesh.number_of_faces(), 'Not all faces were visited'
 
-    mesh.halfedge = {key: {} for key in mesh.vertices()}
+    for key in mesh.vertices():
+        mesh.halfedge[key] = {}
     for fkey in mesh.faces():
         for u, v in mesh.face_halfedges(fkey):
             mesh.halfedge[u][v] = fkey
@@ -212,9 +99,11 @@ def mesh_flip_cycles(mesh):
     just reverses whatever direction it finds.
 
     """
-    mesh.halfedge = {key: {} for key in mesh.vertices()}
+    for key in mesh.vertices():
+        mesh.halfedge[key] = {}
     for fkey in mesh.faces():
-        mesh.face[fkey][:] = mesh.face[fkey][::-1]
+        mesh.face[fkey] = mesh.face[fkey][::-1]
+        mesh._revision += 1
         for u, v in mesh.face_halfedges(fkey):
             mesh.halfedge[u][v] = fkey
             if u not in mesh.halfedge[v]:
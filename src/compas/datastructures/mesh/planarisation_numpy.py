@@ -114,6 +114,8 @@ def mesh_planarize_faces(mesh, fixed=None, kmax=100, callback=None, callback_arg
             attr['y'] = y
             attr['z'] = z
 
+        mesh._revision += 1
+
         if callback:
             callback(k, callback_args)
 
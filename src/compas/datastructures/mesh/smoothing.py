@@ -63,6 +63,8 @@ def mesh_smooth_centroid(mesh, fixed=None, kmax=100, damping=0.5, callback=None,
             attr['y'] += damping * (cy - y)
             attr['z'] += damping * (cz - z)
 
+        mesh._revision += 1
+
         if callback:
             callback(k, callback_args)
 
@@ -117,6 +119,8 @@ def mesh_smooth_centerofmass(mesh, fixed=None, kmax=100, damping=0.5, callback=N
             attr['y'] += damping * (cy - y)
             attr['z'] += damping * (cz - z)
 
+        mesh._revision += 1
+
         if callback:
             callback(k, callback_args)
 
@@ -190,6 +194,8 @@ def mesh_smooth_area(mesh, fixed=None, kmax=100, damping=0.5, callback=None, cal
             attr['y'] += damping * (ay - y)
             attr['z'] += damping * (az - z)
 
+        mesh._revision += 1
+
         if callback:
             callback(k, callback_args)
 
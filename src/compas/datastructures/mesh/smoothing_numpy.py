@@ -30,6 +30,7 @@ def trimesh_smooth_laplacian_cotangent(trimesh, fixed, kmax=10):
             attr['x'] = V[key][0]
             attr['y'] = V[key][1]
             attr['z'] = V[key][2]
+        trimesh._revision += 1
 
 
 # =============================================================================
@@ -4,7 +4,6 @@ from __future__ import division
 
 from math import cos
 from math import pi
-from copy import deepcopy
 
 from compas.geometry import centroid_points
 from compas.geometry import offset_polygon
@@ -28,15 +27,7 @@ __all__ = [
 
 
 def mesh_fast_copy(other):
-    subd = SubdMesh()
-    subd.vertex = deepcopy(other.vertex)
-    subd.face = deepcopy(other.face)
-    # subd.edgedata = deepcopy(other.edgedata)
-    subd.facedata = deepcopy(other.facedata)
-    subd.halfedge = deepcopy(other.halfedge)
-    subd._max_vertex = other._max_vertex
-    subd._max_face = other._max_face
-    return subd
+    return other.copy(cls=SubdMesh)
 
 
 class SubdMesh(BaseMesh):
@@ -201,7 +192,7 @@ def mesh_subdivide_quad(mesh, k=1):
     cls = type(mesh)
     subd = mesh_fast_copy(mesh)
     for face in subd.faces():
-        subd.facedata[face]['path'] = [face]
+        subd.facedata.setdefault(face, {})['path'] = [face]
     for _ in range(k):
         faces = {face: subd.face_vertices(face)[:] for face in subd.faces()}
         face_centroid = {face: subd.face_centroid(face) for face in subd.faces()}
@@ -376,6 +367,7 @@ def mesh_subdivide_catmullclark(mesh, k=1, fixed=None):
             subd.vertex[w]['x'] = x
             subd.vertex[w]['y'] = y
             subd.vertex[w]['z'] = z
+        subd._revision += 1
 
         # move each vertex to the weighted average of itself, the neighboring
         # centroids and the neighboring mipoints
@@ -410,6 +402,7 @@ def mesh_subdivide_catmullclark(mesh, k=1, fixed=None):
             subd.vertex[key]['x'] = x
             subd.vertex[key]['y'] = y
             subd.vertex[key]['z'] = z
+        subd._revision += 1
 
         mesh = subd
 
@@ -689,6 +682,7 @@ def trimesh_subdivide_loop(mesh, k=1, fixed=None):
             subd.vertex[key]['x'] = x
             subd.vertex[key]['y'] = y
             subd.vertex[key]['z'] = z
+        subd._revision += 1
 
         edgepoints = {}
 
@@ -714,6 +708,7 @@ def trimesh_subdivide_loop(mesh, k=1, fixed=None):
             subd.vertex[w]['x'] = xyz[0]
             subd.vertex[w]['y'] = xyz[1]
             subd.vertex[w]['z'] = xyz[2]
+        subd._revision += 1
 
         # new faces
         for fkey, vertices in fkey_vertices.items():
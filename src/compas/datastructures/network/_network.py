@@ -10,6 +10,8 @@ from compas.datastructures.network.complementarity import network_complement
 from compas.datastructures.network.transformations import network_transform
 from compas.datastructures.network.transformations import network_transformed
 from compas.datastructures.network.traversal import network_shortest_path
+from compas.datastructures.network.traversal import network_dijkstra_distances
+from compas.datastructures.network.traversal import network_dijkstra_path
 from compas.datastructures.network.smoothing import network_smooth_centroid
 
 
@@ -19,6 +21,8 @@ __all__ = ['Network']
 class Network(BaseNetwork):
 
     complement = network_complement
+    dijkstra_distances = network_dijkstra_distances
+    dijkstra_path = network_dijkstra_path
     is_connected = network_is_connected
     shortest_path = network_shortest_path
     split_edge = network_split_edge
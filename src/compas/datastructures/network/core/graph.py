@@ -10,6 +10,7 @@ from distutils.version import LooseVersion
 import compas
 
 from compas.datastructures.datastructure import Datastructure
+from compas.datastructures.datastructure import _copy_attributes
 from compas.datastructures.attributes import NodeAttributeView
 from compas.datastructures.attributes import EdgeAttributeView
 
@@ -298,6 +299,41 @@ class Graph(Datastructure):
         self.edge = {}
         self.adjacency = {}
 
+    def copy(self, cls=None):
+        """Make an independent copy of the graph.
+
+        Parameters
+        ----------
+        cls : :class:`compas.datastructures.Graph`, optional
+            The type of graph to return.
+            Defaults to the type of the current graph.
+
+        Returns
+        -------
+        :class:`compas.datastructures.Graph`
+            A separate, but identical graph.
+
+        Notes
+        -----
+        The copy is made directly from the internal dictionaries of the graph,
+        without a round trip through its data.
+        Attribute values of immutable types are shared between the graph and the copy.
+
+        """
+        if not cls:
+            cls = type(self)
+        if not issubclass(cls, Graph):
+            return super(Graph, self).copy(cls=cls)
+        other = cls()
+        other.attributes.update(_copy_attributes(self.attributes))
+        other.default_node_attributes.update(_copy_attributes(self.default_node_attributes))
+        other.default_edge_attributes.update(_copy_attributes(self.default_edge_attributes))
+        other.node = {key: _copy_attributes(attr) for key, attr in self.node.items()}
+        other.edge = {u: {v: _copy_attributes(attr) for v, attr in nbrs.items()} for u, nbrs in self.edge.items()}
+        other.adjacency = {u: nbrs.copy() for u, nbrs in self.adjacency.items()}
+        other._max_int_key = self._max_int_key
+        return other
+
     def get_any_node(self):
         """Get the identifier of a random node.
 
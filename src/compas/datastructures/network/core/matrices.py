@@ -2,8 +2,17 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-from compas.numerical import adjacency_matrix
-from compas.numerical import degree_matrix
+from itertools import chain
+
+from numpy import arange
+from numpy import bincount
+from numpy import concatenate
+from numpy import fromiter
+from numpy import ones
+from numpy import unique
+
+from scipy.sparse import coo_matrix
+
 from compas.numerical import connectivity_matrix
 from compas.numerical import laplacian_matrix
 
@@ -30,6 +39,24 @@ def _return_matrix(M, rtype):
     return M
 
 
+def _network_edges(network):
+    # the node indices of the edges, as an array with one row per edge
+    key_index = network.key_index()
+    m = network.number_of_edges()
+    nodes = chain.from_iterable(network.edges())
+    if list(key_index) != list(range(len(key_index))):
+        nodes = (key_index[key] for key in nodes)
+    return fromiter(nodes, dtype=int, count=2 * m).reshape((m, 2))
+
+
+def _network_neighbors(network):
+    # the unique, sorted node index pairs of neighboring nodes
+    n = network.number_of_nodes()
+    edges = _network_edges(network)
+    codes = unique(concatenate((edges[:, 0] * n + edges[:, 1], edges[:, 1] * n + edges[:, 0])))
+    return codes // n, codes % n
+
+
 def network_adjacency_matrix(network, rtype='array'):
     """Creates a node adjacency matrix from a Network datastructure.
 
@@ -46,9 +73,10 @@ def network_adjacency_matrix(network, rtype='array'):
         Constructed adjacency matrix.
 
     """
-    key_index = network.key_index()
-    adjacency = [[key_index[nbr] for nbr in network.neighbors(key)] for key in network.nodes()]
-    return adjacency_matrix(adjacency, rtype=rtype)
+    n = network.number_of_nodes()
+    rows, cols = _network_neighbors(network)
+    A = coo_matrix((ones(len(rows)), (rows, cols)), shape=(n, n))
+    return _return_matrix(A, rtype)
 
 
 def network_degree_matrix(network, rtype='array'):
@@ -67,9 +95,11 @@ def network_degree_matrix(network, rtype='array'):
         Constructed node degree matrix.
 
     """
-    key_index = network.key_index()
-    adjacency = [[key_index[nbr] for nbr in network.neighbors(key)] for key in network.nodes()]
-    return degree_matrix(adjacency, rtype=rtype)
+    n = network.number_of_nodes()
+    rows, _ = _network_neighbors(network)
+    degree = bincount(rows, minlength=n).astype(float)
+    D = coo_matrix((degree, (arange(n), arange(n))), shape=(n, n))
+    return _return_matrix(D, rtype)
 
 
 def network_connectivity_matrix(network, rtype='array'):
@@ -88,9 +118,7 @@ def network_connectivity_matrix(network, rtype='array'):
         Constructed connectivity matrix.
 
     """
-    key_index = network.key_index()
-    edges = [(key_index[u], key_index[v]) for u, v in network.edges()]
-    return connectivity_matrix(edges, rtype=rtype)
+    return connectivity_matrix(_network_edges(network), rtype=rtype)
 
 
 def network_laplacian_matrix(network, normalize=False, rtype='array'):
@@ -121,9 +149,7 @@ def network_laplacian_matrix(network, normalize=False, rtype='array'):
     >>>
 
     """
-    key_index = network.key_index()
-    edges = [(key_index[u], key_index[v]) for u, v in network.edges()]
-    return laplacian_matrix(edges, normalize=normalize, rtype=rtype)
+    return laplacian_matrix(_network_edges(network), normalize=normalize, rtype=rtype)
 
 
 # ==============================================================================
@@ -6,8 +6,6 @@ from math import cos
 from math import sin
 from math import pi
 
-from itertools import product
-
 import compas
 
 from compas.geometry import angle_vectors_xy
@@ -39,6 +37,81 @@ def network_embed_in_plane_proxy(data, fixed=None, straightline=True):
     return network.to_data()
 
 
+def _segment_cells(a, b, size):
+    # the cells of a uniform grid touched by a segment,
+    # column by column, from the part of the segment in every column
+    # the range of rows is slightly expanded,
+    # such that points on the boundary of two cells are found in both
+    (x0, y0), (x1, y1) = sorted((a[:2], b[:2]))
+    eps = 1e-9 * size
+    i0 = int(x0 // size)
+    i1 = int(x1 // size)
+    if i0 == i1:
+        ylo, yhi = min(y0, y1), max(y0, y1)
+        return [(i0, j) for j in range(int((ylo - eps) // size), int((yhi + eps) // size) + 1)]
+    slope = (y1 - y0) / (x1 - x0)
+    cells = []
+    for i in range(i0, i1 + 1):
+        ya = y0 + (max(x0, i * size) - x0) * slope
+        yb = y0 + (min(x1, (i + 1) * size) - x0) * slope
+        ylo, yhi = min(ya, yb), max(ya, yb)
+        for j in range(int((ylo - eps) // size), int((yhi + eps) // size) + 1):
+            cells.append((i, j))
+    return cells
+
+
+def _find_crossings(edges, vertices, first=False):
+    # bucket the edges in a uniform grid,
+    # and only test the pairs of edges that share a grid cell
+    # every edge is added only to the cells it crosses,
+    # such that a few long edges don't fill the grid
+    # pairs of edges that share more than one cell are tested only once
+    edges = list(edges)
+    segments = []
+    boxes = []
+    for u, v in edges:
+        a = vertices[u]
+        b = vertices[v]
+        segments.append((a, b))
+        boxes.append((min(a[0], b[0]), min(a[1], b[1]), max(a[0], b[0]), max(a[1], b[1])))
+    if not boxes:
+        return []
+    size = sum(max(xmax - xmin, ymax - ymin) for xmin, ymin, xmax, ymax in boxes) / len(boxes)
+    if not size > 0:
+        size = 1.0
+    grid = {}
+    multiple = []
+    for index, (a, b) in enumerate(segments):
+        cells = _segment_cells(a, b, size)
+        multiple.append(len(cells) > 1)
+        for cell in cells:
+            grid.setdefault(cell, []).append(index)
+    tested = set()
+    crossings = []
+    for cell in grid.values():
+        for n, e1 in enumerate(cell):
+            u1, v1 = edges[e1]
+            xmin1, ymin1, xmax1, ymax1 = boxes[e1]
+            for e2 in cell[n + 1:]:
+                u2, v2 = edges[e2]
+                if u1 == u2 or v1 == v2 or u1 == v2 or u2 == v1:
+                    continue
+                xmin2, ymin2, xmax2, ymax2 = boxes[e2]
+                if xmin2 > xmax1 or xmin1 > xmax2 or ymin2 > ymax1 or ymin1 > ymax2:
+                    continue
+                if multiple[e1] and multiple[e2]:
+                    pair = (e1, e2) if e1 < e2 else (e2, e1)
+                    if pair in tested:
+                        continue
+                    tested.add(pair)
+                if is_intersection_segment_segment_xy(segments[e1], segments[e2]):
+                    if first:
+                        return [(edges[e1], edges[e2])]
+                    crossings.append((e1, e2) if e1 < e2 else (e2, e1))
+    crossings.sort()
+    return [(edges[e1], edges[e2]) for e1, e2 in crossings]
+
+
 def network_is_crossed(network):
     """Verify if a network has crossing edges.
 
@@ -58,29 +131,12 @@ def network_is_crossed(network):
     This algorithm assumes that the network lies in the XY plane.
 
     """
-    for (u1, v1), (u2, v2) in product(network.edges(), network.edges()):
-        if u1 == u2 or v1 == v2 or u1 == v2 or u2 == v1:
-            continue
-        a = network.node_attributes(u1, 'xy')
-        b = network.node_attributes(v1, 'xy')
-        c = network.node_attributes(u2, 'xy')
-        d = network.node_attributes(v2, 'xy')
-        if is_intersection_segment_segment_xy((a, b), (c, d)):
-            return True
-    return False
+    vertices = {key: network.node_attributes(key, 'xy') for key in network.nodes()}
+    return bool(_find_crossings(network.edges(), vertices, first=True))
 
 
 def _are_edges_crossed(edges, vertices):
-    for (u1, v1), (u2, v2) in product(edges, edges):
-        if u1 == u2 or v1 == v2 or u1 == v2 or u2 == v1:
-            continue
-        a = vertices[u1]
-        b = vertices[v1]
-        c = vertices[u2]
-        d = vertices[v2]
-        if is_intersection_segment_segment_xy((a, b), (c, d)):
-            return True
-    return False
+    return bool(_find_crossings(edges, vertices, first=True))
 
 
 def network_count_crossings(network):
@@ -121,22 +177,14 @@ def network_find_crossings(network):
     -----
     This algorithm assumes that the network lies in the XY plane.
 
+    The edges are bucketed in a uniform grid with a cell size equal to the average size of the edges,
+    and only pairs of edges in the same cell are tested for intersection.
+    For networks with a reasonably uniform distribution of edges,
+    this finds all crossings in roughly linear time in the number of edges and crossings.
+
     """
-    crossings = set()
-    for (u1, v1), (u2, v2) in product(network.edges(), network.edges()):
-        if u1 == u2 or v1 == v2 or u1 == v2 or u2 == v1:
-            continue
-        if ((u1, v1), (u2, v2)) in crossings:
-            continue
-        if ((u2, v2), (u1, v1)) in crossings:
-            continue
-        a = network.node_attributes(u1, 'xy')
-        b = network.node_attributes(v1, 'xy')
-        c = network.node_attributes(u2, 'xy')
-        d = network.node_attributes(v2, 'xy')
-        if is_intersection_segment_segment_xy((a, b), (c, d)):
-            crossings.add(((u1, v1), (u2, v2)))
-    return list(crossings)
+    vertices = {key: network.node_attributes(key, 'xy') for key in network.nodes()}
+    return _find_crossings(network.edges(), vertices)
 
 
 def network_is_xy(network):
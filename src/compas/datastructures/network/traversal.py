@@ -2,14 +2,30 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+import compas
+
 from compas.topology import shortest_path
+from compas.topology import dijkstra_multi_distances
+from compas.topology import dijkstra_path
+
+if not compas.IPY:
+    from compas.topology import dijkstra_distances_numpy
 
 
 __all__ = [
-    'network_shortest_path'
+    'network_shortest_path',
+    'network_dijkstra_distances',
+    'network_dijkstra_path',
 ]
 
 
+def _network_edge_weights(network):
+    weight = {}
+    for u, v in network.edges():
+        weight[u, v] = weight[v, u] = network.edge_length(u, v)
+    return weight
+
+
 def network_shortest_path(network, start, end):
     """Find the shortest path between two nodes of the network.
 
@@ -31,6 +47,88 @@ def network_shortest_path(network, start, end):
     return shortest_path(network.adjacency, start, end)
 
 
+def network_dijkstra_distances(network, targets, weight=None, cutoff=None, method=None):
+    """Compute the shortest path distances from all nodes of the network to the closest of a set of target nodes.
+
+    Parameters
+    ----------
+    network : :class:`compas.datastructures.Network`
+    targets : list
+        The target nodes.
+    weight : dict, optional
+        A dictionary of edge weights, with an entry per edge in both directions.
+        Defaults to the lengths of the edges.
+    cutoff : float, optional
+        Stop the search at this distance.
+    method : {'scipy', 'python'}, optional
+        The implementation of the search.
+        With ``'scipy'``, the sparse graph routines of SciPy are used, through :func:`compas.topology.dijkstra_distances_numpy`.
+        With ``'python'``, the search is done in pure Python, with :func:`compas.topology.dijkstra_multi_distances`.
+        Default is ``'scipy'``, except in IronPython, where it is ``'python'``.
+
+    Returns
+    -------
+    dict
+        A dictionary of distances to the closest target.
+        Nodes that can't reach any of the targets have a distance of ``1e+17``.
+
+    Raises
+    ------
+    ValueError
+        If ``method`` is not one of ``{'scipy', 'python'}``.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Network
+    >>> network = Network()
+    >>> a = network.add_node(x=0.0, y=0.0, z=0.0)
+    >>> b = network.add_node(x=1.0, y=0.0, z=0.0)
+    >>> c = network.add_node(x=3.0, y=0.0, z=0.0)
+    >>> network.add_edge(a, b)
+    (0, 1)
+    >>> network.add_edge(b, c)
+    (1, 2)
+    >>> network.dijkstra_distances([a], method='python')
+    {0: 0, 1: 1.0, 2: 3.0}
+
+    """
+    if method is None:
+        method = 'python' if compas.IPY else 'scipy'
+    if method not in ('scipy', 'python'):
+        raise ValueError("Method should be 'scipy' or 'python': {}".format(method))
+    if weight is None:
+        weight = _network_edge_weights(network)
+    if method == 'scipy':
+        return dijkstra_distances_numpy(network.adjacency, weight, targets, cutoff=cutoff)
+    return dijkstra_multi_distances(network.adjacency, weight, targets, cutoff=cutoff)
+
+
+def network_dijkstra_path(network, start, end, weight=None):
+    """Find the shortest path between two nodes of the network, taking into account edge weights.
+
+    Parameters
+    ----------
+    network : :class:`compas.datastructures.Network`
+    start : hashable
+        The identifier of the start node.
+    end : hashable
+        The identifier of the end node.
+    weight : dict, optional
+        A dictionary of edge weights, with an entry per edge in both directions.
+        Defaults to the lengths of the edges.
+
+    Returns
+    -------
+    list, None
+        The nodes of the network leading from start to end,
+        or None, if no path exists between the nodes.
+
+    """
+    if weight is None:
+        weight = _network_edge_weights(network)
+    return dijkstra_path(network.adjacency, weight, start, end)
+
+
 # ==============================================================================
 # Main
 # ==============================================================================
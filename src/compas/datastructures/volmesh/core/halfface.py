@@ -8,6 +8,7 @@ from random import choice
 import compas
 
 from compas.datastructures.datastructure import Datastructure
+from compas.datastructures.datastructure import _copy_attributes
 from compas.datastructures.attributes import VertexAttributeView
 from compas.datastructures.attributes import EdgeAttributeView
 from compas.datastructures.attributes import FaceAttributeView
@@ -292,6 +293,50 @@ class HalfFace(Datastructure):
         self._max_face = -1
         self._max_cell = -1
 
+    def copy(self, cls=None):
+        """Make an independent copy of the volmesh.
+
+        Parameters
+        ----------
+        cls : :class:`compas.datastructures.HalfFace`, optional
+            The type of volmesh to return.
+            Defaults to the type of the current volmesh.
+
+        Returns
+        -------
+        :class:`compas.datastructures.HalfFace`
+            A separate, but identical volmesh.
+
+        Notes
+        -----
+        The copy is made directly from the internal dictionaries of the volmesh,
+        without a round trip through its data.
+        Unlike a reconstruction from data, this preserves the identifiers of the faces.
+        Attribute values of immutable types are shared between the volmesh and the copy.
+
+        """
+        if not cls:
+            cls = type(self)
+        if not issubclass(cls, HalfFace):
+            return super(HalfFace, self).copy(cls=cls)
+        other = cls()
+        other.attributes.update(_copy_attributes(self.attributes))
+        other.default_vertex_attributes.update(_copy_attributes(self.default_vertex_attributes))
+        other.default_edge_attributes.update(_copy_attributes(self.default_edge_attributes))
+        other.default_face_attributes.update(_copy_attributes(self.default_face_attributes))
+        other.default_cell_attributes.update(_copy_attributes(self.default_cell_attributes))
+        other._vertex = {key: _copy_attributes(attr) for key, attr in self._vertex.items()}
+        other._halfface = {fkey: vertices[:] for fkey, vertices in self._halfface.items()}
+        other._cell = {ckey: {u: nbrs.copy() for u, nbrs in cell.items()} for ckey, cell in self._cell.items()}
+        other._plane = {u: {v: nbrs.copy() for v, nbrs in plane.items()} for u, plane in self._plane.items()}
+        other._edge_data = {key: _copy_attributes(attr) for key, attr in self._edge_data.items()}
+        other._face_data = {key: _copy_attributes(attr) for key, attr in self._face_data.items()}
+        other._cell_data = {key: _copy_attributes(attr) for key, attr in self._cell_data.items()}
+        other._max_vertex = self._max_vertex
+        other._max_face = self._max_face
+        other._max_cell = self._max_cell
+        return other
+
     def get_any_vertex(self):
         """Get the identifier of a random vertex.
 
@@ -375,6 +375,9 @@ Fitting
     bestfit_circle_numpy
     bestfit_plane
     bestfit_plane_numpy
+    bestfit_plane_numpy_chunked
+    bestfit_frame_numpy
+    bestfit_frame_numpy_chunked
 
 
 Boolean operations
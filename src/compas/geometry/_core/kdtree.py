@@ -3,8 +3,8 @@ from __future__ import absolute_import
 from __future__ import division
 
 import collections
-
-from compas.geometry._core import distance_point_point_sqrd
+from heapq import heappush
+from heapq import heapreplace
 
 
 __all__ = [
@@ -35,6 +35,11 @@ class KDTree(object):
     -----
     For more info, see [1]_ and [2]_.
 
+    The tree is stored implicitly in flat lists.
+    The node of a range of the list of points is the median of that range,
+    and its children are the ranges before and after the median.
+    The tree is built and searched iteratively, without recursion.
+
     References
     ----------
     .. [1] Wikipedia. *k-d tree*.
@@ -44,46 +49,114 @@ class KDTree(object):
 
     Examples
     --------
-    >>>
+    >>> tree = KDTree([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [3.0, 0.0, 0.0]])
+    >>> xyz, label, distance = tree.nearest_neighbor([2.1, 0.0, 0.0])
+    >>> label
+    2
+    >>> [label for xyz, label, distance in tree.nearest_neighbors([0.2, 0.0, 0.0], 2)]
+    [0, 1]
 
     """
 
     def __init__(self, objects=None):
         """Initialise a KDTree object."""
-        self.root = None
+        self.objects = []
+        self.coordinates = [[], [], []]
+        self.order = []
+        self.axes = []
         if objects:
-            self.root = self.build(list([(objects[i], i) for i in range(len(objects))]))
+            self.build(objects)
+
+    @property
+    def root(self):
+        """Node : The root node of the tree, as a nested tuple of nodes."""
+        def node(lo, hi):
+            if lo >= hi:
+                return None
+            mid = (lo + hi) // 2
+            label = self.order[mid]
+            return Node(self.objects[label], self.axes[mid], label, node(lo, mid), node(mid + 1, hi))
+
+        return node(0, len(self.order))
 
-    def build(self, objects, axis=0):
+    def build(self, objects):
         """Populate a kd-tree with given objects.
 
         Parameters
         ----------
         objects : list
-            The tree objects.
-        axis : int, optional
-            The axis along which to build.
+            The XYZ coordinates of the tree objects.
+            The index of an object in the list is its label.
 
         Returns
         -------
-        Node
-            The root node.
+        None
 
         """
-        if not objects:
-            return None
-
-        objects.sort(key=lambda o: o[0][axis])
-        median_idx = len(objects) // 2
-        median_point, median_label = objects[median_idx]
-        next_axis = (axis + 1) % 3
+        objects = list(objects)
+        coordinates = [[float(point[axis]) for point in objects] for axis in range(3)]
+        order = list(range(len(objects)))
+        axes = [0] * len(objects)
+        stack = [(0, len(objects), 0)]
+        while stack:
+            lo, hi, axis = stack.pop()
+            if lo >= hi:
+                continue
+            order[lo:hi] = sorted(order[lo:hi], key=coordinates[axis].__getitem__)
+            mid = (lo + hi) // 2
+            axes[mid] = axis
+            axis = (axis + 1) % 3
+            stack.append((lo, mid, axis))
+            stack.append((mid + 1, hi, axis))
+        self.objects = objects
+        self.coordinates = coordinates
+        self.order = order
+        self.axes = axes
+
+    def _search(self, point, number, exclude=None, radius=None):
+        # bounded max-heap of the (negative) squared distances of the closest points found so far
+        if number <= 0:
+            return []
+        xs, ys, zs = self.coordinates
+        order = self.order
+        axes = self.axes
+        x, y, z = point[0], point[1], point[2]
+        xyz = (x, y, z)
+        bound = float('inf') if radius is None else radius ** 2
+        heap = []
+        stack = [(0, len(order), 0.0)]
+        while stack:
+            lo, hi, d2 = stack.pop()
+            if lo >= hi:
+                continue
+            if d2 > bound or (d2 == bound and len(heap) == number):
+                continue
+            mid = (lo + hi) // 2
+            label = order[mid]
+            dx = x - xs[label]
+            dy = y - ys[label]
+            dz = z - zs[label]
+            d2 = dx * dx + dy * dy + dz * dz
+            if d2 <= bound and not (exclude and label in exclude):
+                if len(heap) < number:
+                    heappush(heap, (-d2, label))
+                    if len(heap) == number and radius is None:
+                        bound = -heap[0][0]
+                elif d2 < bound:
+                    heapreplace(heap, (-d2, label))
+                    bound = -heap[0][0]
+            axis = axes[mid]
+            d = xyz[axis] - self.coordinates[axis][label]
+            if d <= 0:
+                stack.append((mid + 1, hi, d * d))
+                stack.append((lo, mid, 0.0))
+            else:
+                stack.append((lo, mid, d * d))
+                stack.append((mid + 1, hi, 0.0))
+        return sorted((-d2, label) for d2, label in heap)
 
-        return Node(
-            median_point,
-            axis,
-            median_label,
-            self.build(objects[:median_idx], next_axis),
-            self.build(objects[median_idx + 1:], next_axis))
+    def _neighbors(self, found):
+        return [[self.objects[label], label, d2 ** 0.5] for d2, label in found]
 
     def nearest_neighbor(self, point, exclude=None):
         """Find the nearest neighbor to a given point,
@@ -105,30 +178,10 @@ class KDTree(object):
             Distance to the base point.
 
         """
-        def search(node):
-            if node is None:
-                return
-
-            d2 = distance_point_point_sqrd(point, node.point)
-            if d2 < best[2]:
-                if node.label not in exclude:
-                    best[:] = node.point, node.label, d2
-
-            d = point[node.axis] - node.point[node.axis]
-            if d <= 0:
-                close, far = node.left, node.right
-            else:
-                close, far = node.right, node.left
-
-            search(close)
-            if d ** 2 < best[2]:
-                search(far)
-
-        exclude = exclude or set()
-        best = [None, None, float('inf')]
-        search(self.root)
-        best[2] **= 0.5
-        return best
+        found = self._search(point, 1, exclude)
+        if not found:
+            return [None, None, float('inf')]
+        return self._neighbors(found)[0]
 
     def nearest_neighbors(self, point, number, distance_sort=False):
         """Find the N nearest neighbors to a given point.
@@ -147,17 +200,92 @@ class KDTree(object):
         -------
         list
             A list of N nearest neighbors.
+            If the tree contains fewer than N objects, all objects are returned.
+
+        Notes
+        -----
+        The neighbors are found in a single pass through the tree,
+        and are always returned in order of increasing distance.
+
+        """
+        return self._neighbors(self._search(point, number))
+
+    def neighbors_in_radius(self, point, radius, distance_sort=False):
+        """Find all neighbors within a given distance of a point.
+
+        Parameters
+        ----------
+        point : list
+            XYZ coordinates of the base point.
+        radius : float
+            The search radius.
+        distance_sort : bool, optional
+            Sort the neighbors by distance to the base point.
+            Default is ``False``.
+
+        Returns
+        -------
+        list
+            A list of neighbors,
+            with for every neighbor its XYZ coordinates, its label, and its distance to the base point.
+
+        Examples
+        --------
+        >>> tree = KDTree([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [3.0, 0.0, 0.0]])
+        >>> [label for xyz, label, distance in tree.neighbors_in_radius([0.5, 0.0, 0.0], 1.0, True)]
+        [0, 1]
+
+        """
+        found = self._search(point, len(self.order), radius=radius)
+        if not distance_sort:
+            found.sort(key=lambda item: item[1])
+        return self._neighbors(found)
+
+    def query(self, points, number=1):
+        """Find the nearest neighbors of multiple points.
+
+        Parameters
+        ----------
+        points : list
+            XYZ coordinates of the base points.
+        number : int, optional
+            The number of nearest neighbors per point.
+            Default is ``1``.
+
+        Returns
+        -------
+        list
+            Per point, the result of :meth:`nearest_neighbors`.
+
+        Examples
+        --------
+        >>> tree = KDTree([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [3.0, 0.0, 0.0]])
+        >>> [[label for xyz, label, distance in nnbrs] for nnbrs in tree.query([[0.1, 0.0, 0.0], [2.9, 0.0, 0.0]], 2)]
+        [[0, 1], [2, 1]]
+
+        """
+        return [self.nearest_neighbors(point, number) for point in points]
+
+    def query_radius(self, points, radius, distance_sort=False):
+        """Find the neighbors within a given distance of multiple points.
+
+        Parameters
+        ----------
+        points : list
+            XYZ coordinates of the base points.
+        radius : float
+            The search radius.
+        distance_sort : bool, optional
+            Sort the neighbors by distance to the base point.
+            Default is ``False``.
+
+        Returns
+        -------
+        list
+            Per point, the result of :meth:`neighbors_in_radius`.
 
         """
-        nnbrs = []
-        exclude = set()
-        for i in range(number):
-            nnbr = self.nearest_neighbor(point, exclude)
-            nnbrs.append(nnbr)
-            exclude.add(nnbr[1])
-        if distance_sort:
-            return sorted(nnbrs, key=lambda nnbr: nnbr[2])
-        return nnbrs
+        return [self.neighbors_in_radius(point, radius, distance_sort) for point in points]
 
 
 # ==============================================================================
@@ -12,11 +12,14 @@ from scipy.optimize import leastsq
 from compas.geometry import world_to_local_coordinates_numpy
 from compas.geometry import local_to_world_coordinates_numpy
 from compas.numerical import pca_numpy
+from compas.numerical import pca_numpy_chunked
 
 
 __all__ = [
     'bestfit_plane_numpy',
+    'bestfit_plane_numpy_chunked',
     'bestfit_frame_numpy',
+    'bestfit_frame_numpy_chunked',
     'bestfit_circle_numpy',
     'bestfit_sphere_numpy',
 ]
@@ -44,6 +47,36 @@ def bestfit_plane_numpy(points):
     return o, uvw[2]
 
 
+def bestfit_plane_numpy_chunked(points, chunksize=100000):
+    """Fit a plane through a large set of points, one chunk of points at a time.
+
+    Parameters
+    ----------
+    points : array or iterable
+        XYZ coordinates of the points, as an array, such as a memory-mapped array,
+        or as an iterable, such as a generator, of chunks of points.
+    chunksize : int, optional
+        The number of points per chunk, if ``points`` is an array.
+        Default is ``100000``.
+
+    Returns
+    -------
+    tuple
+        A point on the plane, and the normal vector.
+
+    See Also
+    --------
+    :func:`compas.numerical.pca_numpy_chunked`
+
+    Examples
+    --------
+    >>>
+
+    """
+    o, uvw, _ = pca_numpy_chunked(points, chunksize)
+    return o, uvw[2]
+
+
 def bestfit_frame_numpy(points):
     """Fit a frame to a set of points.
 
@@ -66,6 +99,36 @@ def bestfit_frame_numpy(points):
     return o, uvw[0], uvw[1]
 
 
+def bestfit_frame_numpy_chunked(points, chunksize=100000):
+    """Fit a frame to a large set of points, one chunk of points at a time.
+
+    Parameters
+    ----------
+    points : array or iterable
+        XYZ coordinates of the points, as an array, such as a memory-mapped array,
+        or as an iterable, such as a generator, of chunks of points.
+    chunksize : int, optional
+        The number of points per chunk, if ``points`` is an array.
+        Default is ``100000``.
+
+    Returns
+    -------
+    3-tuple
+        The frame origin, and the local X and Y axes.
+
+    See Also
+    --------
+    :func:`compas.numerical.pca_numpy_chunked`
+
+    Examples
+    --------
+    >>>
+
+    """
+    o, uvw, _ = pca_numpy_chunked(points, chunksize)
+    return o, uvw[0], uvw[1]
+
+
 def bestfit_circle_numpy(points):
     """Fit a circle through a set of points.
 
@@ -13,13 +13,19 @@ Solvers
     :toctree: generated/
     :nosignatures:
 
+    descent_numpy
+    DescentState
     devo_numpy
     dr
     dr_numpy
+    dr_numpy_batch
     fd_numpy
+    FDSolver
     ga
     moga
     pca_numpy
+    pca_numpy_chunked
+    IncrementalPCA
     topop_numpy
 
 
@@ -40,6 +46,7 @@ Linalg
     rref_matlab
     chofactor
     lufactorized
+    FactorisationCache
     uvw_lengths
     normrow
     normalizerow
@@ -106,6 +113,7 @@ from .fd import *  # noqa: F401 F403
 # from .drx import *  # noqa: F401 F403
 from .dr import *  # noqa: F401 F403
 from .devo import *  # noqa: F401 F403
+from .descent import *  # noqa: F401 F403
 from .isolines import *  # noqa: F401 F403
 
 
@@ -0,0 +1,99 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+
+__all__ = []
+
+
+class Objective(object):
+    """Picklable wrapper of an objective function and its additional arguments.
+
+    Parameters
+    ----------
+    fn : callable
+        The objective function.
+    args : tuple, optional
+        Additional arguments passed to the function after the evaluated values.
+    kwargs : dict, optional
+        Keyword arguments passed to the function.
+
+    """
+
+    def __init__(self, fn, args=(), kwargs=None):
+        self.fn = fn
+        self.args = tuple(args)
+        self.kwargs = kwargs or {}
+
+    def __call__(self, x):
+        return self.fn(x, *self.args, **self.kwargs)
+
+
+def open_pool(pool=None, workers=None):
+    """Get a pool for the evaluation of objective functions.
+
+    Parameters
+    ----------
+    pool : {None, 'threads', 'processes'} or object, optional
+        The type of pool to create, or an existing pool,
+        i.e. any object with a ``map`` method, such as a :class:`multiprocessing.Pool`
+        or a :class:`concurrent.futures.Executor`.
+        Default is ``None``, in which case there is no pool.
+    workers : int, optional
+        The number of workers of a new pool.
+        Default is the number of CPUs.
+
+    Returns
+    -------
+    tuple
+        The pool, or ``None``,
+        and a flag indicating if the pool was created here and should be closed with :func:`close_pool`.
+
+    Raises
+    ------
+    ValueError
+        If the type of pool is not supported.
+
+    """
+    if pool is None:
+        return None, False
+    if pool == 'threads':
+        from multiprocessing.pool import ThreadPool
+        return ThreadPool(workers), True
+    if pool == 'processes':
+        from multiprocessing import Pool
+        return Pool(workers), True
+    if hasattr(pool, 'map'):
+        return pool, False
+    raise ValueError("Pool should be None, 'threads', 'processes' or an object with a map method: {}".format(pool))
+
+
+def close_pool(pool, owned):
+    """Close a pool obtained from :func:`open_pool`, if it was created there."""
+    if pool is not None and owned:
+        pool.close()
+        pool.join()
+
+
+def evaluate(objective, values, pool=None):
+    """Evaluate an objective for a sequence of values, optionally in parallel.
+
+    Parameters
+    ----------
+    objective : callable
+        The objective, taking a single value.
+        For a pool of processes, the objective and the values have to be picklable.
+    values : sequence
+        The values.
+    pool : object, optional
+        A pool with a ``map`` method.
+
+    Returns
+    -------
+    list
+        The value of the objective for every value, in order.
+
+    """
+    if pool is None:
+        return [objective(value) for value in values]
+    return list(pool.map(objective, values))
@@ -4,6 +4,7 @@ from __future__ import division
 from __future__ import print_function
 
 from numpy import array
+from numpy import asarray
 from numpy import eye
 from numpy import finfo
 from numpy import float64
@@ -14,16 +15,70 @@ from numpy import ones
 from numpy import reshape
 from numpy import sqrt
 from numpy import sum
-from numpy import zeros
+
+from compas.numerical._parallel import Objective
+from compas.numerical._parallel import close_pool
+from compas.numerical._parallel import evaluate
+from compas.numerical._parallel import open_pool
 
 eps = finfo(float64).eps
 e = sqrt(eps)
 
 
-__all__ = ['descent_numpy']
+__all__ = ['descent_numpy', 'DescentState']
+
+
+class DescentState(object):
+    """State of a gradient descent optimisation, for warm starts and resuming.
+
+    Parameters
+    ----------
+    x : array-like, optional
+        The current values of the variables.
+        Default is ``None``, in which case the optimisation starts from the starting guess.
+
+    Attributes
+    ----------
+    x : array
+        n x 1 values of the variables after the last completed iteration.
+    mu : float
+        The current weight of the penalty on violated bounds.
+    iteration : int
+        The total number of completed iterations.
+    fopt : float
+        The value of the objective function after the last completed iteration.
+    gres : float
+        The mean residual of the gradient of the last completed iteration.
+    converged : bool
+        ``True`` if the last optimisation was terminated by ``gtol`` or ``limit``.
+
+    Examples
+    --------
+    >>> from scipy.optimize import rosen
+    >>> def f(u, *args):
+    ...     return rosen(u.ravel())
+    ...
+    >>> state = DescentState()
+    >>> fopt, xopt = descent_numpy([1.3, 0.7], f, iterations=5, state=state, printout=False)
+    >>> state.iteration
+    5
+    >>> fopt, xopt = descent_numpy([1.3, 0.7], f, iterations=5, state=state, printout=False)
+    >>> state.iteration
+    10
+
+    """
+
+    def __init__(self, x=None):
+        self.x = None if x is None else reshape(array(x, dtype=float), (-1, 1))
+        self.mu = 1.0
+        self.iteration = 0
+        self.fopt = None
+        self.gres = None
+        self.converged = False
 
 
-def descent_numpy(x0, fn, iterations=1000, gtol=10**(-6), bounds=None, limit=0, args=()):
+def descent_numpy(x0, fn, iterations=1000, gtol=10**(-6), bounds=None, limit=0, args=(),
+                  gradient=None, vectorized=False, pool=None, workers=None, state=None, printout=True):
     """A gradient descent optimisation solver.
 
     Parameters
@@ -42,6 +97,34 @@ def descent_numpy(x0, fn, iterations=1000, gtol=10**(-6), bounds=None, limit=0,
         Value of the objective function for which to terminate optimisation.
     args : tuple
         Additional parameters needed for fn.
+    gradient : obj, optional
+        The gradient of the objective function, taking the same arguments as ``fn``,
+        and returning n values.
+        If provided, it replaces the finite difference approximation of the gradient.
+        Default is ``None``.
+    vectorized : bool, optional
+        If ``True``, ``fn`` is called once per iteration with all finite difference probes,
+        as an n x n array with one column per probe, and returns an array with the value of every probe.
+        Default is ``False``.
+    pool : {None, 'threads', 'processes'} or object, optional
+        Evaluate the finite difference probes in parallel, in a new pool of threads or processes,
+        or in an existing pool with a ``map`` method.
+        For a pool of processes, ``fn`` and ``args`` have to be picklable.
+        Not used if ``vectorized`` is ``True`` or a ``gradient`` is provided.
+        Default is ``None``.
+    workers : int, optional
+        The number of workers of a new pool.
+        Default is the number of CPUs.
+    state : :class:`DescentState`, optional
+        The state of a previous optimisation.
+        If it has values for the variables, the optimisation continues from those values instead of from ``x0``,
+        with the penalty weight and iteration count of the previous optimisation.
+        The state is updated after every iteration,
+        such that an interrupted optimisation can be resumed.
+        Default is ``None``.
+    printout : bool, optional
+        Print the progress of every iteration.
+        Default is ``True``.
 
     Returns
     -------
@@ -54,58 +137,96 @@ def descent_numpy(x0, fn, iterations=1000, gtol=10**(-6), bounds=None, limit=0,
     r = 0.5
     c = 0.0001
     n = len(x0)
-    x0 = reshape(array(x0), (n, 1))
+
+    if state is None:
+        state = DescentState()
+    if state.x is None:
+        state.x = reshape(array(x0, dtype=float), (n, 1))
+    x0 = state.x.copy()
 
     if bounds:
         bounds = array(bounds)
         lb = bounds[:, 0][:, newaxis]
         ub = bounds[:, 1][:, newaxis]
     else:
-        lb = ones((n, 1)) * -10**20
-        ub = ones((n, 1)) * +10**20
+        lb = ones((n, 1)) * -1e20
+        ub = ones((n, 1)) * +1e20
 
-    zn = zeros((n, 1))
-    g = zeros((n, 1))
     v = eye(n) * e
 
-    def phi(x, mu, *args):
-        p = mu * (sum(maximum(lb - x, zn)) + sum(maximum(x - ub, zn)))**2
-        return fn(x, *args) + p
+    def penalty(x, mu):
+        # the penalty on violated bounds per column of x
+        return mu * (sum(maximum(lb - x, 0), axis=0) + sum(maximum(x - ub, 0), axis=0))**2
 
-    i = 0
-    mu = 1
+    def phi(x, mu, *args):
+        return fn(x, *args) + penalty(x, mu)[0]
+
+    def fd_gradient(x, p0, mu):
+        # all finite difference probes at once, one per column
+        probes = x + v
+        if vectorized:
+            values = asarray(fn(probes, *args), dtype=float).ravel()
+        else:
+            columns = [probes[:, j:j + 1] for j in range(n)]
+            values = asarray(evaluate(Objective(fn, args), columns, pool), dtype=float).ravel()
+        return reshape((values + penalty(probes, mu) - p0) / e, (n, 1))
+
+    def exact_gradient(x, mu):
+        below = maximum(lb - x, 0)
+        above = maximum(x - ub, 0)
+        dp = 2 * mu * (sum(below) + sum(above)) * ((above > 0).astype(float) - (below > 0).astype(float))
+        return reshape(asarray(gradient(x, *args), dtype=float), (n, 1)) + dp
+
+    if gradient is None and not vectorized:
+        pool, owned = open_pool(pool, workers)
+    else:
+        pool, owned = None, False
 
-    while i < iterations:
+    mu = state.mu
+    f1 = state.fopt
+    if f1 is None:
+        f1 = phi(x0, mu, *args)
+    state.converged = False
 
-        p0 = phi(x0, mu, *args)
+    try:
+        for _ in range(iterations):
 
-        for j in range(n):
-            vj = v[:, j][:, newaxis]
-            g[j, 0] = (phi(x0 + vj, mu, *args) - p0) / e
+            p0 = phi(x0, mu, *args)
 
-        D = sum(-g * g)
+            if gradient is None:
+                g = fd_gradient(x0, p0, mu)
+            else:
+                g = exact_gradient(x0, mu)
 
-        a = 1
-        x1 = x0 - a * g
+            D = sum(-g * g)
 
-        while phi(x1, mu, *args) > p0 + c * a * D:
-            a *= r
+            a = 1
             x1 = x0 - a * g
 
-        x0 -= a * g
+            while phi(x1, mu, *args) > p0 + c * a * D:
+                a *= r
+                x1 = x0 - a * g
 
-        mu *= 10
-        res = mean(abs(g))
-        i += 1
-        f1 = phi(x0, mu, *args)
+            x0 -= a * g
+
+            mu = min(mu * 10.0, 1e20)
+            res = mean(abs(g))
+            f1 = phi(x0, mu, *args)
 
-        if f1 < limit:
-            break
+            state.x = x0.copy()
+            state.mu = mu
+            state.iteration += 1
+            state.fopt = f1
+            state.gres = res
 
-        if res < gtol:
-            break
+            if f1 < limit or res < gtol:
+                state.converged = True
+                break
 
-        print('Iteration: {0}  fopt: {1:.3g}  gres: {2:.3g}  step: {3}'.format(i, f1, res, a))
+            if printout:
+                print('Iteration: {0}  fopt: {1:.3g}  gres: {2:.3g}  step: {3}'.format(state.iteration, f1, res, a))
+    finally:
+        close_pool(pool, owned)
 
     return f1, x0
 
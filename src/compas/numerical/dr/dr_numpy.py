@@ -6,15 +6,15 @@ from numpy import array
 from numpy import isnan
 from numpy import isinf
 from numpy import ones
+from numpy import sqrt
+from numpy import sum
+from numpy import where
 from numpy import zeros
-from scipy.linalg import norm
-from scipy.sparse import diags
 
 from compas.numerical import connectivity_matrix
-from compas.numerical import normrow
 
 
-__all__ = ['dr_numpy']
+__all__ = ['dr_numpy', 'dr_numpy_batch']
 
 
 K = [
@@ -92,12 +92,167 @@ def dr_numpy(vertices, edges, fixed, loads, qpre,
     --------
     >>>
     """
+    if callback:
+        assert callable(callback), 'The provided callback is not callable.'
+    # --------------------------------------------------------------------------
+    # input processing
     # --------------------------------------------------------------------------
-    # callback
+    num_v = len(vertices)
+    num_e = len(edges)
+    qpre = qpre or [0.0 for _ in range(num_e)]
+    fpre = fpre or [0.0 for _ in range(num_e)]
+    lpre = lpre or [0.0 for _ in range(num_e)]
+    linit = linit or [0.0 for _ in range(num_e)]
+    E = E or [0.0 for _ in range(num_e)]
+    radius = radius or [0.0 for _ in range(num_e)]
     # --------------------------------------------------------------------------
+    # a batch of one network
+    # --------------------------------------------------------------------------
+
+    def report(k, x, crit1, crit2):
+        callback(k, x[:, 0], [crit1[0], crit2[0]], callback_args)
+
+    x, q, f, l, r = _dr_batch(  # noqa: E741
+        edges, fixed,
+        _stack(vertices, 1, (num_v, 3)),
+        _stack(loads, 1, (num_v, 3)),
+        _stack(qpre, 1, (num_e, 1)),
+        _stack(fpre, 1, (num_e, 1)),
+        _stack(lpre, 1, (num_e, 1)),
+        _stack(linit, 1, (num_e, 1)),
+        _stack(E, 1, (num_e, 1)),
+        _stack(radius, 1, (num_e, 1)),
+        report if callback else None,
+        **kwargs)
+    return x[:, 0], q[:, 0], f[:, 0], l[:, 0], r[:, 0]
+
+
+def _stack(values, num_b, shape):
+    # per-network values as an array with the networks along the second axis
+    if values is None:
+        return zeros((shape[0], num_b) + shape[1:], dtype=float)
+    values = array(values, dtype=float)
+    values = values.reshape((-1,) + shape)
+    if len(values) == 1:
+        values = values.repeat(num_b, axis=0)
+    if len(values) != num_b:
+        raise ValueError('Expected values for 1 or {0} networks, got {1}.'.format(num_b, len(values)))
+    return values.swapaxes(0, 1)
+
+
+def _batch_size(*items):
+    # the number of networks implied by the stacked inputs
+    # values with one of the given shapes are shared by all networks
+    sizes = set()
+    for values, shapes in items:
+        if values is None:
+            continue
+        values = array(values)
+        if values.shape not in shapes:
+            sizes.add(len(values))
+    sizes.discard(1)
+    if len(sizes) > 1:
+        raise ValueError('The stacked inputs describe different numbers of networks: {0}'.format(sorted(sizes)))
+    return sizes.pop() if sizes else 1
+
+
+def dr_numpy_batch(vertices, edges, fixed, loads, qpre,
+                   fpre=None, lpre=None, linit=None, E=None, radius=None,
+                   callback=None, callback_args=None, **kwargs):
+    """Dynamic relaxation of several networks with the same topology at once.
+
+    Parameters
+    ----------
+    vertices : list
+        XYZ coordinates of the vertices, as v x 3 values shared by all networks,
+        or b x v x 3 values for b networks, for example with different coordinates of the fixed vertices.
+    edges : list
+        Connectivity of the vertices.
+    fixed : list
+        Indices of the fixed vertices.
+    loads : list
+        XYZ components of the loads on the vertices, as v x 3 or b x v x 3 values.
+    qpre : list
+        Prescribed force densities in the edges, as e or b x e values.
+    fpre : list, optional
+        Prescribed forces in the edges, as e or b x e values.
+    lpre : list, optional
+        Prescribed lengths of the edges, as e or b x e values.
+    linit : list, optional
+        Initial length of the edges, as e or b x e values.
+    E : list, optional
+        Stiffness of the edges, as e or b x e values.
+    radius : list, optional
+        Radius of the edges, as e or b x e values.
+    callback : callable, optional
+        User-defined function that is called at every iteration,
+        with the iteration number, the b x v x 3 coordinates,
+        the convergence criteria of all networks and ``callback_args``.
+    callback_args : tuple, optional
+        Additional arguments passed to the callback.
+
+    Returns
+    -------
+    xyz : array
+        b x v x 3 XYZ coordinates of the equilibrium geometries.
+    q : array
+        b x e x 1 force densities in the edges.
+    f : array
+        b x e x 1 forces in the edges.
+    l : array
+        b x e x 1 lengths of the edges
+    r : array
+        b x v x 3 residual forces.
+
+    Notes
+    -----
+    The networks are relaxed together, with the same sparse matrix products applied
+    to the stacked coordinates of all networks.
+    A network that has converged is no longer updated,
+    and the iterations stop when all networks have converged, or after ``kmax`` iterations.
+    :func:`dr_numpy` relaxes a batch of one network in the same way.
+
+    Examples
+    --------
+    >>>
+    """
     if callback:
         assert callable(callback), 'The provided callback is not callable.'
     # --------------------------------------------------------------------------
+    # attribute arrays
+    # with shape (v, b, 3) for vertices and (e, b, 1) for edges
+    # --------------------------------------------------------------------------
+    num_v = array(vertices).shape[1] if array(vertices).ndim == 3 else len(vertices)
+    num_e = len(edges)
+    vertex_shapes = ((num_v, 3), )
+    edge_shapes = ((num_e, ), (num_e, 1))
+    num_b = _batch_size((vertices, vertex_shapes), (loads, vertex_shapes),
+                        (qpre, edge_shapes), (fpre, edge_shapes), (lpre, edge_shapes),
+                        (linit, edge_shapes), (E, edge_shapes), (radius, edge_shapes))
+
+    def report(k, x, crit1, crit2):
+        callback(k, x.swapaxes(0, 1), [crit1, crit2], callback_args)
+
+    x, q, f, l, r = _dr_batch(  # noqa: E741
+        edges, fixed,
+        _stack(vertices, num_b, (num_v, 3)),
+        _stack(loads, num_b, (num_v, 3)),
+        _stack(qpre, num_b, (num_e, 1)),
+        _stack(fpre, num_b, (num_e, 1)),
+        _stack(lpre, num_b, (num_e, 1)),
+        _stack(linit, num_b, (num_e, 1)),
+        _stack(E, num_b, (num_e, 1)),
+        _stack(radius, num_b, (num_e, 1)),
+        report if callback else None,
+        **kwargs)
+    return x.swapaxes(0, 1), q.swapaxes(0, 1), f.swapaxes(0, 1), l.swapaxes(0, 1), r.swapaxes(0, 1)
+
+
+def _dr_batch(edges, fixed, x, p, qpre, fpre, lpre, linit, E, radius, callback=None, **kwargs):
+    # the dynamic relaxation of b networks with the same topology,
+    # with vertex values of shape (v, b, 3) and edge values of shape (e, b, 1)
+    # the callback is called with the iteration number, the coordinates and the criteria of all networks
+    # --------------------------------------------------------------------------
     # configuration
     # --------------------------------------------------------------------------
     kmax = kwargs.get('kmax', 10000)
@@ -107,99 +262,59 @@ def dr_numpy(vertices, edges, fixed, loads, qpre,
     coeff = Coeff(kwargs.get('c', 0.1))
     ca = coeff.a
     cb = coeff.b
-    # --------------------------------------------------------------------------
-    # attribute lists
-    # --------------------------------------------------------------------------
-    num_v = len(vertices)
+    num_v, num_b, _ = x.shape
     num_e = len(edges)
     free = list(set(range(num_v)) - set(fixed))
     # --------------------------------------------------------------------------
-    # input processing
-    # --------------------------------------------------------------------------
-    qpre = qpre or [0.0 for _ in range(num_e)]
-    fpre = fpre or [0.0 for _ in range(num_e)]
-    lpre = lpre or [0.0 for _ in range(num_e)]
-    linit = linit or [0.0 for _ in range(num_e)]
-    E = E or [0.0 for _ in range(num_e)]
-    radius = radius or [0.0 for _ in range(num_e)]
-    # --------------------------------------------------------------------------
-    # attribute arrays
-    # --------------------------------------------------------------------------
-    x = array(vertices, dtype=float).reshape((-1, 3))                      # m
-    p = array(loads, dtype=float).reshape((-1, 3))                         # kN
-    qpre = array(qpre, dtype=float).reshape((-1, 1))
-    fpre = array(fpre, dtype=float).reshape((-1, 1))                       # kN
-    lpre = array(lpre, dtype=float).reshape((-1, 1))                       # m
-    linit = array(linit, dtype=float).reshape((-1, 1))                     # m
-    E = array(E, dtype=float).reshape((-1, 1))                             # kN/mm2 => GPa
-    radius = array(radius, dtype=float).reshape((-1, 1))                   # mm
-    # --------------------------------------------------------------------------
     # sectional properties
     # --------------------------------------------------------------------------
     A = 3.14159 * radius ** 2                                              # mm2
     EA = E * A                                                             # kN
     # --------------------------------------------------------------------------
-    # create the connectivity matrices
-    # after spline edges have been aligned
+    # connectivity matrices
     # --------------------------------------------------------------------------
     C = connectivity_matrix(edges, 'csr')
-    Ct = C.transpose()
+    Ct = C.transpose().tocsr()
     Ci = C[:, free]
-    Cit = Ci.transpose()
+    Cit = Ci.transpose().tocsr()
     Ct2 = Ct.copy()
     Ct2.data **= 2
+
+    def dot(M, a):
+        # a sparse matrix applied to the values of all networks at once
+        n, b, c = a.shape
+        return M.dot(a.reshape((n, b * c))).reshape((M.shape[0], b, c))
+
+    def lengths(u):
+        return sqrt(sum(u ** 2, axis=2, keepdims=True))
+
     # --------------------------------------------------------------------------
-    # if none of the initial lengths are set,
-    # set the initial lengths to the current lengths
+    # networks without initial lengths use their current lengths
     # --------------------------------------------------------------------------
-    if all(linit == 0):
-        linit = normrow(C.dot(x))
+    unset = (linit == 0).all(axis=0, keepdims=True)
+    if unset.any():
+        linit = where(unset, lengths(dot(C, x)), linit)
     # --------------------------------------------------------------------------
     # initial values
     # --------------------------------------------------------------------------
-    q = ones((num_e, 1), dtype=float)
-    l = normrow(C.dot(x))  # noqa: E741
+    q = ones((num_e, num_b, 1), dtype=float)
+    l = lengths(dot(C, x))  # noqa: E741
     f = q * l
-    v = zeros((num_v, 3), dtype=float)
-    r = zeros((num_v, 3), dtype=float)
-    # --------------------------------------------------------------------------
-    # helpers
-    # --------------------------------------------------------------------------
-
-    def rk(x0, v0, steps=2):
-        def a(t, v):
-            dx = v * t
-            x[free] = x0[free] + dx[free]
-            # update residual forces
-            r[free] = p[free] - D.dot(x)
-            return cb * r / mass
-
-        if steps == 1:
-            return a(dt, v0)
+    v = zeros((num_v, num_b, 3), dtype=float)
+    r = zeros((num_v, num_b, 3), dtype=float)
+    active = ones(num_b, dtype=bool)
 
-        if steps == 2:
-            B = [0.0, 1.0]
-            K0 = dt * a(K[0][0] * dt, v0)
-            K1 = dt * a(K[1][0] * dt, v0 + K[1][1] * K0)
-            dv = B[0] * K0 + B[1] * K1
-            return dv
-
-        if steps == 4:
-            B = [1. / 6., 1. / 3., 1. / 3., 1. / 6.]
-            K0 = dt * a(K[0][0] * dt, v0)
-            K1 = dt * a(K[1][0] * dt, v0 + K[1][1] * K0)
-            K2 = dt * a(K[2][0] * dt, v0 + K[2][1] * K0 + K[2][2] * K1)
-            K3 = dt * a(K[3][0] * dt, v0 + K[3][1] * K0 + K[3][2] * K1 + K[3][3] * K2)
-            dv = B[0] * K0 + B[1] * K1 + B[2] * K2 + B[3] * K3
-            return dv
-
-        raise NotImplementedError
+    def a(x0, t, v, q, mass):
+        dx = v * t
+        x[free] = x0[free] + dx[free]
+        # update residual forces
+        r[free] = p[free] - dot(Cit, q * dot(C, x))
+        return cb * r / mass
 
     # --------------------------------------------------------------------------
     # start iterating
     # --------------------------------------------------------------------------
     for k in range(kmax):
-        # print(k)
 
         q_fpre = fpre / l
         q_lpre = f / lpre
@@ -209,33 +324,41 @@ def dr_numpy(vertices, edges, fixed, loads, qpre,
         q_EA[isinf(q_EA)] = 0
         q_EA[isnan(q_EA)] = 0
 
-        q = qpre + q_fpre + q_lpre + q_EA
-        Q = diags([q[:, 0]], [0])
-        D = Cit.dot(Q).dot(C)
-        mass = 0.5 * dt ** 2 * Ct2.dot(qpre + q_fpre + q_lpre + EA / linit)
-        # RK
+        # converged networks keep their force densities
+        q = where(active[:, None], qpre + q_fpre + q_lpre + q_EA, q)
+        mass = 0.5 * dt ** 2 * dot(Ct2, qpre + q_fpre + q_lpre + EA / linit)
+        # RK4
         x0 = x.copy()
-        v0 = ca * v.copy()
-        dv = rk(x0, v0, steps=4)
+        v1 = v.copy()
+        v0 = ca * v
+        K0 = dt * a(x0, K[0][0] * dt, v0, q, mass)
+        K1 = dt * a(x0, K[1][0] * dt, v0 + K[1][1] * K0, q, mass)
+        K2 = dt * a(x0, K[2][0] * dt, v0 + K[2][1] * K0 + K[2][2] * K1, q, mass)
+        K3 = dt * a(x0, K[3][0] * dt, v0 + K[3][1] * K0 + K[3][2] * K1 + K[3][3] * K2, q, mass)
+        dv = (K0 + 2 * K1 + 2 * K2 + K3) / 6.
         v[free] = v0[free] + dv[free]
         dx = v * dt
         x[free] = x0[free] + dx[free]
+        # converged networks are not moved
+        x[:, ~active] = x0[:, ~active]
+        v[:, ~active] = v1[:, ~active]
+        dx[:, ~active] = 0
         # update
-        u = C.dot(x)
-        l = normrow(u)  # noqa: E741
+        u = dot(C, x)
+        l = lengths(u)  # noqa: E741
         f = q * l
-        r = p - Ct.dot(Q).dot(u)
+        r = p - dot(Ct, q * u)
         # crits
-        crit1 = norm(r[free])
-        crit2 = norm(dx[free])
+        crit1 = sqrt(sum(r[free] ** 2, axis=(0, 2)))
+        crit2 = sqrt(sum(dx[free] ** 2, axis=(0, 2)))
         # callback
         if callback:
-            callback(k, x, [crit1, crit2], callback_args)
+            callback(k, x, crit1, crit2)
         # convergence
-        if crit1 < tol1:
-            break
-        if crit2 < tol2:
+        active &= (crit1 >= tol1) & (crit2 >= tol2)
+        if not active.any():
             break
+
     return x, q, f, l, r
 
 
@@ -3,7 +3,12 @@ from __future__ import division
 from __future__ import print_function
 
 from numpy import arccos
+from numpy import argsort
 from numpy import array
+from numpy import bincount
+from numpy import concatenate
+from numpy import cumsum
+from numpy import int32
 from numpy import isnan
 from numpy import mean
 from numpy import sin
@@ -11,17 +16,10 @@ from numpy import sqrt
 from numpy import sum
 from numpy import zeros
 
-from numba import guvectorize
 from numba import f8
-from numba import i4
-from numba import i8
 
 from numba import jit
-
-try:
-    from numba import prange
-except ImportError:
-    prange = range
+from numba import prange
 
 from compas.numerical import uvw_lengths
 
@@ -107,7 +105,12 @@ def _args(network, factor, summary, steps, tol):
         ind_t = [-1]
     ind_c = array(ind_c)
     ind_t = array(ind_t)
-    return tol, steps, summary, m, n, u, v, X, f0, l0, k0, ind_c, ind_t, B, P, S, rows, cols, vals, nv, M, factor, V, inds, indi, indf, EIx, EIy, beams, C
+    # the edge adjacencies in row order, with a pointer to the first entry of every vertex
+    order = argsort(rows, kind='mergesort')
+    cols = cols[order]
+    vals = vals[order]
+    indptr = concatenate((array([0]), cumsum(bincount(rows, minlength=n)))).astype(int32)
+    return tol, steps, summary, m, n, u, v, X, f0, l0, k0, ind_c, ind_t, B, P, S, indptr, cols, vals, M, factor, V, inds, indi, indf, EIx, EIy, beams, C
 
 
 def drx_numba(network, factor=1.0, tol=0.1, steps=10000, summary=0, update=False):
@@ -144,8 +147,8 @@ def drx_numba(network, factor=1.0, tol=0.1, steps=10000, summary=0, update=False
 
     # Solver
     tic2 = time()
-    tol, steps, summary, m, n, u, v, X, f0, l0, k0, ind_c, ind_t, B, P, S, rows, cols, vals, nv, M, factor, V, inds, indi, indf, EIx, EIy, beams, C = args
-    drx_solver_numba(tol, steps, summary, m, n, u, v, X, f0, l0, k0, ind_c, ind_t, B, P, S, rows, cols, vals, nv,
+    tol, steps, summary, m, n, u, v, X, f0, l0, k0, ind_c, ind_t, B, P, S, indptr, cols, vals, M, factor, V, inds, indi, indf, EIx, EIy, beams, C = args
+    drx_solver_numba(tol, steps, summary, m, n, u, v, X, f0, l0, k0, ind_c, ind_t, B, P, S, indptr, cols, vals,
                      M, factor, V, inds, indi, indf, EIx, EIy, beams)
     _, l = uvw_lengths(C, X)  # noqa: E741
     f = f0 + k0 * (l.ravel() - l0)
@@ -172,12 +175,9 @@ def drx_numba(network, factor=1.0, tol=0.1, steps=10000, summary=0, update=False
     return X, f, l
 
 
-@guvectorize([(f8, i8, i8, i8, i8, i4[:], i4[:], f8[:, :], f8[:], f8[:], f8[:], i8[:], i8[:], f8[:, :], f8[:, :],
-               f8[:, :], i4[:], i4[:], f8[:], i8, f8[:], f8, f8[:, :], i4[:], i4[:], i4[:], f8[:], f8[:], i8, f8)],
-             '(),(),(),(),(),(m),(m),(n,p),(m),(m),(m),(a),(b),(n,p),(n,p),(n,p),(c),(c),(c),(),(n),(),(n,p),(k),(k),(k),(k),(k),()->()',
-             nopython=True, cache=True, target='parallel')
-def drx_solver_numba(tol, steps, summary, m, n, u, v, X, f0, l0, k0, ind_c, ind_t, B, P, S, rows, cols, vals, nv,
-                     M, factor, V, inds, indi, indf, EIx, EIy, beams, out):
+@jit(nogil=True, nopython=True, parallel=True, cache=True)
+def drx_solver_numba(tol, steps, summary, m, n, u, v, X, f0, l0, k0, ind_c, ind_t, B, P, S, indptr, cols, vals,
+                     M, factor, V, inds, indi, indf, EIx, EIy, beams):
     """Numba accelerated dynamic relaxation solver.
 
     Parameters
@@ -214,14 +214,12 @@ def drx_solver_numba(tol, steps, summary, m, n, u, v, X, f0, l0, k0, ind_c, ind_
         Nodal loads Px, Py, Pz.
     S : array
         Shear forces Sx, Sy, Sz.
-    rows : array
-        Edge adjacencies (rows).
+    indptr : array
+        Edge adjacencies (row pointers), such that the edges of vertex i are ``cols[indptr[i]:indptr[i + 1]]``.
     cols : array
         Edge adjacencies (columns).
     vals : array
         Edge adjacencies (values).
-    nv : int
-        Length of rows, cols and vals.
     M : array
         Mass matrix.
     factor : float
@@ -240,23 +238,28 @@ def drx_solver_numba(tol, steps, summary, m, n, u, v, X, f0, l0, k0, ind_c, ind_
         Nodal EIy flexural stiffnesses.
     beams : int
         Beam analysis on: 1 or off: 0.
+
+    Notes
+    -----
+    The loops over the edges and over the vertices run in parallel.
+    The resultant forces are gathered per vertex from the edge adjacencies in row order,
+    such that every vertex is only written by one thread.
+    The compiled solver is cached on disk, in the ``__pycache__`` folder of this module
+    or in the folder set by the ``NUMBA_CACHE_DIR`` environment variable.
     """
     f = zeros(m)
     fx = zeros(m)
     fy = zeros(m)
     fz = zeros(m)
-    frx = zeros(n)
-    fry = zeros(n)
-    frz = zeros(n)
     Rn = zeros(n)
     Una = zeros(n)
 
     res = 1000 * tol
-    ts, Uo = 0, 0
+    ts, Uo = 0, 0.0
 
     while (ts <= steps) and (res > tol):
 
-        for i in range(m):
+        for i in prange(m):
             xd = X[v[i], 0] - X[u[i], 0]
             yd = X[v[i], 1] - X[u[i], 1]
             zd = X[v[i], 2] - X[u[i], 2]
@@ -329,19 +332,18 @@ def drx_solver_numba(tol, steps, summary, m, n, u, v, X, f0, l0, k0, ind_c, ind_
                     S[indi[i], :] -= Sa + Sb
                     S[indf[i], :] += Sb
 
-        frx *= 0
-        fry *= 0
-        frz *= 0
-
-        for i in range(nv):
-            frx[rows[i]] += vals[i] * fx[cols[i]]
-            fry[rows[i]] += vals[i] * fy[cols[i]]
-            frz[rows[i]] += vals[i] * fz[cols[i]]
-
-        for i in range(n):
-            Rx = (P[i, 0] - S[i, 0] - frx[i]) * B[i, 0]
-            Ry = (P[i, 1] - S[i, 1] - fry[i]) * B[i, 1]
-            Rz = (P[i, 2] - S[i, 2] - frz[i]) * B[i, 2]
+        for i in prange(n):
+            frx = 0.0
+            fry = 0.0
+            frz = 0.0
+            for j in range(indptr[i], indptr[i + 1]):
+                frx += vals[j] * fx[cols[j]]
+                fry += vals[j] * fy[cols[j]]
+                frz += vals[j] * fz[cols[j]]
+
+            Rx = (P[i, 0] - S[i, 0] - frx) * B[i, 0]
+            Ry = (P[i, 1] - S[i, 1] - fry) * B[i, 1]
+            Rz = (P[i, 2] - S[i, 2] - frz) * B[i, 2]
             Rn[i] = sqrt(Rx**2 + Ry**2 + Rz**2)
 
             Mi = M[i] * factor
@@ -357,20 +359,13 @@ def drx_solver_numba(tol, steps, summary, m, n, u, v, X, f0, l0, k0, ind_c, ind_
         Uo = Un
 
         # X += V
-        for i in range(n):
+        for i in prange(n):
             X[i, 0] += V[i, 0]
             X[i, 1] += V[i, 1]
             X[i, 2] += V[i, 2]
 
         res = mean(Rn)
 
-        # # refresh
-        # if refresh:
-        #     if (ts % refresh == 0) or (res < tol):
-        #         print('Step:{0} Residual:{1:.3f}'.format(ts, res))
-        #         if callback:
-        #             callback(X, **kwargs)
-
         ts += 1
 
     if summary:
@@ -382,4 +377,44 @@ def drx_solver_numba(tol, steps, summary, m, n, u, v, X, f0, l0, k0, ind_c, ind_
 # ==============================================================================
 
 if __name__ == "__main__":
-    pass
+
+    # benchmark of drx_numpy and drx_numba on cable nets of increasing size
+    # the first call of drx_numba includes the compilation, or the loading of the cached compilation
+
+    from compas.datastructures import Network
+    from compas.numerical.drx.drx_numpy import drx_numpy
+
+    def cablenet(n):
+        network = Network()
+        network.update_default_node_attributes({'B': [1, 1, 1], 'P': [0, 0, -0.1]})
+        network.update_default_edge_attributes({'E': 10, 'A': 1, 'ct': 't', 'l0': None, 's0': 1})
+        for i in range(n):
+            for j in range(n):
+                key = network.add_node(i * n + j, x=i, y=j, z=0)
+                if i in (0, n - 1) or j in (0, n - 1):
+                    network.node_attribute(key, 'B', [0, 0, 0])
+        for i in range(n):
+            for j in range(n):
+                if i < n - 1:
+                    network.add_edge(i * n + j, (i + 1) * n + j)
+                if j < n - 1:
+                    network.add_edge(i * n + j, i * n + j + 1)
+        return network
+
+    for n in (10, 30, 100):
+        network = cablenet(n)
+
+        tic = time()
+        drx_numpy(network, tol=0.01, steps=1000, refresh=0)
+        t_numpy = time() - tic
+
+        tic = time()
+        drx_numba(network, tol=0.01, steps=1000)
+        t_first = time() - tic
+
+        tic = time()
+        drx_numba(network, tol=0.01, steps=1000)
+        t_numba = time() - tic
+
+        print('vertices: {0:>6}  drx_numpy: {1:.3f} s  drx_numba: {2:.3f} s (first call: {3:.3f} s)'.format(
+            n * n, t_numpy, t_numba, t_first))
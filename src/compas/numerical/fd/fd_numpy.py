@@ -2,15 +2,204 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from numpy import array_equal
 from numpy import asarray
-from scipy.sparse import diags
-from scipy.sparse.linalg import spsolve
+from numpy import bincount
+from numpy import concatenate
+from numpy import cumsum
+from numpy import tile
+from numpy import unique
+from scipy.sparse import csc_matrix
+from scipy.sparse import csr_matrix
 
 from compas.numerical import connectivity_matrix
 from compas.numerical import normrow
+from compas.numerical.linalg import _lufactorized_cached
 
 
-__all__ = ['fd_numpy']
+__all__ = ['fd_numpy', 'FDSolver']
+
+
+class FDSolver(object):
+    r"""Force density solver for repeated solutions of a network with a fixed topology.
+
+    The connectivity matrices and the sparsity pattern of the stiffness matrix
+    are computed once, when the solver is created.
+    The stiffness matrix is factorised again only when the force densities change,
+    and all load cases are solved with the same factorisation.
+
+    Parameters
+    ----------
+    vertices : list
+        XYZ coordinates of the vertices of the network.
+        The coordinates of the fixed vertices are the support positions.
+    edges : list
+        Edges between vertices represented by pairs of vertex indices.
+    fixed : list
+        Indices of fixed vertices.
+
+    Attributes
+    ----------
+    xyz : array
+        v x 3 coordinates of the vertices.
+    free : list
+        Indices of the free vertices.
+    fixed : list
+        Indices of the fixed vertices.
+    C : sparse matrix
+        m x v connectivity matrix of the network.
+    factorisations : int
+        The number of numerical factorisations of the stiffness matrix.
+
+    Notes
+    -----
+    The stiffness matrix :math:`\mathbf{C}_i^{\mathrm{T}} \mathbf{Q} \mathbf{C}_i` is linear in the force densities.
+    Its non-zero values are computed from the force densities with one sparse matrix product,
+    in the fixed sparsity pattern, such that the fill-reducing ordering of the first LU factorisation
+    can be reused by all later factorisations.
+
+    Examples
+    --------
+    >>> vertices = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [2.0, 0.0, 0.0]]
+    >>> solver = FDSolver(vertices, [(0, 1), (1, 2)], [0, 2])
+    >>> xyz, q, f, l, r = solver.solve([1.0, 1.0], [[0, 0, 0], [0, 0, -1.0], [0, 0, 0]])
+    >>> xyz[1]
+    array([ 1. ,  0. , -0.5])
+    >>> xyz, q, f, l, r = solver.solve([1.0, 1.0], [[[0, 0, 0], [0, 0, -1.0], [0, 0, 0]],
+    ...                                            [[0, 0, 0], [0, 0, -2.0], [0, 0, 0]]])
+    >>> xyz[:, 1, 2]
+    array([-0.5, -1. ])
+    >>> solver.factorisations
+    1
+
+    """
+
+    def __init__(self, vertices, edges, fixed):
+        self.xyz = asarray(vertices, dtype=float).reshape((-1, 3))
+        self.fixed = list(fixed)
+        self.free = sorted(set(range(len(self.xyz))) - set(self.fixed))
+        self.C = connectivity_matrix(edges, 'csr')
+        self.Ct = self.C.transpose().tocsr()
+        self.Ci = self.C[:, self.free]
+        self.Cf = self.C[:, self.fixed]
+        self.Cit = self.Ci.transpose().tocsr()
+        self.factorisations = 0
+        self._assemble_pattern()
+        self._q = None
+        self._solve = None
+        self._order = None
+
+    def _assemble_pattern(self):
+        # every row of Ci has at most two entries, one per free end of the edge
+        # each entry contributes to a diagonal entry of the stiffness matrix
+        # each pair of entries in the same row contributes to two off-diagonal entries
+        m, n = self.Ci.shape
+        Ci = self.Ci.tocoo()
+        order = Ci.row.argsort(kind='mergesort')
+        e, c, v = Ci.row[order], Ci.col[order], Ci.data[order]
+        pair = (e[:-1] == e[1:]).nonzero()[0]
+        rows = concatenate([c, c[pair], c[pair + 1]])
+        cols = concatenate([c, c[pair + 1], c[pair]])
+        vals = concatenate([v * v, v[pair] * v[pair + 1], v[pair] * v[pair + 1]])
+        edges = concatenate([e, e[pair], e[pair]])
+        # column-major keys sort like the entries of a canonical csc matrix
+        keys, index = unique(cols * n + rows, return_inverse=True)
+        self._indices = keys % n
+        self._indptr = concatenate([[0], cumsum(bincount(keys // n, minlength=n))])
+        self._assembly = csr_matrix((vals, (index, edges)), shape=(len(keys), m))
+
+    def stiffness_matrix(self, q):
+        """Compute the stiffness matrix of the free vertices for given force densities.
+
+        Parameters
+        ----------
+        q : list
+            Force density of edges.
+
+        Returns
+        -------
+        sparse matrix
+            The n x n stiffness matrix in CSC format, with n the number of free vertices.
+        """
+        q = asarray(q, dtype=float).ravel()
+        n = len(self.free)
+        return csc_matrix((self._assembly.dot(q), self._indices, self._indptr), shape=(n, n))
+
+    def factorize(self, q):
+        """Factorise the stiffness matrix, if the force densities changed since the last factorisation.
+
+        Parameters
+        ----------
+        q : list
+            Force density of edges.
+
+        Returns
+        -------
+        bool
+            ``True`` if the stiffness matrix was factorised, ``False`` if the existing factorisation is still valid.
+        """
+        q = asarray(q, dtype=float).ravel()
+        if self._q is not None and array_equal(q, self._q):
+            return False
+        self._solve, self._order = _lufactorized_cached(self.stiffness_matrix(q), self._order)
+        self._q = q.copy()
+        self.factorisations += 1
+        return True
+
+    def solve(self, q, loads):
+        """Compute the equilibrium geometry for given force densities and one or more load cases.
+
+        Parameters
+        ----------
+        q : list
+            Force density of edges.
+        loads : list
+            XYZ components of the loads on the vertices, as v x 3 values,
+            or k x v x 3 values for k load cases.
+
+        Returns
+        -------
+        xyz : array
+            XYZ coordinates of the equilibrium geometry.
+        q : array
+            Force densities in the edges.
+        f : array
+            Forces in the edges.
+        l : array
+            Lengths of the edges
+        r : array
+            Residual forces.
+
+        Notes
+        -----
+        For k load cases, the returned arrays have an additional leading dimension of size k.
+        All load cases are solved at once, with the same factorisation.
+        """
+        v = len(self.xyz)
+        p = asarray(loads, dtype=float)
+        single = p.ndim < 3
+        p = p.reshape((-1, v, 3))
+        k = len(p)
+        self.factorize(q)
+        q = self._q.reshape((-1, 1)).copy()
+        m = len(q)
+
+        xyz = self.xyz[None, :, :].repeat(k, axis=0)
+        if self.free:
+            # the loads of all cases as columns of one right-hand side
+            b = p[:, self.free, :].transpose(1, 0, 2).reshape((-1, 3 * k))
+            b -= tile(self.Cit.dot(q * self.Cf.dot(self.xyz[self.fixed])), (1, k))
+            xyz[:, self.free, :] = self._solve(b).reshape((-1, k, 3)).transpose(1, 0, 2)
+
+        X = xyz.transpose(1, 0, 2).reshape((v, 3 * k))
+        U = self.C.dot(X)
+        l = normrow(U.reshape((m * k, 3))).reshape((m, k)).T[:, :, None]  # noqa: E741
+        f = q[None, :, :] * l
+        r = p - self.Ct.dot(q * U).reshape((v, k, 3)).transpose(1, 0, 2)
+
+        if single:
+            return xyz[0], q, f[0], l[0], r[0]
+        return xyz, q, f, l, r
 
 
 def fd_numpy(vertices, edges, fixed, q, loads, **kwargs):
@@ -46,6 +235,9 @@ def fd_numpy(vertices, edges, fixed, q, loads, **kwargs):
     -----
     For more info, see [1]_
 
+    For many solutions of the same network, with different force densities or loads,
+    use :class:`FDSolver` instead.
+
     References
     ----------
     .. [1] Schek H., *The Force Density Method for Form Finding and Computation of General Networks*,
@@ -56,27 +248,8 @@ def fd_numpy(vertices, edges, fixed, q, loads, **kwargs):
     >>>
 
     """
-    v = len(vertices)
-    free = list(set(range(v)) - set(fixed))
-    xyz = asarray(vertices, dtype=float).reshape((-1, 3))
-    q = asarray(q, dtype=float).reshape((-1, 1))
-    p = asarray(loads, dtype=float).reshape((-1, 3))
-    C = connectivity_matrix(edges, 'csr')
-    Ci = C[:, free]
-    Cf = C[:, fixed]
-    Ct = C.transpose()
-    Cit = Ci.transpose()
-    Q = diags([q.flatten()], [0])
-    A = Cit.dot(Q).dot(Ci)
-    b = p[free] - Cit.dot(Q).dot(Cf).dot(xyz[fixed])
-
-    xyz[free] = spsolve(A, b)
-
-    l = normrow(C.dot(xyz))  # noqa: E741
-    f = q * l
-    r = p - Ct.dot(Q).dot(C).dot(xyz)
-
-    return xyz, q, f, l, r
+    solver = FDSolver(vertices, edges, fixed)
+    return solver.solve(q, asarray(loads, dtype=float).reshape((-1, 3)))
 
 
 # ==============================================================================
@@ -7,6 +7,14 @@ import random
 import json
 import copy
 
+from itertools import chain
+from itertools import compress
+
+from compas.numerical._parallel import Objective
+from compas.numerical._parallel import close_pool
+from compas.numerical._parallel import evaluate
+from compas.numerical._parallel import open_pool
+
 
 __all__ = ['ga']
 
@@ -43,7 +51,11 @@ def ga(fit_function,
        fkwargs=None,
        output_path=None,
        input_path=None,
-       print_refresh=1):
+       print_refresh=1,
+       pool=None,
+       workers=None,
+       checkpoint_interval=1,
+       write_files=True):
     """Genetic Algorithm optimisation.
 
     Parameters
@@ -98,6 +110,20 @@ def ga(fit_function,
         Path to the fitness function file.
     print_refresh : int
         Print current generation summary every ``print_refresh`` generations.
+    pool : {None, 'threads', 'processes'} or object, optional [None]
+        Evaluate the fitness of the individuals of a generation in parallel,
+        in a new pool of threads or processes, or in an existing pool with a ``map`` method.
+        For a pool of processes, the fitness function and its arguments have to be picklable.
+    workers : int, optional [None]
+        The number of workers of a new pool.
+        If None is given, the number of CPUs is used.
+    checkpoint_interval : int, optional [1]
+        The number of generations between checkpoints of the population.
+        At every checkpoint, the population is stored in ``GA.checkpoint``
+        and, if ``write_files`` is True, written to a population file.
+        The last generation is always checkpointed.
+    write_files : bool, optional [True]
+        Write the optimisation data and the population files to ``output_path``.
 
     Returns
     -------
@@ -141,6 +167,10 @@ def ga(fit_function,
     ga_.output_path = output_path or ''
     ga_.input_path = input_path or ''
     ga_.print_refresh = print_refresh
+    ga_.pool = pool
+    ga_.workers = workers
+    ga_.checkpoint_interval = checkpoint_interval
+    ga_.write_files = write_files
     ga_.ga_optimize()
     return ga_
 
@@ -219,6 +249,18 @@ class GA(object):
     ind_fit_dict : dict
         This dictionary keeps track of already evaluated solutions to avoid dupplicate
         fitness function calls.
+    pool : {None, 'threads', 'processes'} or object
+        The pool used to evaluate the fitness of the individuals of a generation in parallel.
+    workers : int
+        The number of workers of a new pool.
+    checkpoint_interval : int
+        The number of generations between checkpoints of the population.
+    checkpoint : dict
+        The binary population and the fitness values of the last checkpoint,
+        and its generation number. If ``GA.start_from_gen`` is the generation
+        of this checkpoint, the GA restarts from it instead of from a population file.
+    write_files : bool
+        Write the optimisation data and the population files to ``GA.output_path``.
 
     """
 
@@ -256,6 +298,12 @@ class GA(object):
         self.check_diversity = False
         self.ind_fit_dict = {}
         self.print_refresh = 1
+        self.pool = None
+        self.workers = None
+        self.checkpoint_interval = 1
+        self.checkpoint = None
+        self.write_files = True
+        self._pool = None
 
     def __str__(self):
         """Compile a summary of the GA."""
@@ -279,14 +327,26 @@ class GA(object):
         """ This is the main optimization function, this function permorms the GA optimization,
         performing all genetic operators.
         """
-        self.write_ga_json_file()
+        self._pool, owned = open_pool(self.pool, self.workers)
+        try:
+            self._ga_optimize()
+        finally:
+            close_pool(self._pool, owned)
+            self._pool = None
+
+    def _ga_optimize(self):
+        if self.write_files:
+            self.write_ga_json_file()
 
         if self.num_pop_init:
             self.num_pop_temp = copy.deepcopy(self.num_pop)
             self.num_pop = self.num_pop_init
 
         if self.start_from_gen:
-            self.current_pop = self.get_pop_from_pop_file(self.start_from_gen)
+            if self.checkpoint and self.checkpoint['generation'] == self.start_from_gen:
+                self.current_pop = self.get_pop_from_checkpoint()
+            else:
+                self.current_pop = self.get_pop_from_pop_file(self.start_from_gen)
             start_gen_number = self.start_from_gen + 1
         else:
             self.current_pop['binary'] = self.generate_random_bin_pop()
@@ -303,24 +363,26 @@ class GA(object):
             else:
                 num = self.num_pop - self.num_elite
 
-            for i in range(num):
-                self.current_pop['fit_value'][i] = self.evaluate_fitness(i)
+            self.current_pop['fit_value'][:num] = self.evaluate_population(range(num))
 
             if self.num_pop_init and generation >= self.num_gen_init_pop:
                 self.num_pop = self.num_pop_temp
                 self.current_pop = self.select_elite_pop(self.current_pop, num_elite=self.num_pop)
-            self.write_out_file(generation)
 
             if self.min_fit:
                 self.update_min_fit_flag()
             else:
                 self.get_best_fit()
+            last = generation == self.num_gen - 1 or self.min_fit_flag
+            if last or (self.checkpoint_interval and generation % self.checkpoint_interval == 0):
+                self.make_checkpoint(generation)
+
             if generation % self.print_refresh == 0:
                 print('generation ', generation, ' best fit ', self.best_fit, 'min fit', self.min_fit)
 
             if self.check_diversity:
                 print('num repeated individuals', self.check_pop_diversity())
-            if generation < self.num_gen - 1 and self.min_fit_flag is False:
+            if not last:
                 self.elite_pop = self.select_elite_pop(self.current_pop)
                 self.tournament_selection()  # n-e
                 self.create_mating_pool()  # n-e
@@ -331,18 +393,61 @@ class GA(object):
             else:
                 self.end_gen = generation
                 self.get_best_individual_index()
-                self.write_ga_json_file()
+                if self.write_files:
+                    self.write_ga_json_file()
                 print(self)
                 break
 
+    def chromosome_key(self, index):
+        """Returns a hashable representation of the chromosome of an individual of the current population.
+
+        Parameters
+        ----------
+        index: int
+            The index of the individual.
+
+        Returns
+        -------
+        key: tuple
+            The genes of the individual.
+        """
+        return tuple(chain.from_iterable(self.current_pop['binary'][index]))
+
     def evaluate_fitness(self, index):
-        chromo = ''.join(str(y) for x in self.current_pop['binary'][index] for y in x)
-        fit = self.ind_fit_dict.setdefault(chromo, None)
-        if not fit:
+        chromo = self.chromosome_key(index)
+        fit = self.ind_fit_dict.get(chromo)
+        if fit is None:
             fit = self.fit_function(self.current_pop['scaled'][index], *self.fargs, **self.fkwargs)
             self.ind_fit_dict[chromo] = fit
         return fit
 
+    def evaluate_population(self, indices):
+        """Evaluates the fitness of multiple individuals of the current population in one batch.
+        Individuals that have already been evaluated are taken from ``GA.ind_fit_dict``.
+        The others are evaluated in the pool of the GA, if any.
+
+        Parameters
+        ----------
+        indices: list
+            The indices of the individuals.
+
+        Returns
+        -------
+        fit_values: list
+            The fitness values of the individuals.
+        """
+        keys = [self.chromosome_key(index) for index in indices]
+        todo = {}
+        for index, key in zip(indices, keys):
+            if key not in todo and self.ind_fit_dict.get(key) is None:
+                todo[key] = index
+        todo = list(todo.items())
+        objective = Objective(self.fit_function, self.fargs, self.fkwargs)
+        values = evaluate(objective, [self.current_pop['scaled'][index] for _, index in todo], self._pool)
+        for (key, _), fit in zip(todo, values):
+            self.ind_fit_dict[key] = fit
+        return [self.ind_fit_dict[key] for key in keys]
+
     def check_pop_diversity(self):
         seen = []
         all_ = []
@@ -365,16 +470,8 @@ class GA(object):
         decoded_pop:
             The decoded population list.
         """
-        decoded_pop = [[[]] * self.num_var for i in range(self.num_pop)]
-        for j in range(self.num_pop):
-            for i in range(self.num_var):
-                value = 0
-                chrom = bin_pop[j][i]
-                for u, gene in enumerate(chrom):
-                    if gene == 1:
-                        value = value + 2**u
-                decoded_pop[j][i] = value
-        return decoded_pop
+        weights = [[2 ** u for u in range(self.num_bin_dig[i])] for i in range(self.num_var)]
+        return [[sum(compress(weights[i], bin_pop[j][i])) for i in range(self.num_var)] for j in range(self.num_pop)]
 
     def generate_random_bin_pop(self):
         """ Generates random binary population of ``GA.num_pop`` size.
@@ -404,12 +501,8 @@ class GA(object):
         scaled_pop: list
             The scaled ppopulation list.
         """
-        scaled_pop = [[[]] * self.num_var for i in range(self.num_pop)]
-        for j in range(self.num_pop):
-            for i in range(self.num_var):
-                maxbin = float((2 ** self.num_bin_dig[i]) - 1)
-                scaled_pop[j][i] = self.boundaries[i][0] + (self.boundaries[i][1] - self.boundaries[i][0]) * decoded_pop[j][i] / maxbin
-        return scaled_pop
+        scales = [(self.boundaries[i][0], self.boundaries[i][1] - self.boundaries[i][0], float((2 ** self.num_bin_dig[i]) - 1)) for i in range(self.num_var)]
+        return [[lb + d * decoded_pop[j][i] / maxbin for i, (lb, d, maxbin) in enumerate(scales)] for j in range(self.num_pop)]
 
     def tournament_selection(self):
         """Performs the tournament selection operator on the current population.
@@ -685,6 +778,37 @@ class GA(object):
         pf_file.write('\n')
         pf_file.close()
 
+    def make_checkpoint(self, generation):
+        """Stores the binary population and the fitness values of a generation in ``GA.checkpoint``
+        and, if ``GA.write_files`` is True, writes the population file of the generation.
+
+        Parameters
+        ----------
+        generation: int
+            The generation number.
+        """
+        self.checkpoint = {'generation': generation,
+                           'num_pop': self.num_pop,
+                           'binary': [[list(variable) for variable in individual] for individual in self.current_pop['binary']],
+                           'fit_value': list(self.current_pop['fit_value'])}
+        if self.write_files:
+            self.write_out_file(generation)
+
+    def get_pop_from_checkpoint(self):
+        """Returns the population stored in ``GA.checkpoint``.
+
+        Returns
+        -------
+        pop: dict
+            The population dictionary of the checkpoint.
+        """
+        self.num_pop = self.checkpoint['num_pop']
+        pop = {'binary': [[list(variable) for variable in individual] for individual in self.checkpoint['binary']],
+               'fit_value': list(self.checkpoint['fit_value'])}
+        pop['decoded'] = self.decode_binary_pop(pop['binary'])
+        pop['scaled'] = self.scale_population(pop['decoded'])
+        return pop
+
     def add_elite_to_current(self):
         """Adds the elite population to the current population dictionary.
         """
@@ -6,6 +6,14 @@ import re
 import random
 import json
 
+from itertools import chain
+from itertools import compress
+
+from compas.numerical._parallel import Objective
+from compas.numerical._parallel import close_pool
+from compas.numerical._parallel import evaluate
+from compas.numerical._parallel import open_pool
+
 
 __all__ = ['moga']
 
@@ -45,7 +53,11 @@ def moga(fit_functions,
          fit_names=None,
          fargs=None,
          fkwargs=None,
-         output_path=None):
+         output_path=None,
+         pool=None,
+         workers=None,
+         checkpoint_interval=1,
+         write_files=True):
     """Multi-objective Genetic Algorithm optimisation.
 
     Parameters
@@ -85,6 +97,20 @@ def moga(fit_functions,
         Keyword arguments to be fed to the fitness function.
     output_path : str, optional [None]
         Path for the optimization result files.
+    pool : {None, 'threads', 'processes'} or object, optional [None]
+        Evaluate the fitness of the individuals of a generation in parallel,
+        in a new pool of threads or processes, or in an existing pool with a ``map`` method.
+        For a pool of processes, the fitness functions and their arguments have to be picklable.
+    workers : int, optional [None]
+        The number of workers of a new pool.
+        If None is given, the number of CPUs is used.
+    checkpoint_interval : int, optional [1]
+        The number of generations between checkpoints of the parent population.
+        At every checkpoint, the parent population is stored in ``MOGA.checkpoint``
+        and, if ``write_files`` is True, written to a Pareto front file.
+        The last generation is always checkpointed.
+    write_files : bool, optional [True]
+        Write the optimisation data and the Pareto front files to ``output_path``.
 
     Returns
     -------
@@ -185,10 +211,19 @@ def moga(fit_functions,
     moga.fit_functions = fit_functions
     moga.output_path = output_path or ''
     moga.num_fit_func = len(fit_functions)
+    moga.pool = pool
+    moga.workers = workers
+    moga.checkpoint_interval = checkpoint_interval
+    moga.write_files = write_files
     moga.moga_optimize()
     return moga
 
 
+def _fit_values(x, fit_functions, fkwargs):
+    # the values of all fitness functions for one individual
+    return [fit_func(x, **fkwargs) for fit_func in fit_functions]
+
+
 class MOGA(object):
     """This class contains a binary coded, multiple objective genetic algorithm called
     NSGA-II [deb2001]_. NSGA-II uses the concept of non-domination (Pareto-domination) to
@@ -258,6 +293,18 @@ class MOGA(object):
     ind_fit_dict : dict
         This dictionary keeps track of already evaluated solutions to avoid dupplicate
         fitness function calls.
+    pool : {None, 'threads', 'processes'} or object
+        The pool used to evaluate the fitness of the individuals of a generation in parallel.
+    workers : int
+        The number of workers of a new pool.
+    checkpoint_interval : int
+        The number of generations between checkpoints of the parent population.
+    checkpoint : dict
+        The binary parent population, its fitness values and Pareto front levels at the last checkpoint,
+        and its generation number. If ``MOGA.start_from_gen`` is the generation
+        of this checkpoint, the MOGA restarts from it instead of from a Pareto front file.
+    write_files : bool
+        Write the optimisation data and the Pareto front files to ``MOGA.output_path``.
     """
 
     def __init__(self):
@@ -294,6 +341,12 @@ class MOGA(object):
         self.fargs = {}
         self.fkwargs = {}
         self.ind_fit_dict = {}
+        self.pool = None
+        self.workers = None
+        self.checkpoint_interval = 1
+        self.checkpoint = None
+        self.write_files = True
+        self._pool = None
 
     def __str__(self):
         """Compile a summary of the MOGA."""
@@ -319,9 +372,21 @@ class MOGA(object):
         """This is the main optimization function, this function permorms the multi objective
         GA optimization, performing all genetic operators.
         """
-        self.write_moga_json_file()
+        self._pool, owned = open_pool(self.pool, self.workers)
+        try:
+            self._moga_optimize()
+        finally:
+            close_pool(self._pool, owned)
+            self._pool = None
+
+    def _moga_optimize(self):
+        if self.write_files:
+            self.write_moga_json_file()
         if self.start_from_gen:
-            self.parent_pop = self.get_pop_from_pf_file()
+            if self.checkpoint and self.checkpoint['generation'] == self.start_from_gen:
+                self.parent_pop = self.get_pop_from_checkpoint()
+            else:
+                self.parent_pop = self.get_pop_from_pf_file()
             start_gen_number = self.start_from_gen + 1
         else:
             start_gen_number = 0
@@ -334,11 +399,7 @@ class MOGA(object):
                     self.parent_pop['binary'][i] = self.fixed_start_pop['binary'][i]
                     self.parent_pop['decoded'][i] = self.fixed_start_pop['decoded'][i]
                     self.parent_pop['scaled'][i] = self.fixed_start_pop['scaled'][i]
-            self.parent_pop['fit_values'] = [[[]] * self.num_fit_func for i in range(self.num_pop)]
-            for i in range(self.num_pop):
-                for j in range(self.num_fit_func):
-                    fit_func = self.fit_functions[j]
-                    self.parent_pop['fit_values'][i][j] = fit_func(self.parent_pop['scaled'][i], **self.fkwargs)
+            self.parent_pop['fit_values'] = self.evaluate_population(self.parent_pop)
 
         self.current_pop['binary'] = self.generate_random_bin_pop()
 
@@ -347,11 +408,7 @@ class MOGA(object):
 
             self.current_pop['decoded'] = self.decode_binary_pop(self.current_pop['binary'])
             self.current_pop['scaled'] = self.scale_population(self.current_pop['decoded'])
-            self.current_pop['fit_values'] = [[[]] * self.num_fit_func for i in range(self.num_pop)]
-            for i in range(self.num_pop):
-                for j in range(self.num_fit_func):
-                    fit_func = self.fit_functions[j]
-                    self.current_pop['fit_values'][i][j] = fit_func(self.current_pop['scaled'][i], **self.fkwargs)
+            self.current_pop['fit_values'] = self.evaluate_population(self.current_pop)
 
             self.combine_populations()
             self.non_dom_sort()
@@ -362,9 +419,11 @@ class MOGA(object):
 
             self.crowding_distance_sorting()
             self.parent_reseting()
-            self.write_out_file(generation)
+            last = generation == self.num_gen - 1
+            if last or (self.checkpoint_interval and generation % self.checkpoint_interval == 0):
+                self.make_checkpoint(generation)
 
-            if generation < self.num_gen - 1:
+            if not last:
                 self.nsga_tournament()
                 self.create_mating_pool()
                 self.simple_crossover()
@@ -373,12 +432,73 @@ class MOGA(object):
                 print(self)
 
     def evaluate_fitness(self, index, fit_func):
-        chromo = ''.join(str(y) for x in self.current_pop['binary'][index] for y in x)
-        fit = self.ind_fit_dict.setdefault(chromo, None)
-        if not fit:
-            fit = fit_func(self.current_pop['scaled'][index], *self.fargs, **self.fkwargs)
-            self.ind_fit_dict[chromo] = fit
-        return fit
+        chromo = tuple(chain.from_iterable(self.current_pop['binary'][index]))
+        values = self.ind_fit_dict.setdefault(chromo, [None] * self.num_fit_func)
+        j = self.fit_functions.index(fit_func)
+        if values[j] is None:
+            values[j] = fit_func(self.current_pop['scaled'][index], *self.fargs, **self.fkwargs)
+        return values[j]
+
+    def evaluate_population(self, pop):
+        """Evaluates all fitness functions for all individuals of a population in one batch.
+        Individuals that have already been evaluated are taken from ``MOGA.ind_fit_dict``.
+        The others are evaluated in the pool of the MOGA, if any.
+
+        Parameters
+        ----------
+        pop: dict
+            The population dictionary, with binary and scaled individuals.
+
+        Returns
+        -------
+        fit_values: list
+            The fitness values of every individual.
+        """
+        keys = [tuple(chain.from_iterable(individual)) for individual in pop['binary']]
+        todo = {}
+        for index, key in enumerate(keys):
+            if key not in todo:
+                values = self.ind_fit_dict.get(key)
+                if values is None or None in values:
+                    todo[key] = index
+        todo = list(todo.items())
+        objective = Objective(_fit_values, (self.fit_functions, self.fkwargs))
+        values = evaluate(objective, [pop['scaled'][index] for _, index in todo], self._pool)
+        for (key, _), fit_values in zip(todo, values):
+            self.ind_fit_dict[key] = fit_values
+        return [list(self.ind_fit_dict[key]) for key in keys]
+
+    def make_checkpoint(self, generation):
+        """Stores the binary parent population, its fitness values and Pareto front levels
+        in ``MOGA.checkpoint`` and, if ``MOGA.write_files`` is True, writes the Pareto front file
+        of the generation.
+
+        Parameters
+        ----------
+        generation: int
+            The generation number.
+        """
+        self.checkpoint = {'generation': generation,
+                           'binary': [[list(variable) for variable in individual] for individual in self.parent_pop['binary']],
+                           'fit_values': [list(values) for values in self.parent_pop['fit_values']],
+                           'pf': dict(self.parent_pop['pf'])}
+        if self.write_files:
+            self.write_out_file(generation)
+
+    def get_pop_from_checkpoint(self):
+        """Returns the parent population stored in ``MOGA.checkpoint``.
+
+        Returns
+        -------
+        pop: dict
+            The population dictionary of the checkpoint.
+        """
+        pop = {'binary': [[list(variable) for variable in individual] for individual in self.checkpoint['binary']],
+               'fit_values': [list(values) for values in self.checkpoint['fit_values']],
+               'pf': dict(self.checkpoint['pf'])}
+        pop['decoded'] = self.decode_binary_pop(pop['binary'])
+        pop['scaled'] = self.scale_population(pop['decoded'])
+        return pop
 
     def write_out_file(self, generation):
         """This function writes a file containing all of the population data for
@@ -390,7 +510,7 @@ class MOGA(object):
             The generation to write the population data of.
         """
         filename = 'generation ' + "%03d" % generation + '_pareto_front' + ".pareto"
-        pf_file = open(self.output_path + (str(filename)), "wb")
+        pf_file = open(self.output_path + (str(filename)), "w")
         pf_file.write('Generation \n')
         pf_file.write(str(generation) + '\n')
         pf_file.write('\n')
@@ -455,17 +575,8 @@ class MOGA(object):
         decoded_pop: dict
             The decoded population dictionary.
         """
-        decoded_pop = [[[]] * self.num_var for i in range(self.num_pop)]
-        for j in range(len(bin_pop)):
-            decoded_pop[j] = {}
-            for i in range(self.num_var):
-                value = 0
-                chrom = bin_pop[j][i]
-                for u, gene in enumerate(chrom):
-                    if gene == 1:
-                        value = value + 2**u
-                decoded_pop[j][i] = value
-        return decoded_pop
+        weights = [[2 ** u for u in range(self.num_bin_dig[i])] for i in range(self.num_var)]
+        return [{i: sum(compress(weights[i], bin_pop[j][i])) for i in range(self.num_var)} for j in range(len(bin_pop))]
 
     def scale_population(self, decoded_pop):
         """Scales the decoded population, variable values are scaled according to each
@@ -481,12 +592,8 @@ class MOGA(object):
         scaled_pop: list
             The scaled ppopulation list.
         """
-        scaled_pop = [[[]] * self.num_var for i in range(self.num_pop)]
-        for j in range(self.num_pop):
-            for i in range(self.num_var):
-                maxbin = (2 ** self.num_bin_dig[i]) - 1
-                scaled_pop[j][i] = decoded_pop[j][i] * (self.boundaries[i][1] - self.boundaries[i][0]) / float((maxbin + self.boundaries[i][0]))
-        return scaled_pop
+        scales = [(self.boundaries[i][1] - self.boundaries[i][0], float((2 ** self.num_bin_dig[i]) - 1 + self.boundaries[i][0])) for i in range(self.num_var)]
+        return [[decoded_pop[j][i] * d / maxbin for i, (d, maxbin) in enumerate(scales)] for j in range(self.num_pop)]
 
     def combine_populations(self):
         """This function combines the parent population with the current population
@@ -978,7 +1085,7 @@ class MOGA(object):
         for name in self.fit_names:
             filename += name + '-'
         filename += '.json'
-        with open(self.output_path + filename, 'wb+') as fh:
+        with open(self.output_path + filename, 'w') as fh:
             json.dump(data, fh)
 
     def write_gen_json_file(self, generation):
@@ -994,8 +1101,8 @@ class MOGA(object):
         """
         data = self.make_gen_data()
         filename = 'generation ' + "%03d" % generation + '_pareto_front' + ".json"
-        fh = open(self.output_path + filename, 'wb+')
-        json.dump(data, fh)
+        with open(self.output_path + filename, 'w') as fh:
+            json.dump(data, fh)
 
     def create_fixed_start_pop(self, scaled=None, binary=None):
         """This function creates a population to start the MOGA from a given scaled
@@ -7,8 +7,14 @@ from numpy import meshgrid
 from numpy import linspace
 from numpy import amax
 from numpy import amin
-from scipy.interpolate import griddata
+from numpy import concatenate
+from numpy import nanmax
+from numpy import nanmin
+from numpy import rint
+from scipy.interpolate import CloughTocher2DInterpolator
+from scipy.spatial import Delaunay
 import matplotlib.pyplot as plt
+from matplotlib.ticker import MaxNLocator
 
 
 __all__ = [
@@ -32,7 +38,7 @@ __all__ = [
 # ==============================================================================
 
 
-def scalarfield_contours_numpy(xy, s, levels=50, density=100):
+def scalarfield_contours_numpy(xy, s, levels=50, density=100, tiles=None, triangulation=None):
     r"""Compute the contour lines of a scalarfield.
 
     Parameters
@@ -41,9 +47,22 @@ def scalarfield_contours_numpy(xy, s, levels=50, density=100):
         The xy-coordinates at which the scalar field is defined.
     s : array-like
         The values of the scalar field.
-    levels : int, optional
-        The number of contour lines to compute.
+    levels : int or array-like, optional
+        The number of contour lines to compute, or the values of the contour lines.
         Default is ``50``.
+    density : int, optional
+        Half the number of grid points per direction used for the interpolation of the scalar field.
+        Default is ``100``.
+    tiles : int, optional
+        Split the interpolation grid in ``tiles`` x ``tiles`` blocks,
+        which are interpolated and contoured one at a time,
+        and stitch the contour lines of the blocks together.
+        Default is ``None``, in which case the whole grid is processed at once.
+    triangulation : :class:`scipy.spatial.Delaunay`, optional
+        A triangulation of ``xy``, for example ``Delaunay(xy)``.
+        Pass the same triangulation to contour several scalar fields on the same points
+        without triangulating the points again.
+        Default is ``None``, in which case the points are triangulated here.
 
     Returns
     -------
@@ -59,6 +78,13 @@ def scalarfield_contours_numpy(xy, s, levels=50, density=100):
     The computation of the contour lines is based on the `contours function`_
     available through matplotlib.
 
+    The scalar field is interpolated on a regular grid with a piecewise cubic interpolant,
+    as with :func:`scipy.interpolate.griddata`.
+    With ``tiles``, only one block of the grid is in memory at a time.
+    If ``levels`` is a number, the values of the contour lines are then based on the range of ``s``,
+    instead of on the range of the interpolated values,
+    and every stitched contour line is returned as a path with one polygon.
+
     Examples
     --------
     .. code-block:: python
@@ -90,13 +116,21 @@ def scalarfield_contours_numpy(xy, s, levels=50, density=100):
     .. _contours function: http://matplotlib.org/api/_as_gen/matplotlib.axes.Axes.contour.html#matplotlib.axes.Axes.contour
 
     """
-    xy = asarray(xy)
-    s = asarray(s)
+    xy = asarray(xy, dtype=float)
+    s = asarray(s, dtype=float)
     x = xy[:, 0]
     y = xy[:, 1]
-    X, Y = meshgrid(linspace(amin(x), amax(x), 2 * density),
-                    linspace(amin(y), amax(y), 2 * density))
-    S = griddata((x, y), s, (X, Y), method='cubic')
+    if triangulation is None:
+        triangulation = Delaunay(xy[:, :2])
+    interpolate = CloughTocher2DInterpolator(triangulation, s)
+    gx = linspace(amin(x), amax(x), 2 * density)
+    gy = linspace(amin(y), amax(y), 2 * density)
+
+    if tiles:
+        return _scalarfield_contours_tiled(interpolate, gx, gy, s, levels, tiles)
+
+    X, Y = meshgrid(gx, gy)
+    S = interpolate((X, Y))
 
     fig = plt.figure()
     ax = fig.add_subplot(111, aspect='equal')
@@ -120,6 +154,88 @@ def scalarfield_contours_numpy(xy, s, levels=50, density=100):
     return levels, contours
 
 
+def _scalarfield_contours_tiled(interpolate, gx, gy, s, levels, tiles):
+    # the levels have to be the same in every tile
+    if not hasattr(levels, '__len__'):
+        smin = nanmin(s)
+        smax = nanmax(s)
+        levels = MaxNLocator(levels + 1, min_n_ticks=1).tick_values(smin, smax)
+        inside = (levels > smin) & (levels < smax)
+        levels = levels[inside] if inside.any() else asarray([smin])
+    levels = asarray(levels, dtype=float)
+
+    # neighbouring tiles share a row or column of grid points,
+    # such that the contour lines of both tiles end in the same points
+    bx = linspace(0, len(gx) - 1, tiles + 1).astype(int)
+    by = linspace(0, len(gy) - 1, tiles + 1).astype(int)
+    segments = [[] for _ in levels]
+
+    fig = plt.figure()
+    ax = fig.add_subplot(111, aspect='equal')
+
+    for i in range(tiles):
+        for j in range(tiles):
+            X, Y = meshgrid(gx[bx[i]:bx[i + 1] + 1], gy[by[j]:by[j + 1] + 1])
+            S = interpolate((X, Y))
+            if not (S == S).any():
+                continue
+            smin = nanmin(S)
+            smax = nanmax(S)
+            if not ((levels >= smin) & (levels <= smax)).any():
+                continue
+            c = ax.contour(X, Y, S, levels)
+            for level, lines in zip(c.levels, c.allsegs):
+                index = int((levels == level).nonzero()[0][0])
+                segments[index].extend(line for line in lines if len(line) > 1)
+            ax.cla()
+
+    plt.close(fig)
+
+    tol = 1e-9 * max(gx[-1] - gx[0], gy[-1] - gy[0], 1.0)
+    contours = [[[polyline] for polyline in _stitch_polylines(lines, tol)] for lines in segments]
+    return levels, contours
+
+
+def _stitch_polylines(polylines, tol):
+    # join polylines of which the end points coincide
+    def key(point):
+        return tuple(rint(point / tol).astype(int).tolist())
+
+    ends = {}
+    for index, polyline in enumerate(polylines):
+        ends.setdefault(key(polyline[0]), []).append(index)
+        ends.setdefault(key(polyline[-1]), []).append(index)
+
+    def extend(chain, visited):
+        # keep appending the unvisited polylines that start or end at the last point of the chain
+        while True:
+            tail = chain[-1][-1]
+            for index in ends.get(key(tail), []):
+                if index not in visited:
+                    break
+            else:
+                return
+            visited.add(index)
+            polyline = polylines[index]
+            if key(polyline[0]) != key(tail):
+                polyline = polyline[::-1]
+            chain.append(polyline[1:])
+
+    stitched = []
+    visited = set()
+    for index, polyline in enumerate(polylines):
+        if index in visited:
+            continue
+        visited.add(index)
+        forward = [polyline]
+        extend(forward, visited)
+        backward = [polyline[::-1]]
+        extend(backward, visited)
+        parts = [part[::-1] for part in backward[:0:-1]] + forward
+        stitched.append(concatenate(parts, axis=0))
+    return stitched
+
+
 # ==============================================================================
 # Main
 # ==============================================================================
@@ -4,10 +4,15 @@ from __future__ import print_function
 
 from subprocess import Popen
 import sys
+import threading
 
-from functools import wraps
+from collections import namedtuple
+from collections import OrderedDict
+from hashlib import sha1
 
+from numpy import argsort
 from numpy import array
+from numpy import ascontiguousarray
 from numpy import asarray
 from numpy import atleast_2d
 from numpy import nan_to_num
@@ -16,6 +21,7 @@ from numpy import seterr
 from numpy import sum
 from numpy import absolute
 from numpy import cross
+from numpy import empty_like
 from numpy.linalg import cond
 
 from scipy.linalg import cho_factor
@@ -25,7 +31,10 @@ from scipy.linalg import qr
 from scipy.linalg import svd
 from scipy.io import loadmat
 from scipy.io import savemat
+from scipy.sparse import csc_matrix
+from scipy.sparse import issparse
 from scipy.sparse.linalg import factorized
+from scipy.sparse.linalg import splu
 from scipy.sparse.linalg import spsolve
 
 import compas
@@ -49,7 +58,9 @@ __all__ = [
     'solve_with_known',
     'spsolve_with_known',
     'chofactor',
-    'lufactorized'
+    'lufactorized',
+    'FactorisationCache',
+    'FactorisationCacheInfo',
 ]
 
 
@@ -393,33 +404,136 @@ def rref_matlab(A, ifile, ofile, tol=None):
 # Factorisation
 # ==============================================================================
 
-class Memoized:
-    """"""
+FactorisationCacheInfo = namedtuple('FactorisationCacheInfo', ['hits', 'misses', 'reuses', 'evictions', 'maxsize', 'currsize'])
 
-    def __init__(self, f):
-        self.f = f
-        self.memo = {}
 
-    def __call__(self, *args):
-        key = args[-1]
-        if key in self.memo:
-            return self.memo[key]
-        self.memo[key] = res = self.f(args[0])
-        return res
+def _fingerprint(A):
+    # a key for the sparsity pattern and a key for the values of a matrix
+    if issparse(A):
+        A = csc_matrix(A)
+        if not A.has_canonical_format:
+            A = A.copy()
+            A.sum_duplicates()
+        pattern = sha1(ascontiguousarray(A.indptr).tobytes())
+        pattern.update(ascontiguousarray(A.indices).tobytes())
+        pattern = ('sparse', A.shape, pattern.hexdigest())
+        values = ascontiguousarray(A.data)
+    else:
+        A = asarray(A)
+        pattern = ('dense', A.shape)
+        values = ascontiguousarray(A)
+    return pattern, (values.dtype.str, sha1(values.tobytes()).hexdigest())
+
+
+class FactorisationCache(object):
+    """Bounded cache of matrix factorisations, with least-recently-used eviction.
+
+    Parameters
+    ----------
+    factorize : callable
+        The factorisation function.
+        It is called with the matrix and the symbolic information returned by an earlier factorisation
+        of a matrix with the same sparsity pattern (or ``None``),
+        and returns the factorisation and the symbolic information of the matrix.
+    maxsize : int, optional
+        The maximum number of factorisations kept in the cache.
+        Default is ``16``.
 
+    Notes
+    -----
+    Factorisations are keyed by the sparsity pattern and by a fingerprint of the values of the matrix.
+    A matrix is therefore only factorised again if it is actually different from the cached ones,
+    at the cost of hashing its contents on every call.
+    The symbolic information, such as a fill-reducing ordering, is kept per sparsity pattern,
+    such that it can be reused when only the values of the matrix change.
 
-def memoize(f):
-    memo = {}
+    The cache can be used from several threads at the same time.
+    Lookups and updates are locked, but the factorisations themselves are not.
+
+    Examples
+    --------
+    >>> solve = lufactorized(array([[3, 2, -1], [2, -2, 4], [-1, 0.5, -1]]))
+    >>> solve = lufactorized(array([[3, 2, -1], [2, -2, 4], [-1, 0.5, -1]]))
+    >>> lufactorized.cache_info().hits > 0
+    True
 
-    @wraps(f)
-    def wrapper(*args):
-        key = args[-1]
-        if key in memo:
-            return memo[key]
-        memo[key] = res = f(args[0])
-        return res
+    """
 
-    return wrapper
+    def __init__(self, factorize, maxsize=16):
+        self.factorize = factorize
+        self.maxsize = maxsize
+        self._factorisations = OrderedDict()
+        self._symbolic = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.reuses = 0
+        self.evictions = 0
+
+    def __call__(self, A, key=None):
+        """Get the factorisation of a matrix, from the cache if possible.
+
+        Parameters
+        ----------
+        A : array or sparse matrix
+            The matrix.
+        key : hashable, optional
+            Ignored.
+            The cache key is derived from the matrix itself.
+            The parameter is kept for compatibility with earlier versions, in which it was required.
+
+        Returns
+        -------
+        object
+            The factorisation.
+        """
+        pattern, values = _fingerprint(A)
+        key = pattern, values
+        with self._lock:
+            result = self._factorisations.pop(key, None)
+            if result is not None:
+                self.hits += 1
+                self._factorisations[key] = result
+                return result
+            self.misses += 1
+            symbolic = self._symbolic.get(pattern)
+            if symbolic is not None:
+                self.reuses += 1
+        # the factorisation itself is not locked,
+        # such that different matrices can be factorised at the same time
+        result, symbolic = self.factorize(A, symbolic)
+        with self._lock:
+            self._factorisations.pop(key, None)
+            self._factorisations[key] = result
+            self._symbolic.pop(pattern, None)
+            self._symbolic[pattern] = symbolic
+            while len(self._factorisations) > self.maxsize:
+                self._factorisations.popitem(last=False)
+                self.evictions += 1
+            while len(self._symbolic) > self.maxsize:
+                self._symbolic.popitem(last=False)
+        return result
+
+    def cache_info(self):
+        """Report the statistics of the cache.
+
+        Returns
+        -------
+        FactorisationCacheInfo
+            The number of hits and misses,
+            the number of misses that reused the symbolic information of an earlier factorisation,
+            the number of evicted factorisations,
+            the maximum size and the current size of the cache.
+        """
+        with self._lock:
+            return FactorisationCacheInfo(self.hits, self.misses, self.reuses, self.evictions, self.maxsize, len(self._factorisations))
+
+    def cache_clear(self):
+        """Remove all factorisations from the cache and reset the statistics."""
+        with self._lock:
+            self._factorisations.clear()
+            self._symbolic.clear()
+            self.hits = self.misses = self.reuses = self.evictions = 0
 
 
 def _chofactor(A):
@@ -455,6 +569,10 @@ def _chofactor(A):
     return cho_factor(A)
 
 
+def _chofactor_cached(A, symbolic):
+    return _chofactor(A), None
+
+
 def _lufactorized(A):
     r"""Return a function for solving a sparse linear system (LU decomposition).
 
@@ -487,8 +605,29 @@ def _lufactorized(A):
     return factorized(A)
 
 
-chofactor = memoize(_chofactor)
-lufactorized = memoize(_lufactorized)
+def _lufactorized_cached(A, order):
+    # the column ordering of an earlier factorisation with the same sparsity pattern
+    # replaces the computation of a new fill-reducing ordering
+    A = csc_matrix(A, dtype=float)
+    if order is None:
+        lu = splu(A)
+        return lu.solve, argsort(lu.perm_c)
+    lu = splu(A[:, order], permc_spec='NATURAL')
+
+    def solve(b):
+        y = lu.solve(asarray(b, dtype=float))
+        x = empty_like(y)
+        x[order] = y
+        return x
+
+    return solve, order
+
+
+chofactor = FactorisationCache(_chofactor_cached)
+chofactor.__doc__ = """Cached Cholesky factorisation, see :func:`_chofactor` and :class:`FactorisationCache`."""
+
+lufactorized = FactorisationCache(_lufactorized_cached)
+lufactorized.__doc__ = """Cached sparse LU factorisation, see :func:`_lufactorized` and :class:`FactorisationCache`."""
 
 
 # ------------------------------------------------------------------------------
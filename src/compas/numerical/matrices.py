@@ -2,9 +2,14 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from itertools import chain
+
 from numpy import abs
-from numpy import array
+from numpy import arange
 from numpy import asarray
+from numpy import fromiter
+from numpy import ones
+from numpy import repeat
 from numpy import tile
 
 from scipy.sparse import coo_matrix
@@ -25,6 +30,14 @@ __all__ = [
 ]
 
 
+def _flatten(lists):
+    # the row and column indices of the entries of a list of lists of column indices
+    sizes = fromiter((len(items) for items in lists), dtype=int, count=len(lists))
+    rows = repeat(arange(len(lists)), sizes)
+    cols = fromiter(chain.from_iterable(lists), dtype=int, count=int(sizes.sum()))
+    return rows, cols
+
+
 def _return_matrix(M, rtype):
     if rtype == 'list':
         return M.toarray().tolist()
@@ -59,9 +72,8 @@ def adjacency_matrix(adjacency, rtype='array'):
         Constructed adjacency matrix.
 
     """
-    a = [(1, i, j) for i in range(len(adjacency)) for j in adjacency[i]]
-    data, rows, cols = zip(*a)
-    A = coo_matrix((data, (rows, cols))).asfptype()
+    rows, cols = _flatten(adjacency)
+    A = coo_matrix((ones(len(rows)), (rows, cols)))
     return _return_matrix(A, rtype)
 
 
@@ -81,11 +93,12 @@ def face_matrix(face_vertices, rtype='array', normalize=False):
         Constructed face matrix.
 
     """
+    rows, cols = _flatten(face_vertices)
+    data = ones(len(rows))
     if normalize:
-        f = array([(i, j, 1.0 / len(vertices)) for i, vertices in enumerate(face_vertices) for j in vertices])
-    else:
-        f = array([(i, j, 1.0) for i, vertices in enumerate(face_vertices) for j in vertices])
-    F = coo_matrix((f[:, 2], (f[:, 0].astype(int), f[:, 1].astype(int))))
+        sizes = fromiter((len(vertices) for vertices in face_vertices), dtype=float, count=len(face_vertices))
+        data /= sizes[rows]
+    F = coo_matrix((data, (rows, cols)))
     return _return_matrix(F, rtype)
 
 
@@ -109,9 +122,9 @@ def degree_matrix(adjacency, rtype='array'):
         Constructed degree matrix.
 
     """
-    d = [(len(adjacency[i]), i, i) for i in range(len(adjacency))]
-    data, rows, cols = zip(*d)
-    D = coo_matrix((data, (rows, cols))).asfptype()
+    n = len(adjacency)
+    data = fromiter((len(nbrs) for nbrs in adjacency), dtype=float, count=n)
+    D = coo_matrix((data, (arange(n), arange(n))))
     return _return_matrix(D, rtype)
 
 
@@ -160,11 +173,12 @@ def connectivity_matrix(edges, rtype='array'):
            [-1.,  0.,  0.,  1.]])
 
     """
+    edges = asarray(edges, dtype=int).reshape((-1, 2))
     m = len(edges)
-    data = array([-1] * m + [1] * m)
-    rows = array(list(range(m)) + list(range(m)))
-    cols = array([edge[0] for edge in edges] + [edge[1] for edge in edges])
-    C = coo_matrix((data, (rows, cols))).asfptype()
+    data = repeat([-1.0, 1.0], m)
+    rows = tile(arange(m), 2)
+    cols = edges.T.ravel()
+    C = coo_matrix((data, (rows, cols)))
     return _return_matrix(C, rtype)
 
 
@@ -211,7 +225,7 @@ def laplacian_matrix(edges, normalize=False, rtype='array'):
     C = connectivity_matrix(edges, rtype='csr')
     L = C.transpose().dot(C)
     if normalize:
-        L = L / L.diagonal().reshape((-1, 1))
+        L = diags(1.0 / L.diagonal()).dot(L)
         L = csr_matrix(L)
     return _return_matrix(L, rtype)
 
@@ -3,10 +3,13 @@ from __future__ import absolute_import
 from __future__ import division
 
 from numpy import asarray
+from numpy import atleast_2d
+from numpy import outer
+from numpy import zeros
 from scipy.linalg import svd
 
 
-__all__ = ['pca_numpy']
+__all__ = ['pca_numpy', 'pca_numpy_chunked', 'IncrementalPCA']
 
 
 def pca_numpy(data):
@@ -88,6 +91,152 @@ def pca_numpy(data):
     return mean[0], eigenvectors, eigenvalues
 
 
+class IncrementalPCA(object):
+    """Principle component analysis of data that is added chunk by chunk.
+
+    Parameters
+    ----------
+    dim : int, optional
+        The number of measured variables.
+        Default is ``None``, in which case it is taken from the first chunk.
+
+    Attributes
+    ----------
+    n : int
+        The number of observations added so far.
+    mean : array
+        The mean of the observations added so far.
+    scatter : array
+        The sum of the outer products of the deviations of the observations from their mean.
+
+    Notes
+    -----
+    The mean and the scatter matrix of every chunk are merged with those of the previous chunks
+    with the pairwise update formulas of Chan et al. [1]_,
+    such that only one chunk has to be in memory at a time.
+    The components are the same as those computed by :func:`pca_numpy` from all data at once.
+
+    References
+    ----------
+    .. [1] Chan T.F., Golub G.H. and LeVeque R.J., *Updating formulae and a pairwise algorithm for computing sample variances*,
+           Technical Report STAN-CS-79-773, Stanford University, 1979.
+
+    Examples
+    --------
+    >>> pca = IncrementalPCA()
+    >>> pca.update([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0]])
+    >>> pca.update([[2.0, 0.1, 0.0], [3.0, 0.0, 0.0]])
+    >>> pca.n
+    4
+    >>> mean, eigenvectors, eigenvalues = pca.components()
+    >>> mean.tolist()
+    [1.5, 0.025, 0.0]
+
+    """
+
+    def __init__(self, dim=None):
+        self.n = 0
+        self.mean = None
+        self.scatter = None
+        if dim is not None:
+            self.mean = zeros(dim)
+            self.scatter = zeros((dim, dim))
+
+    def update(self, chunk):
+        """Add a chunk of observations.
+
+        Parameters
+        ----------
+        chunk : array-like
+            A list of observations, measuring `dim` variables.
+        """
+        X = atleast_2d(asarray(chunk, dtype=float))
+        m, dim = X.shape
+        if not m:
+            return
+        if self.mean is None:
+            self.mean = zeros(dim)
+            self.scatter = zeros((dim, dim))
+        mean = X.sum(axis=0) / m
+        Y = X - mean
+        scatter = Y.T.dot(Y)
+        n = self.n + m
+        delta = mean - self.mean
+        self.scatter += scatter + outer(delta, delta) * (self.n * m / n)
+        self.mean += delta * (m / n)
+        self.n = n
+
+    def covariance(self):
+        """The covariance matrix of the observations added so far.
+
+        Returns
+        -------
+        array
+            The dim x dim covariance matrix.
+        """
+        return self.scatter / (self.n - 1)
+
+    def components(self):
+        """The principle components of the observations added so far.
+
+        Returns
+        -------
+        tuple
+            The mean of the data points, the principle directions,
+            and the *spread* of the data along the principle directions,
+            as returned by :func:`pca_numpy`.
+        """
+        assert self.mean is not None and self.n >= len(self.mean), "The number of observations (n) should be higher than the number of measured variables (dimensions)."
+        u, s, vT = svd(self.covariance(), full_matrices=False)
+        return self.mean.copy(), vT, s
+
+
+def pca_numpy_chunked(data, chunksize=100000):
+    """Compute the principle components of a set of data points, one chunk at a time.
+
+    Parameters
+    ----------
+    data : array or iterable
+        An array of `m` observations, measuring `n` variables,
+        such as a memory-mapped array, which is processed in chunks of ``chunksize`` observations,
+        or an iterable, such as a generator, of chunks of observations.
+    chunksize : int, optional
+        The number of observations per chunk, if ``data`` is an array.
+        Default is ``100000``.
+
+    Returns
+    -------
+    tuple
+        The mean of the data points, the principle directions,
+        and the *spread* of the data along the principle directions,
+        as returned by :func:`pca_numpy`.
+
+    Examples
+    --------
+    >>> from numpy import allclose
+    >>> from numpy.random import rand
+    >>> points = rand(1000, 3)
+    >>> mean, eigenvectors, eigenvalues = pca_numpy_chunked(points, chunksize=100)
+    >>> allclose(mean, points.mean(axis=0))
+    True
+
+    """
+    pca = IncrementalPCA()
+    for chunk in _chunks(data, chunksize):
+        pca.update(chunk)
+    return pca.components()
+
+
+def _chunks(data, chunksize):
+    # the rows of an array in blocks, or the items of any other iterable
+    if hasattr(data, 'shape'):
+        for i in range(0, data.shape[0], chunksize):
+            yield data[i:i + chunksize]
+    else:
+        for chunk in data:
+            yield chunk
+
+
 # ==============================================================================
 # Main
 # ==============================================================================
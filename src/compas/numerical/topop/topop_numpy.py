@@ -4,15 +4,20 @@ from __future__ import division
 from __future__ import print_function
 
 from numpy import abs
+from numpy import arange
 from numpy import asarray
 from numpy import array
+from numpy import bincount
 from numpy import ceil
+from numpy import concatenate
+from numpy import cumsum
 from numpy import dot
+from numpy import full
 from numpy import hstack
 from numpy import kron
 from numpy import max
 from numpy import maximum
-from numpy import min
+from numpy import meshgrid
 from numpy import minimum
 from numpy import int64
 from numpy import newaxis
@@ -23,10 +28,12 @@ from numpy import sqrt
 from numpy import squeeze
 from numpy import sum
 from numpy import tile
+from numpy import unique
 from numpy import vstack
 from numpy import zeros
 
 from scipy.sparse import coo_matrix
+from scipy.sparse import csc_matrix
 from scipy.sparse.linalg import spsolve
 
 
@@ -93,8 +100,8 @@ def topop_numpy(nelx, nely, loads, supports, volfrac=0.5, penal=3, rmin=1.5, cal
     nodes = reshape(range(1, nn + 1), (ny, nx), order='F')
     eVec = tile(reshape(2 * nodes[:-1, :-1], (ne, 1), order='F'), (1, 8))
     edof = eVec + tile(hstack([array([0, 1]), 2 * nely + array([2, 3, 0, 1]), array([-2, -1])]), (ne, 1))
-    iK = reshape(kron(edof, ones((8, 1))).transpose(), (64 * ne), order='F')
-    jK = reshape(kron(edof, ones((1, 8))).transpose(), (64 * ne), order='F')
+    iK = reshape(kron(edof, ones((8, 1), dtype=int64)).transpose(), (64 * ne), order='F')
+    jK = reshape(kron(edof, ones((1, 8), dtype=int64)).transpose(), (64 * ne), order='F')
 
     # Supports
 
@@ -112,7 +119,7 @@ def topop_numpy(nelx, nely, loads, supports, volfrac=0.5, penal=3, rmin=1.5, cal
         if By:
             fixed.append(2 * node + 1)
 
-    free = list(set(range(ndof)) - set(fixed))
+    free = sorted(set(range(ndof)) - set(fixed))
 
     # Loads
 
@@ -131,37 +138,16 @@ def topop_numpy(nelx, nely, loads, supports, volfrac=0.5, penal=3, rmin=1.5, cal
         cols.extend([0, 0])
 
     F = coo_matrix((data, (rows, cols)), shape=(ndof, 1))
-    Find = F.tocsr()[free]
+    Find = F.toarray().ravel()[free]
 
-    # Filter
-
-    iH = zeros(ne * (2 * (int(ceil(rmin)) - 1) + 1)**2, dtype=int64)
-    jH = zeros(iH.shape, dtype=int64)
-    sH = zeros(iH.shape)
-    k = 0
-
-    for i1 in range(nelx):
-
-        max_i = int(max([i1 - (ceil(rmin) - 1), 0]))
-        min_i = int(min([i1 + (ceil(rmin) - 1), nelx - 1]))
+    # Stiffness assembly pattern
 
-        for j1 in range(nely):
+    pattern = _stiffness_pattern(iK, jK, free, ndof)
+    del iK, jK
 
-            max_j = int(max([j1 - (ceil(rmin) - 1), 0]))
-            min_j = int(min([j1 + (ceil(rmin) - 1), nely - 1]))
-
-            e1 = i1 * nely + j1
-
-            for i2 in range(max_i, min_i + 1):
-                for j2 in range(max_j, min_j + 1):
-                    k += 1
-                    e2 = i2 * nely + j2
-                    iH[k] = e1
-                    jH[k] = e2
-                    sH[k] = max([0, rmin - sqrt((i1 - i2)**2 + (j1 - j2)**2)])
+    # Filter
 
-    H = coo_matrix((sH, (iH, jH)))
-    Hs = sum(H.toarray(), 1)
+    H, Hs = _filter(nelx, nely, rmin)
 
     # Main loop
 
@@ -179,8 +165,7 @@ def topop_numpy(nelx, nely, loads, supports, volfrac=0.5, penal=3, rmin=1.5, cal
 
         xrav = ravel(xP, order='F').transpose()
         sK = reshape(Ker * (Emin + xrav**penal * (E - Emin)), (64 * ne), order='F')
-        K = coo_matrix((sK, (asarray(iK, dtype=int64), asarray(jK, dtype=int64)))).tocsr()
-        Kind = (K.tocsc()[:, free]).tocsr()[free, :]
+        Kind = _stiffness(sK, pattern)
         U[free] = spsolve(Kind, Find)[:, newaxis]
 
         # Objective function
@@ -224,6 +209,55 @@ def topop_numpy(nelx, nely, loads, supports, volfrac=0.5, penal=3, rmin=1.5, cal
     return x
 
 
+def _stiffness_pattern(iK, jK, free, ndof):
+    # the sparsity pattern of the stiffness matrix of the free dofs is the same in every iteration
+    # the element contributions are summed into its non-zero values with a precomputed index
+    nf = len(free)
+    index = -ones(ndof, dtype=int64)
+    index[free] = arange(nf)
+    iKf = index[iK]
+    jKf = index[jK]
+    mask = (iKf >= 0) & (jKf >= 0)
+    keys, inverse = unique(jKf[mask] * nf + iKf[mask], return_inverse=True)
+    indices = keys % nf
+    indptr = concatenate([[0], cumsum(bincount(keys // nf, minlength=nf))])
+    return mask, inverse, indices, indptr, nf
+
+
+def _stiffness(sK, pattern):
+    # the stiffness matrix of the free dofs, as a CSC matrix
+    mask, inverse, indices, indptr, nf = pattern
+    data = bincount(inverse, weights=sK[mask], minlength=len(indices))
+    return csc_matrix((data, indices, indptr), shape=(nf, nf))
+
+
+def _filter(nelx, nely, rmin):
+    # all element pairs within the filter radius, one offset at a time
+    ne = nelx * nely
+    r = int(ceil(rmin)) - 1
+    ix, jy = [ravel(a) for a in meshgrid(arange(nelx), arange(nely), indexing='ij')]
+    e1 = ix * nely + jy
+    iH = []
+    jH = []
+    sH = []
+
+    for di in range(-r, r + 1):
+        for dj in range(-r, r + 1):
+            w = rmin - sqrt(di**2 + dj**2)
+            if w <= 0:
+                continue
+            i2 = ix + di
+            j2 = jy + dj
+            inside = (i2 >= 0) & (i2 < nelx) & (j2 >= 0) & (j2 < nely)
+            iH.append(e1[inside])
+            jH.append(i2[inside] * nely + j2[inside])
+            sH.append(full(inside.sum(), w))
+
+    H = coo_matrix((concatenate(sH), (concatenate(iH), concatenate(jH))), shape=(ne, ne)).tocsr()
+    Hs = asarray(H.sum(axis=1)).ravel()
+    return H, Hs
+
+
 # ==============================================================================
 # Main
 # ==============================================================================
@@ -22,6 +22,11 @@ Classes
     :nosignatures:
 
     Proxy
+    ProxyBatch
+    Future
+    Server
+    Dispatcher
+    RemoteHandle
 
 """
 
@@ -30,6 +35,7 @@ from __future__ import division
 from __future__ import print_function
 
 from .errors import *  # noqa: F401 F403
+from .handles import *  # noqa: F401 F403
 from .proxy import *  # noqa: F401 F403
 from .server import *  # noqa: F401 F403
 from .dispatcher import *  # noqa: F401 F403
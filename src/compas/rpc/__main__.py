@@ -8,8 +8,8 @@ except ImportError:
     from xmlrpc.client import ServerProxy
 
 
-def start(port, autoreload, **kwargs):
-    start_service(port, autoreload)
+def start(port, autoreload, workers=None, pool='threads', queue_size=None, **kwargs):
+    start_service(port, autoreload, workers=workers, pool=pool, queue_size=queue_size)
 
 
 def stop(port, **kwargs):
@@ -50,6 +50,9 @@ def main():
         '--port', '-p', action='store', default=1753, type=int, help='RPC port number')
     start_command.add_argument('--autoreload', dest='autoreload', action='store_true', help='Autoreload modules')
     start_command.add_argument('--no-autoreload', dest='autoreload', action='store_false', help='Do not autoreload modules')
+    start_command.add_argument('--workers', '-w', action='store', default=None, type=int, help='Number of requests handled at the same time')
+    start_command.add_argument('--pool', action='store', default='threads', choices=['threads', 'processes'], help='Type of worker pool')
+    start_command.add_argument('--queue-size', action='store', default=None, type=int, help='Maximum number of waiting requests')
     start_command.set_defaults(autoreload=True, func=start)
 
     # Command: stop
@@ -6,10 +6,14 @@ import importlib
 import json
 import pstats
 import sys
+import threading
 import traceback
 
+from collections import OrderedDict
+
 from compas.utilities import DataDecoder
 from compas.utilities import DataEncoder
+from compas.rpc.handles import RemoteHandle
 
 try:
     from cStringIO import StringIO
@@ -35,6 +39,12 @@ class Dispatcher(object):
     --------
     >>>
 
+    Attributes
+    ----------
+    max_objects : int
+        The maximum number of objects kept on the server under a handle.
+        When the limit is reached, the least recently used object is released.
+
     Notes
     -----
     This object is used to dispatch API calls to the corresponding functions or methods.
@@ -42,7 +52,127 @@ class Dispatcher(object):
     message strings assigned to the `'error'` key of the output dictionary
     such that the errors can be rethrown on the client side.
 
+    Objects, such as meshes or networks, can be kept on the server under a :class:`RemoteHandle`,
+    with :meth:`store_object`, or by asking for a handle to the result of a call
+    with the key ``'return_handle'`` of the input dictionary.
+    Handles passed as arguments of later calls are replaced by the stored objects,
+    such that the objects don't have to be sent back and forth for every call.
+    This is not possible on a server with a pool of several worker processes,
+    because the calls are spread over processes that don't share their objects.
+
     """
+
+    max_objects = 128
+
+    # set by the server if the store can't be used,
+    # for example because every one of several worker processes would have its own
+    _objects_error = None
+
+    @property
+    def _objects(self):
+        # the store is created on first use,
+        # such that subclasses don't have to call the constructor of the base class
+        if self._objects_error:
+            raise RuntimeError(self._objects_error)
+        try:
+            return self.__objects
+        except AttributeError:
+            self.__objects = OrderedDict()
+            self.__objects_lock = threading.Lock()
+            return self.__objects
+
+    def _store(self, obj):
+        handle = RemoteHandle.from_object(obj)
+        objects = self._objects
+        with self.__objects_lock:
+            objects[handle.key] = obj
+            while len(objects) > self.max_objects:
+                objects.popitem(last=False)
+        return handle
+
+    def _resolve(self, value):
+        # replace handles by the stored objects, also in nested lists and dicts
+        if isinstance(value, RemoteHandle):
+            objects = self._objects
+            with self.__objects_lock:
+                try:
+                    objects[value.key] = obj = objects.pop(value.key)
+                except KeyError:
+                    raise KeyError("The handle is not valid, or the object was released: {0!r}".format(value))
+            return obj
+        if isinstance(value, list):
+            return [self._resolve(item) for item in value]
+        if isinstance(value, tuple):
+            return tuple(self._resolve(item) for item in value)
+        if isinstance(value, dict):
+            return dict((key, self._resolve(item)) for key, item in value.items())
+        return value
+
+    def store_object(self, obj):
+        """Keep an object on the server.
+
+        Parameters
+        ----------
+        obj : object
+            The object.
+
+        Returns
+        -------
+        :class:`RemoteHandle`
+            The handle under which the object is stored.
+        """
+        return self._store(obj)
+
+    def fetch_object(self, handle):
+        """Get the object stored under a handle.
+
+        Parameters
+        ----------
+        handle : :class:`RemoteHandle`
+            The handle of the object.
+            When called through :meth:`_dispatch`, the handle has already been replaced by the object.
+
+        Returns
+        -------
+        object
+            The object.
+        """
+        if isinstance(handle, RemoteHandle):
+            return self._resolve(handle)
+        return handle
+
+    def release_object(self, key):
+        """Remove an object from the server.
+
+        Parameters
+        ----------
+        key : str
+            The key of the handle of the object.
+
+        Returns
+        -------
+        bool
+            ``True`` if the object was stored, ``False`` otherwise.
+        """
+        objects = self._objects
+        with self.__objects_lock:
+            return objects.pop(key, None) is not None
+
+    def object_store_info(self):
+        """Report the objects stored on the server.
+
+        Returns
+        -------
+        dict
+            The number of stored objects under ``'count'``,
+            the maximum number under ``'max_objects'``,
+            and the keys of the handles, from least to most recently used, under ``'keys'``.
+        """
+        objects = self._objects
+        with self.__objects_lock:
+            keys = list(objects.keys())
+        return {'count': len(keys), 'max_objects': self.max_objects, 'keys': keys}
+
     def on_module_imported(self, module, newly_loaded_modules):
         """Event triggered when a module is successfully imported.
 
@@ -68,6 +198,8 @@ class Dispatcher(object):
             The first argument in the list should be the JSON serialised string
             representation of the input dictionary. The structure of the input
             dictionary is defined by the caller.
+            If the input dictionary has a key ``'binary_arrays'`` with value ``True``,
+            numpy arrays in the output are encoded as raw bytes instead of as nested lists.
 
         Returns
         -------
@@ -90,6 +222,8 @@ class Dispatcher(object):
 
         functionname = parts[-1]
 
+        binary_arrays = False
+
         try:
             if len(parts) > 1:
                 modulename = ".".join(parts[:-1])
@@ -121,9 +255,10 @@ class Dispatcher(object):
                         "For example: input = json.dumps({'param_1': 1, 'param_2': [2, 3]})")
 
                 else:
+                    binary_arrays = idict.get('binary_arrays', False)
                     self._call(function, idict, odict)
 
-        return json.dumps(odict, cls=DataEncoder)
+        return json.dumps(odict, cls=DataEncoder, binary_arrays=binary_arrays)
 
     def _call(self, function, idict, odict):
         """Method that handles the actual call to the function corresponding to the API call.
@@ -142,11 +277,12 @@ class Dispatcher(object):
         The output dictionary will be modified in place.
 
         """
-        args = idict['args']
-        kwargs = idict['kwargs']
-
         try:
+            args = self._resolve(idict['args'])
+            kwargs = self._resolve(idict['kwargs'])
             data = function(*args, **kwargs)
+            if idict.get('return_handle') and data is not None:
+                data = self._store(data)
         except Exception:
             odict['error'] = traceback.format_exc()
         else:
@@ -155,16 +291,18 @@ class Dispatcher(object):
     def _call_wrapped(self, function, idict, odict):
         """Does the same as _call, but with profiling enabled.
         """
-        args = idict['args']
-        kwargs = idict['kwargs']
-
         try:
+            args = self._resolve(idict['args'])
+            kwargs = self._resolve(idict['kwargs'])
+
             profile = Profile()
             profile.enable()
 
             data = function(*args, **kwargs)
 
             profile.disable()
+            if idict.get('return_handle') and data is not None:
+                data = self._store(data)
             stream = StringIO()
             stats = pstats.Stats(profile, stream=stream)
             stats.strip_dirs()
@@ -0,0 +1,64 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+import uuid
+
+
+__all__ = ['RemoteHandle']
+
+
+class RemoteHandle(object):
+    """Reference to an object that is kept on the server of a remote procedure call.
+
+    Parameters
+    ----------
+    key : str
+        The key of the object in the store of the server.
+    type : str, optional
+        The name of the type of the object.
+
+    Notes
+    -----
+    A handle can be passed as argument to remote functions instead of the object itself,
+    and is replaced by the object on the server.
+    Handles are created by the server, see :meth:`compas.rpc.Proxy.store`
+    and :attr:`compas.rpc.Proxy.return_handles`.
+
+    """
+
+    def __init__(self, key, type=None):
+        self.key = key
+        self.type = type
+
+    def __repr__(self):
+        return 'RemoteHandle({0!r}, {1!r})'.format(self.key, self.type)
+
+    def __eq__(self, other):
+        return isinstance(other, RemoteHandle) and self.key == other.key
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.key)
+
+    @classmethod
+    def from_object(cls, obj):
+        """Create a new handle for an object."""
+        return cls(uuid.uuid4().hex, type(obj).__name__)
+
+    @classmethod
+    def from_data(cls, data):
+        return cls(data['key'], data.get('type'))
+
+    def to_data(self):
+        return {'key': self.key, 'type': self.type}
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+    pass
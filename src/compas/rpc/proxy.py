@@ -3,6 +3,7 @@ from __future__ import division
 from __future__ import print_function
 
 import json
+import threading
 import time
 
 import compas
@@ -12,8 +13,10 @@ from compas.utilities import DataDecoder
 from compas.utilities import DataEncoder
 
 try:
+    from xmlrpclib import MultiCall
     from xmlrpclib import ServerProxy
 except ImportError:
+    from xmlrpc.client import MultiCall
     from xmlrpc.client import ServerProxy
 
 try:
@@ -23,7 +26,7 @@ except ImportError:
     from System.Diagnostics import Process
 
 
-__all__ = ['Proxy']
+__all__ = ['Proxy', 'ProxyBatch', 'Future']
 
 
 class Proxy(object):
@@ -59,6 +62,18 @@ class Proxy(object):
         it will unload the module, so that the next invocation uses a fresh version.
     capture_output : :obj:`bool`, ``True`` to capture the stdout/stderr output of the remote process, otherwise ``False``.
         In general, ``capture_output`` should be ``True`` when using a ``pythonw`` as executable (default).
+    binary_arrays : :obj:`bool`, ``True`` to exchange numpy arrays as raw bytes instead of as nested lists.
+        Arrays returned by the remote functions are then numpy arrays, instead of lists.
+        This is only possible if numpy is available on the client side,
+        otherwise, for example in IronPython, arrays are always exchanged as lists.
+        Default is ``False``.
+
+    Attributes
+    ----------
+    return_handles : :obj:`bool`
+        ``True`` to keep the results of remote functions on the server,
+        and return a :class:`compas.rpc.RemoteHandle` to them instead.
+        Default is ``False``.
 
     Notes
     -----
@@ -87,7 +102,8 @@ class Proxy(object):
 
     """
 
-    def __init__(self, package=None, python=None, url='http://127.0.0.1', port=1753, service=None, max_conn_attempts=100, autoreload=True, capture_output=True):
+    def __init__(self, package=None, python=None, url='http://127.0.0.1', port=1753, service=None, max_conn_attempts=100, autoreload=True, capture_output=True,
+                 binary_arrays=False):
         self._package = None
         self._python = compas._os.select_python(python)
         self._url = url
@@ -97,11 +113,14 @@ class Proxy(object):
         self._process = None
         self._function = None
         self._profile = None
+        self._binary_arrays = False
+        self.return_handles = False
 
         self.service = service
         self.package = package
         self.autoreload = autoreload
         self.capture_output = capture_output
+        self.binary_arrays = binary_arrays
 
         self._implicitely_started_server = False
         self._server = self._try_reconnect()
@@ -153,6 +172,20 @@ class Proxy(object):
         else:
             self._service = service
 
+    @property
+    def binary_arrays(self):
+        """bool: Exchange numpy arrays as raw bytes instead of as nested lists."""
+        return self._binary_arrays
+
+    @binary_arrays.setter
+    def binary_arrays(self, binary_arrays):
+        if binary_arrays:
+            try:
+                import numpy  # noqa: F401
+            except ImportError:
+                binary_arrays = False
+        self._binary_arrays = bool(binary_arrays)
+
     @property
     def python(self):
         return self._python
@@ -290,9 +323,63 @@ class Proxy(object):
         except Exception:
             pass
 
+    def store(self, obj):
+        """Keep an object on the server.
+
+        Parameters
+        ----------
+        obj : object
+            The object, for example a mesh.
+
+        Returns
+        -------
+        :class:`compas.rpc.RemoteHandle`
+            A handle to the object, which can be passed to remote functions instead of the object.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            with Proxy('compas.datastructures') as proxy:
+                handle = proxy.store(mesh)
+                proxy.mesh_subdivide_quad(handle)
+                mesh = proxy.fetch(handle)
+
+        """
+        return self._invoke(self._server.store_object, (obj, ), {})
+
+    def fetch(self, handle):
+        """Get an object kept on the server.
+
+        Parameters
+        ----------
+        handle : :class:`compas.rpc.RemoteHandle`
+            The handle of the object.
+
+        Returns
+        -------
+        object
+            The object.
+        """
+        return self._invoke(self._server.fetch_object, (handle, ), {})
+
+    def release(self, handle):
+        """Remove an object from the server.
+
+        Parameters
+        ----------
+        handle : :class:`compas.rpc.RemoteHandle`
+            The handle of the object.
+
+        Returns
+        -------
+        bool
+            ``True`` if the object was still on the server, ``False`` otherwise.
+        """
+        return self._invoke(self._server.release_object, (handle.key, ), {})
+
     def __getattr__(self, name):
-        if self.package:
-            name = "{}.{}".format(self.package, name)
+        name = self._function_name(name)
         try:
             self._function = getattr(self._server, name)
         except Exception:
@@ -314,21 +401,31 @@ class Proxy(object):
         object
             The result returned by the remote function.
 
+        Notes
+        -----
+        Handles of objects kept on the server (:class:`compas.rpc.RemoteHandle`) can be passed
+        instead of the objects themselves.
+        If :attr:`return_handles` is ``True``, the result is kept on the server as well,
+        and a handle to it is returned instead.
+
         Warnings
         --------
         The `args` and `kwargs` have to be JSON-serialisable.
-        This means that, currently, only native Python objects are supported.
-        The returned results will also always be in the form of built-in Python objects.
+        This means that, currently, only native Python objects, COMPAS data objects and numpy arrays are supported.
+        The returned results will also always be in the form of built-in Python objects,
+        except for numpy arrays if :attr:`binary_arrays` is ``True``.
         """
-        idict = {'args': args, 'kwargs': kwargs}
-        istring = json.dumps(idict, cls=DataEncoder)
+        return self._invoke(self._function, args, kwargs, self.return_handles)
+
+    def _invoke(self, function, args, kwargs, return_handle=False):
+        istring = self._encode(args, kwargs, return_handle)
         # it makes sense that there is a broken pipe error
         # because the process is not the one receiving the feedback
         # when there is a print statement on the server side
         # this counts as output
         # it should be sent as part of RPC communication
         try:
-            ostring = self._function(istring)
+            ostring = function(istring)
         except Exception:
             # not clear what the point of this is
             # self.stop_server()
@@ -336,6 +433,20 @@ class Proxy(object):
             # no need to stop the server for this
             raise
 
+        result = self._decode(ostring)
+
+        self.profile = result['profile']
+        return result['data']
+
+    def _encode(self, args, kwargs, return_handle=False):
+        idict = {'args': args, 'kwargs': kwargs}
+        if return_handle:
+            idict['return_handle'] = True
+        if self.binary_arrays:
+            idict['binary_arrays'] = True
+        return json.dumps(idict, cls=DataEncoder, binary_arrays=self.binary_arrays)
+
+    def _decode(self, ostring):
         if not ostring:
             raise RPCServerError("No output was generated.")
 
@@ -344,8 +455,314 @@ class Proxy(object):
         if result['error']:
             raise RPCServerError(result['error'])
 
-        self.profile = result['profile']
-        return result['data']
+        return result
+
+    def _function_name(self, name):
+        if self.package:
+            return "{}.{}".format(self.package, name)
+        return name
+
+    def batch(self):
+        """Collect several calls to remote functions and send them to the server in one request.
+
+        Returns
+        -------
+        :class:`compas.rpc.ProxyBatch`
+            The batch of calls.
+
+        Notes
+        -----
+        The calls are executed by the server one after the other, in the order in which they were added,
+        with a single round-trip to the server for all of them.
+        When the batch is used in a ``with`` statement, it is executed at the end of the block.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            with Proxy('compas.numerical') as numerical:
+                with numerical.batch() as batch:
+                    for q in forcedensities:
+                        batch.fd_numpy(vertices, edges, fixed, q, loads)
+                for xyz, q, f, l, r in batch.results:
+                    pass
+
+        """
+        return ProxyBatch(self)
+
+    def call_async(self, name, args=None, kwargs=None, callback=None, errback=None):
+        """Call a remote function without waiting for the result.
+
+        Parameters
+        ----------
+        name : str
+            The name of the function, relative to :attr:`package`.
+        args : list, optional
+            Positional arguments to be passed to the remote function.
+        kwargs : dict, optional
+            Named arguments to be passed to the remote function.
+        callback : callable, optional
+            Called with the result of the function, once it is available.
+        errback : callable, optional
+            Called with the exception, if the call fails.
+
+        Returns
+        -------
+        :class:`compas.rpc.Future`
+            The eventual result of the call.
+
+        Notes
+        -----
+        The call is made from a background thread, with its own connection to the server,
+        such that, for example, the user interface of Rhino or Grasshopper stays responsive while it runs.
+        The ``callback`` and ``errback`` are called from that background thread as well.
+
+        Since the callbacks follow the conventions of :func:`compas.utilities.await_callback`,
+        the call can also be awaited with it.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            from compas.utilities import await_callback
+
+            with Proxy('compas.numerical') as numerical:
+                future = numerical.call_async('fd_numpy', (vertices, edges, fixed, q, loads))
+                # do other things
+                xyz, q, f, l, r = future.result()
+
+                xyz, q, f, l, r = await_callback(numerical.call_async, 'callback', 'errback',
+                                                 name='fd_numpy', args=(vertices, edges, fixed, q, loads))
+
+        """
+        function = getattr(ServerProxy(self.address), self._function_name(name))
+        return Future.run(self._invoke,
+                          (function, args or (), kwargs or {}, self.return_handles),
+                          callback=callback,
+                          errback=errback)
+
+
+class ProxyBatch(object):
+    """A batch of calls to remote functions, which are sent to the server in one request.
+
+    Remote functions are called on the batch in the same way as on the proxy,
+    but the calls are only recorded, and made when the batch is executed.
+
+    Parameters
+    ----------
+    proxy : :class:`compas.rpc.Proxy`
+        The proxy through which the calls are made.
+
+    Attributes
+    ----------
+    results : list
+        The results of the calls of the last execution of the batch.
+
+    Notes
+    -----
+    The server has to support ``system.multicall``, which is the case for :class:`compas.rpc.Server`.
+    If one of the calls fails, an :class:`compas.rpc.RPCServerError` is raised for the first failed call.
+
+    """
+
+    def __init__(self, proxy):
+        self._proxy = proxy
+        self._calls = []
+        self.results = None
+
+    def __len__(self):
+        return len(self._calls)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *args):
+        if exc_type is None:
+            self.execute()
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        name = self._proxy._function_name(name)
+        return_handle = self._proxy.return_handles
+
+        def call(*args, **kwargs):
+            self._calls.append((name, self._proxy._encode(args, kwargs, return_handle)))
+            return len(self._calls) - 1
+
+        return call
+
+    def _send(self, server, calls):
+        multicall = MultiCall(server)
+        for name, istring in calls:
+            getattr(multicall, name)(istring)
+        return [self._proxy._decode(ostring)['data'] for ostring in multicall()]
+
+    def execute(self):
+        """Send the recorded calls to the server.
+
+        Returns
+        -------
+        list
+            The results of the calls, in the order in which they were added.
+        """
+        calls, self._calls = self._calls, []
+        self.results = self._send(self._proxy._server, calls)
+        return self.results
+
+    def execute_async(self, callback=None, errback=None):
+        """Send the recorded calls to the server without waiting for the results.
+
+        Parameters
+        ----------
+        callback : callable, optional
+            Called with the list of results, once they are available.
+        errback : callable, optional
+            Called with the exception, if the batch fails.
+
+        Returns
+        -------
+        :class:`compas.rpc.Future`
+            The eventual list of results.
+        """
+        calls, self._calls = self._calls, []
+        server = ServerProxy(self._proxy.address)
+
+        def send():
+            self.results = self._send(server, calls)
+            return self.results
+
+        return Future.run(send, callback=callback, errback=errback)
+
+
+class Future(object):
+    """The eventual result of an asynchronous call.
+
+    Notes
+    -----
+    A future is returned by :meth:`Proxy.call_async` and :meth:`ProxyBatch.execute_async`.
+    It follows the interface of :class:`concurrent.futures.Future`, which is not available in IronPython.
+
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._result = None
+        self._exception = None
+        self._callbacks = []
+
+    @classmethod
+    def run(cls, function, args=(), callback=None, errback=None):
+        """Run a function in a background thread.
+
+        Parameters
+        ----------
+        function : callable
+            The function.
+        args : tuple, optional
+            The positional arguments of the function.
+        callback : callable, optional
+            Called with the result of the function.
+        errback : callable, optional
+            Called with the exception, if the function fails.
+
+        Returns
+        -------
+        :class:`compas.rpc.Future`
+            The eventual result of the function.
+        """
+        future = cls()
+
+        def target():
+            try:
+                result = function(*args)
+            except Exception as e:
+                future.set_exception(e)
+                if errback:
+                    errback(e)
+            else:
+                future.set_result(result)
+                if callback:
+                    callback(result)
+
+        thread = threading.Thread(target=target)
+        thread.daemon = True
+        thread.start()
+        return future
+
+    def done(self):
+        """bool: ``True`` if the call has completed, ``False`` otherwise."""
+        return self._event.is_set()
+
+    def result(self, timeout=None):
+        """Wait for the result of the call.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum number of seconds to wait.
+            Default is ``None``, in which case there is no limit.
+
+        Returns
+        -------
+        object
+            The result.
+
+        Raises
+        ------
+        RPCServerError
+            If the call did not complete within the timeout.
+            Exceptions raised by the call itself are re-raised.
+        """
+        exception = self.exception(timeout)
+        if exception is not None:
+            raise exception
+        return self._result
+
+    def exception(self, timeout=None):
+        """Wait for the call to complete and return the exception it raised, if any.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum number of seconds to wait.
+            Default is ``None``, in which case there is no limit.
+
+        Returns
+        -------
+        Exception
+            The exception, or ``None`` if the call succeeded.
+        """
+        if not self._event.wait(timeout):
+            raise RPCServerError("The call did not complete within {0} seconds.".format(timeout))
+        return self._exception
+
+    def add_done_callback(self, fn):
+        """Add a function to be called with the future once the call has completed.
+
+        If the call has already completed, the function is called immediately.
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(fn)
+                return
+        fn(self)
+
+    def set_result(self, result):
+        self._result = result
+        self._set_done()
+
+    def set_exception(self, exception):
+        self._exception = exception
+        self._set_done()
+
+    def _set_done(self):
+        with self._lock:
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for fn in callbacks:
+            fn(self)
 
 
 # ==============================================================================
@@ -2,8 +2,11 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+import json
 import threading
 
+from compas.rpc.dispatcher import Dispatcher
+
 try:
     from SimpleXMLRPCServer import SimpleXMLRPCServer
 except ImportError:
@@ -13,9 +16,48 @@ except ImportError:
 __all__ = ['Server']
 
 
+# the registered instance of a server with a pool of processes,
+# one copy per worker process
+_worker_instance = None
+
+
+def _init_worker(instance, workers):
+    global _worker_instance
+    if workers > 1 and isinstance(instance, Dispatcher):
+        instance._objects_error = (
+            "Objects can't be kept on a server with a pool of {0} worker processes, "
+            "because every process has its own objects. "
+            "Use a pool of threads, or a single worker process.".format(workers))
+    _worker_instance = instance
+
+
+def _dispatch_in_worker(name, args):
+    return _worker_instance._dispatch(name, args)
+
+
 class Server(SimpleXMLRPCServer):
     """Version of a `SimpleXMLRPCServer` that can be cleanly terminated from the client side.
 
+    Parameters
+    ----------
+    addr : tuple
+        The host and port of the server.
+    workers : int, optional
+        The number of requests that are handled at the same time.
+        Default is ``None``, in which case requests are handled one at a time.
+    pool : {'threads', 'processes'}, optional
+        Where the calls to the registered instance are executed if ``workers`` is set.
+        With ``'threads'``, every request is handled in its own thread of a pool of worker threads.
+        With ``'processes'``, the calls to the registered instance are forwarded to a pool of worker processes,
+        such that they run in isolation from each other and from the server.
+        Default is ``'threads'``.
+    queue_size : int, optional
+        The maximum number of requests waiting for a free worker.
+        Requests beyond this limit are answered immediately with an error.
+        Default is ``None``, in which case the number of waiting requests is not limited.
+    kwargs : dict, optional
+        Additional keyword arguments for `SimpleXMLRPCServer`.
+
     Examples
     --------
     .. code-block:: python
@@ -32,20 +74,52 @@ class Server(SimpleXMLRPCServer):
 
         if __name__ == '__main__':
 
-            server = Server(("localhost", 8888))
+            server = Server(("localhost", 8888), workers=4, queue_size=16)
 
             server.register_function(server.ping)
             server.register_function(server.remote_shutdown)
             server.register_instance(DefaultService())
-            server.serve_forever()
+            try:
+                server.serve_forever()
+            finally:
+                server.server_close()
 
     Notes
     -----
     This class has to be used by a service to start the XMLRPC server in a way
     that can be pinged to check if the server is live, and can be cleanly terminated.
 
+    The explicitly registered functions, such as :meth:`ping` and :meth:`remote_shutdown`,
+    are always executed by the server itself, and are never rejected.
+    The server supports ``system.multicall``, for handling several calls in one request.
+    The calls of such a request are executed one after the other,
+    and the ones to the registered instance are rejected individually if the server is busy.
+    For a pool of processes, the registered instance has to be picklable,
+    and every worker process uses its own copy of it.
+    Therefore, with more than one worker process, objects can't be kept on the server
+    under a :class:`compas.rpc.RemoteHandle`.
+    The worker processes are started fresh, not forked from the server,
+    so the class of the instance has to be importable from its module.
+
     """
 
+    def __init__(self, addr, workers=None, pool='threads', queue_size=None, **kwargs):
+        if pool not in ('threads', 'processes'):
+            raise ValueError("Pool should be 'threads' or 'processes': {}".format(pool))
+        SimpleXMLRPCServer.__init__(self, addr, **kwargs)
+        self.register_multicall_functions()
+        self.workers = workers
+        self.pool = pool
+        self.queue_size = queue_size
+        self._threads = None
+        self._processes = None
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        if workers:
+            from multiprocessing.pool import ThreadPool
+            self._threads = ThreadPool(workers)
+
     def ping(self):
         """Simple function used to check if a remote server can be reached.
 
@@ -63,6 +137,69 @@ class Server(SimpleXMLRPCServer):
     def _shutdown_thread(self):
         self.shutdown()
 
+    def register_instance(self, instance, *args, **kwargs):
+        SimpleXMLRPCServer.register_instance(self, instance, *args, **kwargs)
+        if self.workers and self.pool == 'processes':
+            import multiprocessing
+            try:
+                # forking the server, with its threads, is not safe
+                context = multiprocessing.get_context('spawn')
+            except AttributeError:
+                context = multiprocessing
+            if self._processes is not None:
+                self._processes.terminate()
+            self._processes = context.Pool(self.workers, _init_worker, (instance, self.workers))
+
+    def process_request(self, request, client_address):
+        """Handle a request in a worker thread, or reject it if the queue is full."""
+        if not self._threads:
+            return SimpleXMLRPCServer.process_request(self, request, client_address)
+        with self._lock:
+            full = self.queue_size is not None and self._pending >= self.workers + self.queue_size
+            if not full:
+                self._pending += 1
+        if full:
+            # answered immediately, by the thread of the server
+            self._local.rejected = True
+            try:
+                SimpleXMLRPCServer.process_request(self, request, client_address)
+            finally:
+                self._local.rejected = False
+            return
+        self._threads.apply_async(self._process_request_worker, (request, client_address))
+
+    def _process_request_worker(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            with self._lock:
+                self._pending -= 1
+
+    def _dispatch(self, method, params):
+        if method not in self.funcs:
+            if getattr(self._local, 'rejected', False):
+                odict = {
+                    'data': None,
+                    'error': "The server is busy: {0} requests are in progress or waiting.".format(self._pending),
+                    'profile': None
+                }
+                return json.dumps(odict)
+            if self._processes is not None:
+                return self._processes.apply(_dispatch_in_worker, (method, params))
+        return SimpleXMLRPCServer._dispatch(self, method, params)
+
+    def server_close(self):
+        SimpleXMLRPCServer.server_close(self)
+        if self._threads is not None:
+            self._threads.close()
+            self._threads = None
+        if self._processes is not None:
+            self._processes.terminate()
+            self._processes = None
+
 
 # ==============================================================================
 # Main
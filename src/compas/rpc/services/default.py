@@ -56,12 +56,13 @@ class ModuleReloader(PatternMatchingEventHandler):
                     sys.modules.pop(module)
 
 
-def start_service(port, autoreload, **kwargs):
+def start_service(port, autoreload, workers=None, pool='threads', queue_size=None, **kwargs):
     print('Starting default RPC service on port {0}...'.format(port))
 
     # start the server on *localhost*
     # and listen to requests on port *1753*
-    server = Server(("0.0.0.0", port))
+    # with a pool of workers, several requests are handled at the same time
+    server = Server(("0.0.0.0", port), workers=workers, pool=pool, queue_size=queue_size)
 
     # register a few utility functions
     server.register_function(server.ping)
@@ -78,7 +79,11 @@ def start_service(port, autoreload, **kwargs):
 
     print('Listening{}...'.format(' with autoreload of modules enabled' if autoreload else ''))
     print('Press CTRL+C to abort')
-    server.serve_forever()
+    try:
+        server.serve_forever()
+    finally:
+        # stop the pool of workers
+        server.server_close()
 
 
 # ==============================================================================
@@ -92,6 +97,9 @@ if __name__ == '__main__':
     parser.add_argument('--port', '-p', action='store', default=1753, type=int, help='RPC port number')
     parser.add_argument('--autoreload', dest='autoreload', action='store_true', help='Autoreload modules')
     parser.add_argument('--no-autoreload', dest='autoreload', action='store_false', help='Do not autoreload modules')
+    parser.add_argument('--workers', '-w', action='store', default=None, type=int, help='Number of requests handled at the same time')
+    parser.add_argument('--pool', action='store', default='threads', choices=['threads', 'processes'], help='Type of worker pool')
+    parser.add_argument('--queue-size', action='store', default=None, type=int, help='Maximum number of waiting requests')
     parser.set_defaults(autoreload=True, func=start_service)
 
     args = parser.parse_args()
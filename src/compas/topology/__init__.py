@@ -53,6 +53,8 @@ Traversal
     breadth_first_paths
     depth_first_ordering
     dijkstra_distances
+    dijkstra_distances_numpy
+    dijkstra_multi_distances
     dijkstra_path
     shortest_path
 
@@ -71,6 +73,7 @@ if compas.IPY:
     from .orientation_rhino import *  # noqa: F401 F403
 else:
     from .orientation_numpy import *  # noqa: F401 F403
+    from .traversal_numpy import *  # noqa: F401 F403
 
 from .connectivity import *  # noqa: F401 F403
 
@@ -2,10 +2,7 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
-from compas.geometry import KDTree
-
 from compas.utilities import pairwise
-from compas.geometry import centroid_points
 from compas.topology import breadth_first_traverse
 
 
@@ -63,6 +60,26 @@ def unify_cycles(vertices, faces, root=0):
     return faces
 
 
+def _face_adjacency(faces):
+    """Construct a face adjacency dict from pairs of face identifiers and face vertices."""
+    faces = list(faces)
+    edge_faces = {}
+    for face, vertices in faces:
+        for u, v in pairwise(vertices + vertices[0:1]):
+            edge_faces.setdefault((u, v) if u < v else (v, u), []).append(face)
+    adjacency = {}
+    for face, vertices in faces:
+        nbrs = []
+        found = set([face])
+        for u, v in pairwise(vertices + vertices[0:1]):
+            for nbr in edge_faces[(u, v) if u < v else (v, u)]:
+                if nbr not in found:
+                    nbrs.append(nbr)
+                    found.add(nbr)
+        adjacency[face] = nbrs
+    return adjacency
+
+
 def face_adjacency(xyz, faces):
     """Construct an adjacency dictionary of the given faces, assuming that the faces have arbitrary orientation.
 
@@ -78,6 +95,13 @@ def face_adjacency(xyz, faces):
     dict
         For every face a list of neighbouring faces.
 
+    Notes
+    -----
+    Faces are neighbours if they share an edge, regardless of the direction in which they traverse it.
+    The faces of every edge are collected in a dictionary,
+    such that the adjacency is constructed in linear time.
+    The coordinates are not used.
+
     Examples
     --------
     >>> vertices = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 1.0, 1.0]]
@@ -85,61 +109,7 @@ def face_adjacency(xyz, faces):
     >>> face_adjacency(vertices, faces)
     {0: [1], 1: [0]}
     """
-    f = len(faces)
-    if f > 100:
-        return _face_adjacency(xyz, faces)
-    adjacency = {}
-    for face, vertices in enumerate(faces):
-        nbrs = []
-        found = set()
-        for u, v in pairwise(vertices + vertices[0:1]):
-            for nbr, _ in enumerate(faces):
-                if nbr == face:
-                    continue
-                if nbr in found:
-                    continue
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if v == a and u == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if u == a and v == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-        adjacency[face] = nbrs
-    return adjacency
-
-
-def _face_adjacency(xyz, faces, nmax=10, radius=2.0):
-    points = [centroid_points([xyz[index] for index in face]) for face in faces]
-    tree = KDTree(points)
-    closest = [tree.nearest_neighbors(point, nmax) for point in points]
-    closest = [[index for _, index, _ in nnbrs] for nnbrs in closest]
-    adjacency = {}
-    for face, vertices in enumerate(faces):
-        nbrs = []
-        found = set()
-        nnbrs = set(closest[face])
-        for u, v in pairwise(vertices + vertices[0:1]):
-            for nbr in nnbrs:
-                if nbr == face:
-                    continue
-                if nbr in found:
-                    continue
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if v == a and u == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if u == a and v == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-        adjacency[face] = nbrs
-    return adjacency
+    return _face_adjacency(enumerate(faces))
 
 
 # ==============================================================================
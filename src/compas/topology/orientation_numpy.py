@@ -2,10 +2,22 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
-from scipy.spatial import cKDTree
+from itertools import chain
+
+from numpy import arange
+from numpy import array
+from numpy import bincount
+from numpy import cumsum
+from numpy import flatnonzero
+from numpy import fromiter
+from numpy import lexsort
+from numpy import maximum
+from numpy import minimum
+from numpy import ones
+from numpy import repeat
+from numpy import unique
 
 from compas.utilities import pairwise
-from compas.geometry import centroid_points
 from compas.topology import breadth_first_traverse
 
 
@@ -41,7 +53,7 @@ def unify_cycles_numpy(vertices, faces, root=0):
     --------
     >>> vertices = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 1.0, 1.0]]
     >>> faces = [[0, 1, 2], [0, 3, 2]]
-    >>> unify_cycles(vertices, faces)
+    >>> unify_cycles_numpy(vertices, faces)
     [[0, 1, 2], [2, 3, 0]]
     """
     def unify(node, nbr):
@@ -78,67 +90,66 @@ def face_adjacency_numpy(xyz, faces):
     dict
         For every face a list of neighbouring faces.
 
+    Notes
+    -----
+    The result is the same as the result of :func:`compas.topology.face_adjacency`.
+    The edges of all faces are sorted in one vectorised pass,
+    and neighbours are found among the faces with the same edge.
+    The coordinates are not used.
+
     Examples
     --------
     >>> vertices = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 1.0, 1.0]]
     >>> faces = [[0, 1, 2], [0, 3, 2]]
-    >>> face_adjacency(vertices, faces)
+    >>> face_adjacency_numpy(vertices, faces)
     {0: [1], 1: [0]}
     """
     f = len(faces)
-    if f > 100:
-        return _face_adjacency(xyz, faces)
-    adjacency = {}
-    for face, vertices in enumerate(faces):
-        nbrs = []
-        found = set()
-        for u, v in pairwise(vertices + vertices[0:1]):
-            for nbr, _ in enumerate(faces):
-                if nbr == face:
-                    continue
-                if nbr in found:
-                    continue
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if v == a and u == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if u == a and v == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-        adjacency[face] = nbrs
-    return adjacency
-
-
-def _face_adjacency(xyz, faces, nmax=10, radius=2.0):
-    points = [centroid_points([xyz[index] for index in face]) for face in faces]
-    k = min(len(faces), nmax)
-    tree = cKDTree(points)
-    _, closest = tree.query(points, k=k, n_jobs=-1)
-    adjacency = {}
-    for face, vertices in enumerate(faces):
-        nbrs = []
-        found = set()
-        nnbrs = set(closest[face])
-        for u, v in pairwise(vertices + vertices[0:1]):
-            for nbr in nnbrs:
-                if nbr == face:
-                    continue
-                if nbr in found:
-                    continue
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if v == a and u == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if u == a and v == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-        adjacency[face] = nbrs
+    if not f:
+        return {}
+    sizes = array([len(vertices) for vertices in faces], dtype=int)
+    ends = cumsum(sizes)
+    starts = ends - sizes
+    u = fromiter(chain.from_iterable(faces), dtype=int, count=ends[-1])
+    following = arange(1, len(u) + 1)
+    following[ends - 1] = starts
+    v = u[following]
+    face = repeat(arange(f), sizes)
+    # group the halfedges per undirected edge
+    a = minimum(u, v)
+    b = maximum(u, v)
+    order = lexsort((arange(len(u)), b, a))
+    a = a[order]
+    b = b[order]
+    start = ones(len(order), dtype=bool)
+    start[1:] = (a[1:] != a[:-1]) | (b[1:] != b[:-1])
+    group = cumsum(start) - 1
+    first = flatnonzero(start)
+    count = bincount(group)
+    # all ordered pairs of halfedges of the same edge
+    size = count[group]
+    i = repeat(arange(len(order)), size)
+    j = first[group][i] + (arange(len(i)) - repeat(cumsum(size) - size, size))
+    i = order[i]
+    j = order[j]
+    fi = face[i]
+    fj = face[j]
+    keep = fi != fj
+    i = i[keep]
+    fi = fi[keep]
+    fj = fj[keep]
+    # per face, the neighbours in the order of the halfedges of the face and of the neighbours
+    order = lexsort((fj, i))
+    fi = fi[order]
+    fj = fj[order]
+    pairs = fi * f + fj
+    _, index = unique(pairs, return_index=True)
+    index.sort()
+    fi = fi[index].tolist()
+    fj = fj[index].tolist()
+    adjacency = {face: [] for face in range(f)}
+    for face, nbr in zip(fi, fj):
+        adjacency[face].append(nbr)
     return adjacency
 
 
@@ -2,13 +2,9 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
-from Rhino.Geometry import RTree
-from Rhino.Geometry import Sphere
-from Rhino.Geometry import Point3d
-
 from compas.utilities import pairwise
-from compas.geometry import centroid_points
 from compas.topology import breadth_first_traverse
+from compas.topology.orientation import _face_adjacency
 
 
 __all__ = [
@@ -46,9 +42,6 @@ def unify_cycles_rhino(vertices, faces, root=0):
     >>> unify_cycles_rhino(vertices, faces)
     [[0, 1, 2], [2, 3, 0]]
 
-    Notes
-    -----
-    This function uses Rhino's RTree for constructing a face adjacency dict.
     """
     def unify(node, nbr):
         # find the common edge
@@ -93,75 +86,9 @@ def face_adjacency_rhino(xyz, faces):
 
     Notes
     -----
-    This function uses Rhino's RTree for limiting the search for neighbours
-    to the immediate surroundings of any given face
-    if the number of faces is greater than 100.
+    This function is equivalent to :func:`compas.topology.face_adjacency`.
     """
-    f = len(faces)
-    if f > 100:
-        return _face_adjacency(xyz, faces)
-    adjacency = {}
-    for face, vertices in enumerate(faces):
-        nbrs = []
-        found = set()
-        for u, v in pairwise(vertices + vertices[0:1]):
-            for nbr, _ in enumerate(faces):
-                if nbr == face:
-                    continue
-                if nbr in found:
-                    continue
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if v == a and u == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if u == a and v == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-        adjacency[face] = nbrs
-    return adjacency
-
-
-def _face_adjacency(xyz, faces, nmax=10, radius=2.0):
-    points = [centroid_points([xyz[index] for index in face]) for face in faces]
-    tree = RTree()
-    for i, point in enumerate(points):
-        tree.Insert(Point3d(* point), i)
-
-    def callback(sender, e):
-        data = e.Tag
-        data.append(e.Id)
-    closest = []
-    for i, point in enumerate(points):
-        sphere = Sphere(Point3d(* point), radius)
-        data = []
-        tree.Search(sphere, callback, data)
-        closest.append(data)
-    adjacency = {}
-    for face, vertices in enumerate(faces):
-        nbrs = []
-        found = set()
-        nnbrs = set(closest[face])
-        for u, v in pairwise(vertices + vertices[0:1]):
-            for nbr in nnbrs:
-                if nbr == face:
-                    continue
-                if nbr in found:
-                    continue
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if v == a and u == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if u == a and v == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-        adjacency[face] = nbrs
-    return adjacency
+    return _face_adjacency(enumerate(faces))
 
 
 # ==============================================================================
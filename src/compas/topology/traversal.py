@@ -8,6 +8,9 @@ except ImportError:
     from Queue import PriorityQueue
 
 from collections import deque
+from heapq import heappop
+from heapq import heappush
+from itertools import count
 
 from compas.geometry import distance_point_point
 
@@ -20,6 +23,7 @@ __all__ = [
     'shortest_path',
     'astar_shortest_path',
     'dijkstra_distances',
+    'dijkstra_multi_distances',
     'dijkstra_path'
 ]
 
@@ -422,7 +426,44 @@ def astar_shortest_path(network, root, goal):
     return reconstruct_path(came_from, goal)
 
 
-def dijkstra_distances(adjacency, weight, target):
+# ==============================================================================
+# Dijkstra
+# ==============================================================================
+
+
+def _dijkstra(adjacency, weight, targets, source=None, cutoff=None):
+    # grow shortest path trees from the targets with a binary heap
+    # the search stops when the source is settled, or when the remaining distances exceed the cutoff
+    distance = {}
+    predecessor = {}
+    tiebreak = count()
+    heap = []
+    for target in targets:
+        distance[target] = 0
+        predecessor[target] = None
+        heappush(heap, (0, next(tiebreak), target))
+    settled = set()
+    while heap:
+        d, _, u = heappop(heap)
+        if u in settled:
+            continue
+        if cutoff is not None and d > cutoff:
+            break
+        settled.add(u)
+        if u == source:
+            break
+        for v in adjacency[u]:
+            if v in settled:
+                continue
+            dv = d + weight[(u, v)]
+            if v not in distance or dv < distance[v]:
+                distance[v] = dv
+                predecessor[v] = u
+                heappush(heap, (dv, next(tiebreak), v))
+    return distance, predecessor, settled
+
+
+def dijkstra_distances(adjacency, weight, target, cutoff=None):
     """Compute Dijkstra distances from all vertices in a connected set to one target vertex.
 
     Parameters
@@ -434,33 +475,64 @@ def dijkstra_distances(adjacency, weight, target):
         A dictionary of edge weights.
     target : str
         The key of the vertex to which the distances are computed.
+    cutoff : float, optional
+        Stop the search at this distance.
+        Vertices further away from the target are treated as unreachable.
 
     Returns
     -------
     dict
         A dictionary of distances to the target.
+        Vertices that can't reach the target have a distance of ``1e+17``.
 
-    Notes:
-        ...
+    Notes
+    -----
+    The next vertex is selected from a binary heap,
+    which brings the complexity of the search down to ``O((V + E) log V)``.
 
     Examples
     --------
-    >>>
+    >>> adjacency = {0: [1], 1: [0, 2], 2: [1]}
+    >>> weight = {(0, 1): 1.0, (1, 0): 1.0, (1, 2): 2.0, (2, 1): 2.0}
+    >>> dijkstra_distances(adjacency, weight, 0)
+    {0: 0, 1: 1.0, 2: 3.0}
+
     """
-    adjacency = {key: set(nbrs) for key, nbrs in adjacency.items()}
-    distance = {key: (0 if key == target else 1e+17) for key in adjacency}
-    tovisit = set(adjacency.keys())
-    visited = set()
+    return dijkstra_multi_distances(adjacency, weight, [target], cutoff=cutoff)
 
-    while tovisit:
-        u = min(tovisit, key=lambda k: distance[k])
-        tovisit.remove(u)
-        visited.add(u)
-        for v in adjacency[u] - visited:
-            d = distance[u] + weight[(u, v)]
-            if d < distance[v]:
-                distance[v] = d
-    return distance
+
+def dijkstra_multi_distances(adjacency, weight, targets, cutoff=None):
+    """Compute Dijkstra distances from all vertices to the closest of multiple target vertices.
+
+    Parameters
+    ----------
+    adjacency : dict
+        An adjacency dictionary. Each key represents a vertex
+        and maps to a list of neighboring vertex keys.
+    weight : dict
+        A dictionary of edge weights.
+    targets : list
+        The keys of the vertices to which the distances are computed.
+    cutoff : float, optional
+        Stop the search at this distance.
+        Vertices further away from the targets are treated as unreachable.
+
+    Returns
+    -------
+    dict
+        A dictionary of distances to the closest target.
+        Vertices that can't reach any of the targets have a distance of ``1e+17``.
+
+    Examples
+    --------
+    >>> adjacency = {0: [1], 1: [0, 2], 2: [1]}
+    >>> weight = {(0, 1): 1.0, (1, 0): 1.0, (1, 2): 2.0, (2, 1): 2.0}
+    >>> dijkstra_multi_distances(adjacency, weight, [0, 2])
+    {0: 0, 1: 1.0, 2: 0}
+
+    """
+    distance, _, settled = _dijkstra(adjacency, weight, targets, cutoff=cutoff)
+    return {key: (distance[key] if key in settled else 1e+17) for key in adjacency}
 
 
 def dijkstra_path(adjacency, weight, source, target, dist=None):
@@ -478,11 +550,15 @@ def dijkstra_path(adjacency, weight, source, target, dist=None):
         The start vertex.
     target : str
         The end vertex.
+    dist : dict, optional
+        Precomputed distances to the target, for example with :func:`dijkstra_distances`.
+        If provided, the path follows the distances down to the target.
+        Otherwise, a search is run from the target that stops as soon as the source is reached.
 
     Returns
     -------
-    list
-        The shortest path.
+    list, None
+        The shortest path, or None, if no path exists between the vertices.
 
     Notes
     -----
@@ -492,16 +568,26 @@ def dijkstra_path(adjacency, weight, source, target, dist=None):
 
     Examples
     --------
-    >>>
+    >>> adjacency = {0: [1, 2], 1: [0, 2], 2: [0, 1]}
+    >>> weight = {(0, 1): 1.0, (1, 0): 1.0, (1, 2): 1.0, (2, 1): 1.0, (0, 2): 5.0, (2, 0): 5.0}
+    >>> dijkstra_path(adjacency, weight, 0, 2)
+    [0, 1, 2]
+
     """
-    if not dist:
-        dist = dijkstra_distances(adjacency, weight, target)
+    if dist:
+        path = [source]
+        node = source
+        while node != target:
+            node = min(adjacency[node], key=lambda nbr: dist[nbr] + weight[(node, nbr)])
+            path.append(node)
+        return path
+    _, predecessor, settled = _dijkstra(adjacency, weight, [target], source=source)
+    if source not in settled:
+        return None
     path = [source]
     node = source
-    node = min(adjacency[node], key=lambda nbr: dist[nbr] + weight[(node, nbr)])
-    path.append(node)
     while node != target:
-        node = min(adjacency[node], key=lambda nbr: dist[nbr] + weight[(node, nbr)])
+        node = predecessor[node]
         path.append(node)
     return path
 
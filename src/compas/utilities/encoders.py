@@ -2,12 +2,31 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+import array
+import base64
 import json
+import sys
 
 
 __all__ = ['DataDecoder', 'DataEncoder']
 
 
+# typecodes of the array module for the array types that can be decoded without numpy
+ARRAY_TYPECODES = {
+    'f8': 'd',
+    'f4': 'f',
+    'i8': 'q',
+    'i4': 'i',
+    'i2': 'h',
+    'i1': 'b',
+    'u8': 'Q',
+    'u4': 'I',
+    'u2': 'H',
+    'u1': 'B',
+    'b1': 'B',
+}
+
+
 def cls_from_dtype(dtype):
     """Get the class object corresponding to a COMPAS data type specification.
 
@@ -40,15 +59,111 @@ class DecoderError(Exception):
     pass
 
 
+def ndarray_to_data(a):
+    """Encode a numpy array as a dictionary with its type, its shape and its raw bytes.
+
+    Parameters
+    ----------
+    a : array
+        The array.
+
+    Returns
+    -------
+    dict
+        The base64 encoded little-endian bytes of the array under the key ``'__ndarray__'``,
+        the type of the array under the key ``'type'``,
+        and the shape of the array under the key ``'shape'``.
+
+    """
+    import numpy as np
+    a = np.ascontiguousarray(a)
+    a = a.astype(a.dtype.newbyteorder('<'), copy=False)
+    return {
+        '__ndarray__': base64.b64encode(a.tobytes()).decode('ascii'),
+        'type': a.dtype.str,
+        'shape': list(a.shape)
+    }
+
+
+def ndarray_from_data(data):
+    """Decode a numpy array from a dictionary created by :func:`ndarray_to_data`.
+
+    Parameters
+    ----------
+    data : dict
+        The encoded array.
+
+    Returns
+    -------
+    array or list
+        The array, or, if numpy is not available, the values of the array in nested lists.
+
+    Raises
+    ------
+    DecoderError
+        If numpy is not available and the type of the array is not supported.
+
+    """
+    raw = base64.b64decode(data['__ndarray__'])
+    shape = data['shape']
+    try:
+        import numpy as np
+    except ImportError:
+        pass
+    else:
+        return np.frombuffer(raw, dtype=data['type']).reshape(shape).copy()
+
+    kind = data['type'][1:]
+    if kind not in ARRAY_TYPECODES:
+        raise DecoderError("Arrays of type {} can't be decoded without numpy.".format(data['type']))
+    values = array.array(ARRAY_TYPECODES[kind])
+    if hasattr(values, 'frombytes'):
+        values.frombytes(raw)
+    else:
+        values.fromstring(raw)
+    if sys.byteorder != 'little':
+        values.byteswap()
+    values = values.tolist()
+    if kind == 'b1':
+        values = [bool(value) for value in values]
+    if not shape:
+        return values[0]
+    for n in reversed(shape[1:]):
+        values = [values[i:i + n] for i in range(0, len(values), n)]
+    return values
+
+
 class DataEncoder(json.JSONEncoder):
     """Data encoder for custom JSON serialisation with support for COMPAS data structures and geometric primitives.
 
+    Parameters
+    ----------
+    binary_arrays : bool, optional
+        If ``True``, numpy arrays are encoded as their raw bytes, with their type and shape,
+        instead of as nested lists of values.
+        Arrays of Python objects are always encoded as lists.
+        Default is ``False``.
+
     Notes
     -----
     In the context of Remote Procedure Calls,
+    binary arrays are much smaller and much faster to encode and decode than nested lists.
+    :class:`DataDecoder` converts them back to numpy arrays,
+    or to nested lists if numpy is not available, for example in IronPython.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> s = json.dumps(np.arange(3.0), cls=DataEncoder, binary_arrays=True)
+    >>> json.loads(s, cls=DataDecoder)
+    array([0., 1., 2.])
 
     """
 
+    def __init__(self, *args, **kwargs):
+        self.binary_arrays = kwargs.pop('binary_arrays', False)
+        super(DataEncoder, self).__init__(*args, **kwargs)
+
     def default(self, o):
         if hasattr(o, 'to_data'):
             value = o.to_data()
@@ -70,6 +185,8 @@ class DataEncoder(json.JSONEncoder):
             pass
         else:
             if isinstance(o, np.ndarray):
+                if self.binary_arrays and not o.dtype.hasobject:
+                    return ndarray_to_data(o)
                 return o.tolist()
             if isinstance(o, (np.int32, np.int64)):
                 return int(o)
@@ -94,12 +211,19 @@ class DataEncoder(json.JSONEncoder):
 
 
 class DataDecoder(json.JSONDecoder):
-    """Data decoder for custom JSON serialisation with support for COMPAS data structures and geometric primitives."""
+    """Data decoder for custom JSON serialisation with support for COMPAS data structures and geometric primitives.
+
+    Arrays encoded by :class:`DataEncoder` with ``binary_arrays=True`` are decoded as numpy arrays,
+    or as nested lists if numpy is not available.
+    """
 
     def __init__(self, *args, **kwargs):
         super(DataDecoder, self).__init__(object_hook=self.object_hook, *args, **kwargs)
 
     def object_hook(self, o):
+        if '__ndarray__' in o:
+            return ndarray_from_data(o)
+
         if 'dtype' not in o:
             return o
 
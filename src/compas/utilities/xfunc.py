@@ -3,8 +3,11 @@ from __future__ import absolute_import
 from __future__ import division
 
 import os
+import sys
+import base64
 import json
 import tempfile
+import threading
 
 import compas
 import compas._os
@@ -27,7 +30,7 @@ except ImportError:
         compas.raise_if_ironpython()
 
 
-__all__ = ['XFunc']
+__all__ = ['XFunc', 'XFuncWorker']
 
 
 WRAPPER = """
@@ -59,6 +62,7 @@ funcname   = sys.argv[2]
 ipath      = sys.argv[3]
 opath      = sys.argv[4]
 serializer = sys.argv[5]
+binary     = len(sys.argv) > 6 and sys.argv[6] == '1'
 
 if serializer == 'json':
     with open(ipath, 'r') as fo:
@@ -109,7 +113,7 @@ else:
 
 if serializer == 'json':
     with open(opath, 'w+') as fo:
-        json.dump(odict, fo, cls=DataEncoder)
+        json.dump(odict, fo, cls=DataEncoder, binary_arrays=binary)
 else:
     with open(opath, 'wb+') as fo:
         # pickle.dump(odict, fo, protocol=pickle.HIGHEST_PROTOCOL)
@@ -118,6 +122,335 @@ else:
 """
 
 
+WORKER = """
+import sys
+import base64
+import importlib
+
+import json
+
+try:
+    import cPickle as pickle
+except Exception:
+    import pickle
+
+try:
+    from cStringIO import StringIO
+except Exception:
+    from io import StringIO
+
+import cProfile
+import pstats
+import traceback
+
+from compas.utilities import DataEncoder
+from compas.utilities import DataDecoder
+
+SENTINEL = sys.argv[1]
+
+while True:
+    line = sys.stdin.readline()
+    if not line or line.strip() == 'exit':
+        break
+
+    request = json.loads(line)
+    serializer = request['serializer']
+
+    try:
+        if serializer == 'json':
+            idict = json.loads(request['data'], cls=DataDecoder)
+        else:
+            idict = pickle.loads(base64.b64decode(request['data']))
+
+        args   = idict['args']
+        kwargs = idict['kwargs']
+
+        profile = cProfile.Profile()
+        profile.enable()
+
+        try:
+            if request['basedir'] not in sys.path:
+                sys.path.insert(0, request['basedir'])
+            parts = request['funcname'].split('.')
+
+            if len(parts) > 1:
+                mname = '.'.join(parts[:-1])
+                fname = parts[-1]
+                m = importlib.import_module(mname)
+                f = getattr(m, fname)
+            else:
+                raise Exception('Cannot import the function because no module name is specified.')
+
+            r = f(*args, **kwargs)
+
+        finally:
+            # the process is reused, so the profiler may not stay active
+            profile.disable()
+
+        stream = StringIO()
+        stats  = pstats.Stats(profile, stream=stream)
+        stats.sort_stats(1)
+        stats.print_stats(20)
+
+    except Exception:
+        odict = {}
+        odict['error']      = traceback.format_exc()
+        odict['data']       = None
+        odict['profile']    = None
+
+    else:
+        odict = {}
+        odict['error']      = None
+        odict['data']       = r
+        odict['profile']    = stream.getvalue()
+
+    if serializer == 'json':
+        try:
+            payload = json.dumps(odict, cls=DataEncoder, binary_arrays=request['binary_arrays'])
+        except Exception:
+            payload = json.dumps({'error': traceback.format_exc(), 'data': None, 'profile': None})
+    else:
+        payload = base64.b64encode(pickle.dumps(odict, protocol=2)).decode('ascii')
+
+    sys.stdout.flush()
+    sys.stdout.write(SENTINEL + '\\n')
+    sys.stdout.write(payload + '\\n')
+    sys.stdout.flush()
+
+"""
+
+
+def _forward_stderr(stream):
+    for line in iter(stream.readline, ''):
+        # looked up for every line, because it can be replaced or missing, e.g. with pythonw
+        if sys.stderr is not None:
+            sys.stderr.write(line)
+            sys.stderr.flush()
+
+
+class XFuncWorker(object):
+    """A Python process that stays alive between calls to wrapped functions.
+
+    The process keeps the modules of the wrapped functions imported,
+    and exchanges the input and output of every call with the caller over its standard streams,
+    instead of through files.
+
+    Parameters
+    ----------
+    python : str, optional
+        The Python executable.
+        Default is ``'pythonw'``.
+
+    Notes
+    -----
+    The worker is started on the first call, and is restarted automatically if it has stopped.
+    Everything the wrapped functions print is passed on line by line to the caller,
+    until a marker at the end of a line announces the output of the call.
+    What they write to the standard error stream is forwarded to the standard error stream of the caller.
+
+    The worker can be used from several threads.
+    Its calls are then handled one after the other.
+
+    Use :meth:`shared` to get the worker used by all instances of :class:`XFunc` with ``persistent=True``.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from compas.utilities import XFunc
+        from compas.utilities import XFuncWorker
+
+        with XFuncWorker(python='python') as worker:
+            fd_numpy = XFunc('compas.numerical.fd_numpy', worker=worker)
+            ...
+
+    """
+
+    SENTINEL = '__compas_xfunc_output__'
+
+    _shared = {}
+
+    def __init__(self, python=None):
+        self.python = compas._os.select_python(python)
+        self._process = None
+        self._lock = threading.RLock()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @classmethod
+    def shared(cls, python=None):
+        """Get the shared worker for a Python executable.
+
+        Parameters
+        ----------
+        python : str, optional
+            The Python executable.
+
+        Returns
+        -------
+        :class:`XFuncWorker`
+        """
+        python = compas._os.select_python(python)
+        if python not in cls._shared:
+            cls._shared[python] = cls(python)
+        return cls._shared[python]
+
+    @property
+    def is_running(self):
+        """bool: ``True`` if the worker process is alive."""
+        if self._process is None:
+            return False
+        try:
+            return self._process.poll() is None
+        except AttributeError:
+            return not self._process.HasExited
+
+    def start(self):
+        """Start the worker process, if it is not running yet."""
+        with self._lock:
+            self._start()
+
+    def _start(self):
+        if self.is_running:
+            return
+        env = compas._os.prepare_environment()
+        try:
+            Popen
+        except NameError:
+            process = Process()
+            for name in env:
+                if process.StartInfo.EnvironmentVariables.ContainsKey(name):
+                    process.StartInfo.EnvironmentVariables[name] = env[name]
+                else:
+                    process.StartInfo.EnvironmentVariables.Add(name, env[name])
+            process.StartInfo.UseShellExecute = False
+            process.StartInfo.RedirectStandardInput = True
+            process.StartInfo.RedirectStandardOutput = True
+            process.StartInfo.FileName = self.python
+            process.StartInfo.Arguments = '-u -c "{0}" {1}'.format(WORKER, self.SENTINEL)
+            process.Start()
+        else:
+            process = Popen([self.python, '-u', '-c', WORKER, self.SENTINEL],
+                            stdin=PIPE, stdout=PIPE, stderr=PIPE, env=env, universal_newlines=True)
+            # the output of the calls is read from stdout only,
+            # but stderr has to be read as well, otherwise the process blocks once the pipe is full
+            thread = threading.Thread(target=_forward_stderr, args=(process.stderr,))
+            thread.daemon = True
+            thread.start()
+        self._process = process
+
+    def stop(self):
+        """Stop the worker process."""
+        with self._lock:
+            self._stop()
+
+    def _stop(self):
+        if not self.is_running:
+            self._process = None
+            return
+        try:
+            self._write_line('exit')
+        except Exception:
+            pass
+        try:
+            self._process.wait()
+        except AttributeError:
+            self._process.WaitForExit()
+        self._process = None
+
+    def _write_line(self, line):
+        try:
+            self._process.stdin.write(line + '\n')
+            self._process.stdin.flush()
+        except AttributeError:
+            self._process.StandardInput.WriteLine(line)
+            self._process.StandardInput.Flush()
+
+    def _read_line(self):
+        try:
+            return self._process.stdout.readline()
+        except AttributeError:
+            line = self._process.StandardOutput.ReadLine()
+            return '' if line is None else line + '\n'
+
+    def call(self, funcname, basedir, data, serializer='json', binary_arrays=False, callback=None, callback_args=None, verbose=True):
+        """Call a function in the worker process.
+
+        Parameters
+        ----------
+        funcname : str
+            The full name of the function.
+        basedir : str
+            A directory that should be added to the PYTHONPATH such that the function can be found.
+        data : str
+            The serialised input dictionary, with the positional arguments under the key ``'args'``
+            and the named arguments under the key ``'kwargs'``:
+            a JSON string, or the base64 encoded pickle.
+        serializer : {'json', 'pickle'}, optional
+            The serialisation of ``data`` and of the output.
+            Default is ``'json'``.
+        binary_arrays : bool, optional
+            Encode numpy arrays in the JSON output as raw bytes.
+            Default is ``False``.
+        callback : callable, optional
+            A function called with every line printed by the wrapped function, and ``callback_args``.
+        callback_args : tuple, optional
+            Additional parameters for the callback function.
+        verbose : bool, optional
+            Print the lines printed by the wrapped function.
+            Default is ``True``.
+
+        Returns
+        -------
+        str
+            The serialised output dictionary.
+
+        Raises
+        ------
+        Exception
+            If the worker process stops before returning the output.
+        """
+        request = {
+            'funcname': funcname,
+            'basedir': basedir,
+            'serializer': serializer,
+            'binary_arrays': binary_arrays,
+            'data': data
+        }
+        # the exchange of a call may not be mixed with the one of a call from another thread
+        with self._lock:
+            self._start()
+            self._write_line(json.dumps(request))
+            return self._read_output(callback, callback_args, verbose)
+
+    def _read_output(self, callback, callback_args, verbose):
+        while True:
+            line = self._read_line()
+            if not line:
+                self._process = None
+                raise Exception("The XFunc worker stopped unexpectedly.")
+            line = line.rstrip('\r\n')
+            if line.endswith(self.SENTINEL):
+                # the last output of the function may not end with a newline
+                output = self._read_line().rstrip('\r\n')
+                line = line[:-len(self.SENTINEL)]
+                if line:
+                    if callback:
+                        callback(line, callback_args)
+                    if verbose:
+                        print(line)
+                return output
+            if callback:
+                callback(line, callback_args)
+            if verbose:
+                print(line)
+
+
 class XFunc(object):
     """Wrapper for functions that turns them into externally run processes.
 
@@ -156,6 +489,21 @@ class XFunc(object):
     serializer : {'json', 'pickle'}, optional
         The serialisation mechnanism to be used to pass data between the caller and the subprocess.
         Default is ``'json'``.
+    binary_arrays : bool, optional
+        With the ``'json'`` serializer, pass numpy arrays as raw bytes instead of as nested lists.
+        Arrays returned by the wrapped function are then numpy arrays, instead of lists.
+        This is only possible if numpy is available to the caller,
+        otherwise, for example in IronPython, arrays are always passed as lists.
+        Default is ``False``.
+    persistent : bool, optional
+        Set to ``True`` to run the function in a Python process that stays alive between calls,
+        instead of in a new process for every call.
+        All persistent wrapped functions with the same Python executable share the same process,
+        see :meth:`XFuncWorker.shared`.
+        Default is ``False``.
+    worker : :class:`XFuncWorker`, optional
+        A specific persistent process to run the function in.
+        Default is ``None``.
 
     Attributes
     ----------
@@ -236,12 +584,14 @@ class XFunc(object):
     def __init__(self, funcname, basedir='.', tmpdir=None, delete_files=True,
                  verbose=True, callback=None, callback_args=None, python=None,
                  paths=None, serializer='json',
-                 argtypes=None, kwargtypes=None, restypes=None):
+                 argtypes=None, kwargtypes=None, restypes=None, binary_arrays=False,
+                 persistent=False, worker=None):
         self._basedir = None
         self._tmpdir = None
         self._callback = None
         self._python = None
         self._serializer = None
+        self._binary_arrays = False
         self.funcname = funcname
         self.basedir = basedir
         self.tmpdir = tmpdir or tempfile.mkdtemp('compas_xfunc')
@@ -252,6 +602,9 @@ class XFunc(object):
         self.python = compas._os.select_python(python)
         self.paths = paths or []
         self.serializer = serializer
+        self.binary_arrays = binary_arrays
+        self.persistent = persistent
+        self.worker = worker
         self.argtypes = argtypes
         self.kwargtypes = kwargtypes
         self.restypes = restypes
@@ -311,6 +664,20 @@ class XFunc(object):
             raise Exception("*serializer* should be one of {'json', 'pickle'}.")
         self._serializer = serializer
 
+    @property
+    def binary_arrays(self):
+        """bool: Pass numpy arrays as raw bytes instead of as nested lists."""
+        return self._binary_arrays
+
+    @binary_arrays.setter
+    def binary_arrays(self, binary_arrays):
+        if binary_arrays:
+            try:
+                import numpy  # noqa: F401
+            except ImportError:
+                binary_arrays = False
+        self._binary_arrays = bool(binary_arrays)
+
     @property
     def ipath(self):
         return os.path.join(self.tmpdir, '%s.in' % self.funcname)
@@ -354,9 +721,15 @@ class XFunc(object):
             # 'restypes': self.restypes
         }
 
+        worker = self.worker
+        if worker is None and self.persistent:
+            worker = XFuncWorker.shared(self.python)
+        if worker is not None:
+            return self._call_worker(worker, idict)
+
         if self.serializer == 'json':
             with open(self.ipath, 'w+') as fo:
-                json.dump(idict, fo, cls=DataEncoder)
+                json.dump(idict, fo, cls=DataEncoder, binary_arrays=self.binary_arrays)
         else:
             with open(self.ipath, 'wb+') as fo:
                 pickle.dump(idict, fo, protocol=2)
@@ -365,7 +738,7 @@ class XFunc(object):
             fh.write('')
 
         env = compas._os.prepare_environment()
-        args = [WRAPPER, self.basedir, self.funcname, self.ipath, self.opath, self.serializer]
+        args = [WRAPPER, self.basedir, self.funcname, self.ipath, self.opath, self.serializer, '1' if self.binary_arrays else '0']
 
         try:
             Popen
@@ -381,7 +754,7 @@ class XFunc(object):
             process.StartInfo.RedirectStandardOutput = True
             process.StartInfo.RedirectStandardError = True
             process.StartInfo.FileName = self.python
-            process.StartInfo.Arguments = '-u -c "{0}" {1} {2} {3} {4} {5}'.format(*args)
+            process.StartInfo.Arguments = '-u -c "{0}" {1} {2} {3} {4} {5} {6}'.format(*args)
             process.Start()
             process.WaitForExit()
 
@@ -435,6 +808,30 @@ class XFunc(object):
 
         return self.data
 
+    def _call_worker(self, worker, idict):
+        # exchange the input and output with a persistent process over its standard streams
+        if self.serializer == 'json':
+            data = json.dumps(idict, cls=DataEncoder, binary_arrays=self.binary_arrays)
+        else:
+            data = base64.b64encode(pickle.dumps(idict, protocol=2)).decode('ascii')
+
+        output = worker.call(self.funcname, self.basedir, data, self.serializer, self.binary_arrays,
+                             callback=self.callback, callback_args=self.callback_args, verbose=self.verbose)
+
+        if self.serializer == 'json':
+            odict = json.loads(output, cls=DataDecoder)
+        else:
+            odict = pickle.loads(base64.b64decode(output))
+
+        self.data = odict['data']
+        self.profile = odict['profile']
+        self.error = odict['error']
+
+        if self.error:
+            raise Exception(self.error)
+
+        return self.data
+
 
 # ==============================================================================
 # Main
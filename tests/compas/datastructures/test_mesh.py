@@ -184,6 +184,56 @@ def test_to_vertices_and_faces():
     assert len(faces) == 25
 
 
+def test_from_vertices_and_faces_bulk():
+    vertices = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0], [2, 1, 0]]
+    faces = [[0, 1, 2], [0, 2, 3], [1, 4, 5], [1, 5, 2], [2, 1, 0]]
+    for compact in (False, True):
+        mesh = Mesh(compact=compact)
+        for x, y, z in vertices:
+            mesh.add_vertex(x=x, y=y, z=z)
+        for face in faces:
+            mesh.add_face(face)
+        other = Mesh.from_vertices_and_faces(vertices, faces, compact=compact)
+        assert [list(other.halfedge[key].items()) for key in other.vertices()] == [list(mesh.halfedge[key].items()) for key in mesh.vertices()]
+        assert other.data == mesh.data
+    if not compas.IPY:
+        import numpy
+        other = Mesh.from_vertices_and_faces(numpy.array(vertices, dtype=float), numpy.array(faces))
+        assert other.data == mesh.data
+
+
+def test_constructor_compact():
+    mesh = Mesh.from_obj(compas.get('faces.obj'))
+    compact = Mesh.from_vertices_and_faces(*mesh.to_vertices_and_faces(), compact=True)
+    assert compact.number_of_vertices() == mesh.number_of_vertices()
+    assert compact.number_of_faces() == mesh.number_of_faces()
+    assert compact.number_of_edges() == mesh.number_of_edges()
+    assert compact.vertices_attributes('xyz') == mesh.vertices_attributes('xyz')
+    assert [compact.face_vertices(fkey) for fkey in compact.faces()] == [mesh.face_vertices(fkey) for fkey in mesh.faces()]
+    for key in mesh.vertices():
+        assert compact.vertex_neighbors(key, ordered=True) == mesh.vertex_neighbors(key, ordered=True)
+        assert compact.vertex_faces(key, ordered=True) == mesh.vertex_faces(key, ordered=True)
+    assert compact.is_valid()
+    assert Mesh.from_data(compact.data).data == mesh.data
+
+
+def test_compact_operations():
+    mesh = Mesh.from_obj(compas.get('faces.obj'))
+    mesh = Mesh.from_vertices_and_faces(*mesh.to_vertices_and_faces(), compact=True)
+    mesh.vertex_attribute(0, 'is_fixed', True)
+    assert mesh.vertex_attributes(0) == {'x': 0.0, 'y': 0.0, 'z': 0.0, 'is_fixed': True}
+    mesh.insert_vertex(0)
+    mesh.delete_vertex(7)
+    u, v = mesh.face_halfedges(mesh.get_any_face())[0]
+    mesh.split_edge(u, v)
+    mesh.flip_cycles()
+    mesh.quads_to_triangles()
+    assert mesh.is_valid()
+    mesh.clear()
+    assert mesh.number_of_vertices() == 0
+    assert mesh.number_of_faces() == 0
+
+
 # --------------------------------------------------------------------------
 # helpers
 # --------------------------------------------------------------------------
@@ -196,6 +246,28 @@ def test_copy():
     assert mesh1.number_of_edges() == mesh2.number_of_edges()
 
 
+def test_copy_independent():
+    for compact in (False, True):
+        mesh1 = Mesh.from_obj(compas.get('faces.obj'))
+        if compact:
+            mesh1 = Mesh.from_vertices_and_faces(*mesh1.to_vertices_and_faces(), compact=True)
+        mesh1.vertex_attribute(0, 'tags', ['a'])
+        mesh1.face_attribute(0, 'weight', 1.0)
+        mesh2 = mesh1.copy()
+        assert mesh2._compact == compact
+        assert mesh2.data == mesh1.data
+        assert mesh2.halfedge == mesh1.halfedge
+        mesh2.vertex_attribute(0, 'x', 100.0)
+        mesh2.vertex_attribute(0, 'tags').append('b')
+        mesh2.face_attribute(0, 'weight', 2.0)
+        mesh2.delete_face(1)
+        assert mesh1.vertex_attribute(0, 'x') != 100.0
+        assert mesh1.vertex_attribute(0, 'tags') == ['a']
+        assert mesh1.face_attribute(0, 'weight') == 1.0
+        assert mesh1.has_face(1)
+        assert mesh1.is_valid()
+
+
 def test_clear():
     mesh = Mesh.from_obj(compas.get('faces.obj'))
     mesh.clear()
@@ -224,6 +296,23 @@ def test_add_face():
     assert mesh.number_of_faces() == v + 1
 
 
+def test_weld():
+    # the x coordinates of vertex 1 and 4 round to different geometric keys
+    vertices = [[0, 0, 0], [0.49949, 0, 0], [1, 1, 0], [0, 1, 0], [0.50041, 0, 0], [1, 0, 0], [1, 1, 0]]
+    faces = [[0, 1, 2, 3], [4, 5, 6]]
+    mesh = Mesh.from_vertices_and_faces(vertices, faces)
+    welds = [meshes_join_and_weld([mesh], precision='3f')]
+    if not compas.IPY:
+        from compas.datastructures import meshes_join_and_weld_numpy
+        welds.append(meshes_join_and_weld_numpy([mesh], precision='3f'))
+    for welded in welds:
+        assert welded.number_of_vertices() == 5
+        assert welded.vertices_attributes('xyz') == [[0, 0, 0], [0.49949, 0, 0], [1, 1, 0], [0, 1, 0], [1, 0, 0]]
+        assert [welded.face_vertices(fkey) for fkey in welded.faces()] == [[0, 1, 2, 3], [1, 4, 2]]
+    welded = meshes_join_and_weld([mesh], tolerance=0.0)
+    assert welded.number_of_vertices() == 6
+
+
 # --------------------------------------------------------------------------
 # modifiers
 # --------------------------------------------------------------------------
@@ -493,6 +582,21 @@ def test_face_adjacency_vertices():
     assert mesh.face_adjacency_vertices(0, 1) == [1, 7]
 
 
+def test_face_adjacency_and_unify_cycles():
+    # a strip of long, thin quads with every other face flipped
+    vertices = [[i, 0, 0] for i in range(201)] + [[i, 100, 0] for i in range(201)]
+    faces = [[i, i + 1, 202 + i, 201 + i] for i in range(200)]
+    for i in range(0, 200, 2):
+        faces[i] = faces[i][::-1]
+    mesh = Mesh.from_vertices_and_faces(vertices, faces)
+    adjacency = mesh.face_adjacency()
+    assert adjacency[0] == [1]
+    assert all(sorted(adjacency[i]) == [i - 1, i + 1] for i in range(1, 199))
+    mesh.unify_cycles(root=1)
+    assert all(mesh.face_vertices(i) == [i, i + 1, 202 + i, 201 + i] for i in range(200))
+    assert mesh.is_valid()
+
+
 def test_is_face_on_boundary():
     mesh = Mesh.from_obj(compas.get('faces.obj'))
     assert mesh.is_face_on_boundary(0)
@@ -635,6 +739,76 @@ def test_face_curvature():
     assert mesh.face_curvature(0) == 0
 
 
+@pytest.mark.parametrize('compact', [False, True])
+def test_geometry_cache(compact):
+    if compas.IPY:
+        return
+    mesh = Mesh.from_obj(compas.get('quadmesh.obj'))
+    mesh = Mesh.from_vertices_and_faces(*mesh.to_vertices_and_faces(), compact=compact)
+    cache = mesh.geometry_cache()
+    assert mesh.geometry_cache() is cache
+
+    def check():
+        for fkey in mesh.faces():
+            index = cache.face_index[fkey]
+            assert cache.face_areas()[index] == pytest.approx(mesh.face_area(fkey))
+            assert list(cache.face_normals()[index]) == pytest.approx(mesh.face_normal(fkey))
+            assert list(cache.face_centroids()[index]) == pytest.approx(mesh.face_centroid(fkey))
+        for key in mesh.vertices():
+            index = cache.vertex_index[key]
+            assert cache.vertex_areas()[index] == pytest.approx(mesh.vertex_area(key))
+            assert list(cache.vertex_normals()[index]) == pytest.approx(mesh.vertex_normal(key))
+
+    check()
+    areas = cache.face_areas()
+    assert cache.face_areas() is areas
+    key = mesh.face_vertices(0)[0]
+    mesh.vertex_attribute(key, 'z', mesh.vertex_attribute(key, 'z') + 1.0)
+    assert cache.face_areas() is not areas
+    check()
+    mesh.delete_face(0)
+    assert len(cache.face_areas()) == mesh.number_of_faces()
+    check()
+    areas = cache.face_areas()
+    fkey = mesh.get_any_face()
+    mesh.face[fkey] = mesh.face[fkey][::-1]
+    assert cache.face_areas() is areas
+    cache.invalidate()
+    assert cache.face_areas() is not areas
+    check()
+    # the mesh algorithms that move the vertices directly
+    from compas.datastructures import mesh_smooth_centroid
+    mesh_smooth_centroid(mesh, fixed=mesh.vertices_on_boundary(), kmax=10)
+    check()
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_cotangent_laplacian_matrix(compact):
+    if compas.IPY:
+        return
+    from compas.datastructures import mesh_quads_to_triangles
+    from compas.datastructures import trimesh_cotangent_laplacian_matrix
+    from compas.datastructures.mesh.core.matrices import trimesh_edge_cotangents
+    mesh = Mesh.from_obj(compas.get('quadmesh.obj'))
+    mesh = Mesh.from_vertices_and_faces(*mesh.to_vertices_and_faces(), compact=compact)
+    mesh_quads_to_triangles(mesh)
+    # an interior vertex with interior neighbours,
+    # such that the keys have a gap but every vertex keeps its neighbours
+    key = next(key for key in mesh.vertices()
+               if not any(mesh.is_vertex_on_boundary(nbr) for nbr in [key] + mesh.vertex_neighbors(key)))
+    mesh.delete_vertex(key)
+    L = trimesh_cotangent_laplacian_matrix(mesh, rtype='array')
+    key_index = mesh.key_index()
+    for key in mesh.vertices():
+        i = key_index[key]
+        weights = {nbr: sum(trimesh_edge_cotangents(mesh, key, nbr)) for nbr in mesh.vertex_neighbors(key)}
+        total = sum(weights.values())
+        assert L[i, i] == -1.0
+        for nbr, weight in weights.items():
+            assert L[i, key_index[nbr]] == pytest.approx(weight / total)
+        assert sum(L[i]) == pytest.approx(0.0, abs=1e-9)
+
+
 # --------------------------------------------------------------------------
 # boundary
 # --------------------------------------------------------------------------
@@ -32,6 +32,17 @@ def test_add_node():
     assert network.add_node(0, x=1) == 0
 
 
+def test_copy(k5_network):
+    k5_network.node_attribute('a', 'tags', ['x'])
+    other = k5_network.copy()
+    assert other.data == k5_network.data
+    other.node_attribute('a', 'tags').append('y')
+    other.delete_node('e')
+    assert k5_network.node_attribute('a', 'tags') == ['x']
+    assert k5_network.has_node('e')
+    assert k5_network.number_of_edges() == 10
+
+
 def test_non_planar(k5_network):
     if compas.IPY:
         return
@@ -48,3 +59,40 @@ def test_planar(k5_network):
 
     k5_network.delete_edge('a', 'b')  # Delete (a, b) edge to make K5 planar
     assert network_is_planar(k5_network) is True
+
+
+def test_crossings():
+    from compas.datastructures import network_count_crossings
+    from compas.datastructures import network_find_crossings
+    from compas.datastructures import network_is_crossed
+
+    network = Network()
+    for key, xyz in enumerate([[0, 0, 0], [2, 2, 0], [0, 2, 0], [2, 0, 0], [3, 0, 0], [3, 2, 0], [10, 10, 0], [11, 11, 0]]):
+        network.add_node(key, x=xyz[0], y=xyz[1], z=xyz[2])
+    network.add_edge(0, 1)
+    network.add_edge(2, 3)
+    network.add_edge(3, 4)
+    network.add_edge(0, 5)
+    network.add_edge(6, 7)
+    assert network_is_crossed(network)
+    assert network_count_crossings(network) == 2
+    assert sorted(map(sorted, network_find_crossings(network))) == [[(0, 1), (2, 3)], [(0, 5), (2, 3)]]
+    network.delete_edge(2, 3)
+    assert not network_is_crossed(network)
+
+
+def test_crossings_long_edge():
+    from compas.datastructures import network_find_crossings
+
+    network = Network()
+    for i in range(100):
+        # short vertical edges, of which the ones at x = y cross the diagonal
+        network.add_node(2 * i, x=i + 0.5, y=i + 0.5 * (i % 2) - 0.25, z=0)
+        network.add_node(2 * i + 1, x=i + 0.5, y=i + 0.5 * (i % 2) + 0.25, z=0)
+        network.add_edge(2 * i, 2 * i + 1)
+    network.add_node('a', x=0, y=0, z=0)
+    network.add_node('b', x=1000, y=1000, z=0)
+    network.add_edge('a', 'b')
+    crossings = network_find_crossings(network)
+    assert len(crossings) == 50
+    assert all(('a', 'b') in pair for pair in crossings)
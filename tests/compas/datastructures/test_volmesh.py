@@ -37,3 +37,12 @@ def test_volmesh_data():
     assert data2 == data2_
 
     assert data1 == data2
+
+
+def test_volmesh_copy():
+    vmesh1 = VolMesh.from_obj(compas.get('boxes.obj'))
+    vmesh2 = vmesh1.copy()
+    assert vmesh2.to_data() == vmesh1.to_data()
+    assert list(vmesh2.faces()) == list(vmesh1.faces())
+    vmesh2.vertex_attribute(0, 'x', 100.0)
+    assert vmesh1.vertex_attribute(0, 'x') != 100.0
@@ -0,0 +1,44 @@
+import random
+
+import pytest
+
+from compas.geometry import KDTree
+from compas.geometry import distance_point_point
+
+
+@pytest.fixture
+def cloud():
+    random.seed(0)
+    return [[random.random(), random.random(), random.random()] for _ in range(500)]
+
+
+def test_nearest_neighbors(cloud):
+    tree = KDTree(cloud)
+    for point in cloud[:20]:
+        distances = sorted(distance_point_point(point, other) for other in cloud)
+        nnbrs = tree.nearest_neighbors(point, 5)
+        assert [d for _, _, d in nnbrs] == pytest.approx(distances[:5])
+        assert nnbrs[0][1] == cloud.index(point)
+    assert tree.nearest_neighbors(cloud[0], 0) == []
+
+
+def test_nearest_neighbor_exclude(cloud):
+    tree = KDTree(cloud)
+    point = cloud[0]
+    nnbrs = tree.nearest_neighbors(point, 3)
+    xyz, label, distance = tree.nearest_neighbor(point, exclude={nnbrs[0][1], nnbrs[1][1]})
+    assert label == nnbrs[2][1]
+
+
+def test_neighbors_in_radius(cloud):
+    tree = KDTree(cloud)
+    point = [0.5, 0.5, 0.5]
+    labels = [label for _, label, _ in tree.neighbors_in_radius(point, 0.2)]
+    assert labels == [index for index, other in enumerate(cloud) if distance_point_point(point, other) <= 0.2]
+
+
+def test_query(cloud):
+    tree = KDTree(cloud)
+    assert tree.query(cloud[:10], 4) == [tree.nearest_neighbors(point, 4) for point in cloud[:10]]
+    assert len(tree.nearest_neighbors(cloud[0], 1000)) == len(cloud)
+    assert KDTree().nearest_neighbors(cloud[0], 3) == []
@@ -0,0 +1,18 @@
+import pytest
+
+
+@pytest.fixture
+def grid():
+    """A factory of square grid networks of n x n vertices, with a fixed boundary."""
+    def make(n):
+        vertices = [[i, j, 0.0] for i in range(n) for j in range(n)]
+        edges = []
+        for i in range(n):
+            for j in range(n):
+                if i < n - 1:
+                    edges.append((i * n + j, (i + 1) * n + j))
+                if j < n - 1:
+                    edges.append((i * n + j, i * n + j + 1))
+        fixed = [i * n + j for i in range(n) for j in range(n) if i in (0, n - 1) or j in (0, n - 1)]
+        return vertices, edges, fixed
+    return make
@@ -0,0 +1,62 @@
+import compas
+
+if not compas.IPY:
+    from numpy import allclose
+    from numpy import array
+
+    from compas.numerical import DescentState
+    from compas.numerical import descent_numpy
+
+
+def quadratic(x, *args):
+    return ((x - args[0]) ** 2).sum(axis=0)
+
+
+def quadratic_gradient(x, *args):
+    return 2 * (x - args[0])
+
+
+def test_descent_numpy_batched_probes():
+    if compas.IPY:
+        return
+    x0 = [3.0, -2.0, 0.5]
+    fopt, xopt = descent_numpy(x0, quadratic, iterations=50, args=(1.0,), printout=False)
+    fvec, xvec = descent_numpy(x0, quadratic, iterations=50, args=(1.0,), vectorized=True, printout=False)
+    fpool, xpool = descent_numpy(x0, quadratic, iterations=50, args=(1.0,), pool='threads', workers=2, printout=False)
+    assert fopt < 1e-6
+    assert allclose(xopt, xvec)
+    assert allclose(xopt, xpool)
+
+
+def test_descent_numpy_gradient():
+    if compas.IPY:
+        return
+    fopt, xopt = descent_numpy([3.0, -2.0, 0.5], quadratic, args=(1.0,), gradient=quadratic_gradient, printout=False)
+    assert fopt < 1e-6
+    assert allclose(xopt, 1.0, atol=1e-3)
+
+
+def rosenbrock(x, *args):
+    return float(((1 - x[:-1]) ** 2 + 100 * (x[1:] - x[:-1] ** 2) ** 2).sum())
+
+
+def test_descent_numpy_resume():
+    if compas.IPY:
+        return
+    x0 = array([1.3, 0.7, 0.8])
+    bounds = [[-2.0, 2.0]] * 3
+    fopt, xopt = descent_numpy(x0, rosenbrock, iterations=6, bounds=bounds, printout=False)
+    state = DescentState()
+    descent_numpy(x0, rosenbrock, iterations=3, bounds=bounds, state=state, printout=False)
+    fres, xres = descent_numpy(x0, rosenbrock, iterations=3, bounds=bounds, state=state, printout=False)
+    assert state.iteration == 6
+    assert fres == fopt
+    assert allclose(xres, xopt)
+
+
+def test_descent_numpy_no_iterations():
+    if compas.IPY:
+        return
+    fopt, xopt = descent_numpy([3.0, -2.0], quadratic, iterations=0, args=(1.0,), state=DescentState(), printout=False)
+    assert allclose(fopt, 4.0 + 9.0)
+    assert allclose(xopt.ravel(), [3.0, -2.0])
@@ -0,0 +1,28 @@
+import compas
+
+if not compas.IPY:
+    from numpy.random import seed
+
+    from compas.numerical import devo_numpy
+
+
+def sphere(u, *args):
+    return ((u - args[0]) ** 2).sum(axis=0)
+
+
+def test_devo_numpy_vectorized():
+    if compas.IPY:
+        return
+    seed(0)
+    fopt, xopt = devo_numpy(sphere, [[-5.0, 5.0]] * 3, 40, 100, args=(1.0,), vectorized=True, printout=0, neutrals=0)
+    assert fopt < 1e-3
+    assert all(abs(x - 1.0) < 0.1 for x in xopt)
+
+
+def test_devo_numpy_pool():
+    if compas.IPY:
+        return
+    seed(0)
+    fopt, xopt = devo_numpy(sphere, [[-5.0, 5.0]] * 3, 40, 100, args=(1.0,), pool='threads', workers=2, printout=0, neutrals=0)
+    assert fopt < 1e-3
+    assert all(abs(x - 1.0) < 0.1 for x in xopt)
@@ -0,0 +1,36 @@
+import compas
+
+if not compas.IPY:
+    from numpy import allclose
+    from numpy import array
+
+    from compas.numerical import dr_numpy
+    from compas.numerical import dr_numpy_batch
+
+
+def test_dr_numpy_batch(grid):
+    if compas.IPY:
+        return
+    vertices, edges, fixed = grid(4)
+    loads = array([[[0.0, 0.0, -0.1 * (k + 1)]] * len(vertices) for k in range(3)])
+    qpre = array([[1.0 + k] * len(edges) for k in range(3)])
+    xyz, q, f, l, r = dr_numpy_batch(vertices, edges, fixed, loads, qpre, kmax=500)
+    assert xyz.shape == (3, len(vertices), 3)
+    assert q.shape == (3, len(edges), 1)
+    for k in range(3):
+        xyz_k, q_k, f_k, l_k, r_k = dr_numpy(vertices, edges, fixed, loads[k].tolist(), qpre[k].tolist(), kmax=500)
+        assert allclose(xyz[k], xyz_k)
+        assert allclose(f[k], f_k)
+        assert allclose(r[k], r_k)
+
+
+def test_dr_numpy_batch_column(grid):
+    if compas.IPY:
+        return
+    vertices, edges, fixed = grid(4)
+    loads = [[0.0, 0.0, -0.1]] * len(vertices)
+    # a column of force densities, as returned by dr_numpy, is a single network
+    xyz, q, f, l, r = dr_numpy_batch(vertices, edges, fixed, loads, [[1.0]] * len(edges), kmax=500)
+    assert xyz.shape == (1, len(vertices), 3)
+    xyz_1, q_1, f_1, l_1, r_1 = dr_numpy(vertices, edges, fixed, loads, [1.0] * len(edges), kmax=500)
+    assert allclose(xyz[0], xyz_1)
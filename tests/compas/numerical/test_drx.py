@@ -0,0 +1,42 @@
+import pytest
+
+import compas
+
+if not compas.IPY:
+    from numpy import allclose
+
+    from compas.datastructures import Network
+
+
+def cablenet(n):
+    network = Network()
+    network.update_default_node_attributes({'B': [1, 1, 1], 'P': [0, 0, -0.1]})
+    network.update_default_edge_attributes({'E': 10, 'A': 1, 'ct': 't', 'l0': None, 's0': 1})
+    for i in range(n):
+        for j in range(n):
+            key = network.add_node(i * n + j, x=i, y=j, z=0)
+            if i in (0, n - 1) or j in (0, n - 1):
+                network.node_attribute(key, 'B', [0, 0, 0])
+    for i in range(n):
+        for j in range(n):
+            if i < n - 1:
+                network.add_edge(i * n + j, (i + 1) * n + j)
+            if j < n - 1:
+                network.add_edge(i * n + j, i * n + j + 1)
+    return network
+
+
+def test_drx_numba():
+    if compas.IPY:
+        return
+    pytest.importorskip('numba')
+    from compas.numerical.drx.drx_numba import drx_numba
+    from compas.numerical.drx.drx_numpy import drx_numpy
+
+    network = cablenet(6)
+    X, f, l, _ = drx_numpy(network, tol=0.01, steps=1000, refresh=0)
+    Xn, fn, ln = drx_numba(network, tol=0.01, steps=1000)
+    assert allclose(Xn, X)
+    # drx_numpy returns the forces and lengths of the last iteration before the final update of the coordinates
+    assert allclose(fn.ravel(), f.ravel(), atol=1e-2)
+    assert allclose(ln.ravel(), l.ravel(), atol=1e-3)
@@ -0,0 +1,42 @@
+import compas
+
+if not compas.IPY:
+    from numpy import allclose
+    from numpy import array
+
+    from compas.numerical import FDSolver
+    from compas.numerical import fd_numpy
+
+
+def test_fdsolver_load_cases(grid):
+    if compas.IPY:
+        return
+    vertices, edges, fixed = grid(5)
+    q = [1.0 + 0.1 * i for i in range(len(edges))]
+    loads = array([[[0.0, 0.0, -1.0 * (k + 1)]] * len(vertices) for k in range(3)])
+    solver = FDSolver(vertices, edges, fixed)
+    xyz, _, f, l, r = solver.solve(q, loads)
+    assert xyz.shape == (3, len(vertices), 3)
+    assert solver.factorisations == 1
+    for k in range(3):
+        xyz_k, _, f_k, l_k, r_k = fd_numpy(vertices, edges, fixed, q, loads[k])
+        assert allclose(xyz[k], xyz_k)
+        assert allclose(f[k], f_k)
+        assert allclose(r[k], r_k)
+    assert allclose(r[:, solver.free], 0.0)
+
+
+def test_fdsolver_refactorises_on_q_change(grid):
+    if compas.IPY:
+        return
+    vertices, edges, fixed = grid(4)
+    loads = [[0.0, 0.0, -1.0]] * len(vertices)
+    solver = FDSolver(vertices, edges, fixed)
+    solver.solve([1.0] * len(edges), loads)
+    solver.solve([1.0] * len(edges), loads)
+    assert solver.factorisations == 1
+    q = [2.0] * len(edges)
+    xyz, _, _, _, r = solver.solve(q, loads)
+    assert solver.factorisations == 2
+    assert allclose(r[solver.free], 0.0)
+    assert allclose(solver.stiffness_matrix(q).toarray(), solver.Cit.dot(solver.Ci).toarray() * 2.0)
@@ -0,0 +1,60 @@
+import math
+
+from compas.numerical import ga
+from compas.numerical import moga
+
+
+def sphere(x):
+    return sum((xi - 1.0) ** 2 for xi in x)
+
+
+def zdt3_f1(x):
+    return x[0]
+
+
+def zdt3_f2(x):
+    g = 1 + (9. / (len(x) - 1.)) * sum(x[1:])
+    return g * (1 - math.sqrt(x[0] / g) - (x[0] / g) * math.sin(10 * math.pi * x[0]))
+
+
+def test_ga_pool_checkpoint():
+    result = ga(sphere, 'min', 3, [(-5.0, 5.0)] * 3, num_gen=20, num_pop=30, num_bin_dig=[12] * 3,
+                pool='threads', workers=2, checkpoint_interval=5, write_files=False)
+    assert result.checkpoint['generation'] == 19
+    assert result.best_fit < 1.0
+
+
+def test_ga_resume_from_checkpoint():
+    result = ga(sphere, 'min', 3, [(-5.0, 5.0)] * 3, num_gen=10, num_pop=30, num_bin_dig=[12] * 3,
+                checkpoint_interval=5, write_files=False)
+    checkpoint = result.checkpoint
+    assert checkpoint['generation'] == 9
+    best_fit = result.best_fit
+
+    # the checkpoint is a copy of the population
+    result.current_pop['binary'][0][0][0] = 1 - result.current_pop['binary'][0][0][0]
+    assert checkpoint['binary'][0] != result.current_pop['binary'][0]
+
+    pop = result.get_pop_from_checkpoint()
+    assert pop['binary'] == checkpoint['binary']
+    assert pop['fit_value'] == checkpoint['fit_value']
+    assert result.num_pop == checkpoint['num_pop']
+    for x, value in zip(pop['scaled'], pop['fit_value']):
+        assert value == sphere(x)
+
+    result.start_from_gen = 9
+    result.num_gen = 15
+    result.ga_optimize()
+    assert result.checkpoint['generation'] == 14
+    assert result.end_gen == 14
+    # the elite of the checkpoint is kept
+    assert result.best_fit <= best_fit
+
+
+def test_moga_pool_checkpoint():
+    result = moga([zdt3_f1, zdt3_f2], ['min', 'min'], 5, [(0, 1)] * 5, num_gen=5, num_pop=20, num_bin_dig=[8] * 5,
+                  pool='threads', workers=2, checkpoint_interval=2, write_files=False)
+    assert result.checkpoint['generation'] == 4
+    assert len(result.checkpoint['fit_values']) == 20
+    for x, values in zip(result.parent_pop['scaled'], result.parent_pop['fit_values']):
+        assert values == [zdt3_f1(x), zdt3_f2(x)]
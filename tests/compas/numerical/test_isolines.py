@@ -0,0 +1,29 @@
+import compas
+
+if not compas.IPY:
+    from numpy import allclose
+    from numpy import array
+    from numpy import hypot
+    from scipy.spatial import Delaunay
+
+    from compas.numerical import scalarfield_contours_numpy
+
+
+def test_scalarfield_contours_numpy_tiled():
+    if compas.IPY:
+        return
+    xy = array([[0.1 * i - 1.0, 0.1 * j - 1.0] for i in range(21) for j in range(21)])
+    s = hypot(xy[:, 0], xy[:, 1])
+    triangulation = Delaunay(xy)
+    levels, contours = scalarfield_contours_numpy(xy, s, levels=[0.3, 0.6], density=50, tiles=3, triangulation=triangulation)
+    assert allclose(levels, [0.3, 0.6])
+    for level, contour in zip(levels, contours):
+        # one closed circle per level, stitched from the pieces of several tiles
+        assert len(contour) == 1
+        polyline = contour[0][0]
+        assert allclose(polyline[0], polyline[-1])
+        assert allclose(hypot(polyline[:, 0], polyline[:, 1]), level, atol=0.02)
+
+    # the same triangulation for another field on the same points
+    levels, contours = scalarfield_contours_numpy(xy, 2 * s, levels=[0.6], density=50, tiles=2, triangulation=triangulation)
+    assert len(contours[0]) == 1
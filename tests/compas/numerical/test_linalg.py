@@ -0,0 +1,69 @@
+import compas
+
+if not compas.IPY:
+    from numpy import allclose
+    from numpy import array
+    from scipy.sparse import diags
+
+    from compas.numerical import FactorisationCache
+    from compas.numerical.linalg import _lufactorized_cached
+
+
+def laplacian(n, scale=1.0):
+    return diags([-1.0, 2.0 + scale, -1.0], [-1, 0, 1], shape=(n, n), format='csc')
+
+
+def test_factorisation_cache():
+    if compas.IPY:
+        return
+    lufactorized = FactorisationCache(_lufactorized_cached, maxsize=2)
+    b = array([1.0, 2.0, 3.0, 4.0, 5.0])
+
+    A = laplacian(5)
+    solve = lufactorized(A)
+    assert allclose(A.dot(solve(b)), b)
+    assert lufactorized(A.copy()) is solve
+
+    # same pattern, other values
+    B = laplacian(5, scale=2.0)
+    solve = lufactorized(B)
+    assert allclose(B.dot(solve(b)), b)
+
+    C = laplacian(5, scale=3.0)
+    lufactorized(C)
+    info = lufactorized.cache_info()
+    assert (info.hits, info.misses, info.reuses, info.evictions, info.currsize) == (1, 3, 2, 1, 2)
+
+    lufactorized(A)
+    assert lufactorized.cache_info().misses == 4
+
+    lufactorized.cache_clear()
+    assert lufactorized.cache_info().currsize == 0
+
+
+def test_factorisation_cache_threads():
+    if compas.IPY:
+        return
+    import threading
+    lufactorized = FactorisationCache(_lufactorized_cached, maxsize=2)
+    b = array([1.0, 2.0, 3.0, 4.0, 5.0])
+    matrices = [laplacian(5, scale=scale) for scale in (1.0, 2.0, 3.0)]
+    errors = []
+
+    def solve(k):
+        try:
+            for i in range(200):
+                A = matrices[(i + k) % 3]
+                assert allclose(A.dot(lufactorized(A)(b)), b)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=solve, args=(k, )) for k in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    info = lufactorized.cache_info()
+    assert info.hits + info.misses == 8 * 200
+    assert info.currsize == 2
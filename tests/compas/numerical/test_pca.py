@@ -0,0 +1,40 @@
+import compas
+
+if not compas.IPY:
+    from numpy import abs
+    from numpy import allclose
+    from numpy.random import RandomState
+
+    from compas.numerical import IncrementalPCA
+    from compas.numerical import pca_numpy
+    from compas.numerical import pca_numpy_chunked
+
+
+def test_pca_numpy_chunked():
+    if compas.IPY:
+        return
+    points = RandomState(0).rand(1000, 3) * [10.0, 2.0, 0.1] + [100.0, -50.0, 3.0]
+    mean, vectors, values = pca_numpy(points)
+
+    mean_c, vectors_c, values_c = pca_numpy_chunked(points, chunksize=77)
+    assert allclose(mean, mean_c)
+    assert allclose(values, values_c)
+    assert allclose(abs(vectors), abs(vectors_c))
+
+    # from a generator of chunks of different sizes
+    chunks = (points[i:j] for i, j in [(0, 1), (1, 500), (500, 501), (501, 1000)])
+    mean_g, vectors_g, values_g = pca_numpy_chunked(chunks)
+    assert allclose(mean, mean_g)
+    assert allclose(values, values_g)
+
+
+def test_incremental_pca_covariance():
+    if compas.IPY:
+        return
+    points = RandomState(1).rand(200, 2)
+    pca = IncrementalPCA(dim=2)
+    for i in range(0, 200, 30):
+        pca.update(points[i:i + 30])
+    assert pca.n == 200
+    d = points - points.mean(axis=0)
+    assert allclose(pca.covariance(), d.T.dot(d) / 199)
@@ -0,0 +1,60 @@
+import compas
+
+if not compas.IPY:
+    from numpy import allclose
+    from numpy import zeros
+    from numpy.random import RandomState
+
+    from compas.numerical import topop_numpy
+
+
+def test_topop_numpy_cantilever():
+    if compas.IPY:
+        return
+    nelx, nely = 24, 12
+    supports = {'0-{}'.format(j): [1, 1] for j in range(nely + 1)}
+    loads = {'{}-{}'.format(nelx, nely // 2): [0, -1]}
+    iterations = []
+    x = topop_numpy(nelx, nely, loads, supports, volfrac=0.4, callback=iterations.append)
+    assert x.shape == (nely, nelx)
+    assert x.min() >= 0.0 and x.max() <= 1.0
+    assert abs(x.mean() - 0.4) < 0.01
+    assert len(iterations) > 0
+
+
+def test_topop_numpy_filter():
+    if compas.IPY:
+        return
+    from math import sqrt
+    from compas.numerical.topop.topop_numpy import _filter
+    nelx, nely = 7, 5
+    for rmin in (1.0, 1.5, 2.5):
+        H, Hs = _filter(nelx, nely, rmin)
+        # the dense construction, one element pair at a time
+        dense = zeros((nelx * nely, nelx * nely))
+        for i1 in range(nelx):
+            for j1 in range(nely):
+                for i2 in range(nelx):
+                    for j2 in range(nely):
+                        dense[i1 * nely + j1, i2 * nely + j2] = max(0, rmin - sqrt((i1 - i2)**2 + (j1 - j2)**2))
+        assert allclose(H.toarray(), dense)
+        assert allclose(Hs, dense.sum(axis=1))
+
+
+def test_topop_numpy_stiffness():
+    if compas.IPY:
+        return
+    from scipy.sparse import coo_matrix
+    from compas.numerical.topop.topop_numpy import _stiffness
+    from compas.numerical.topop.topop_numpy import _stiffness_pattern
+    ndof = 12
+    rng = RandomState(0)
+    iK = rng.randint(0, ndof, 200)
+    jK = rng.randint(0, ndof, 200)
+    free = [0, 1, 3, 4, 7, 8, 9, 11]
+    pattern = _stiffness_pattern(iK, jK, free, ndof)
+    for _ in range(2):
+        sK = rng.rand(200)
+        # the full matrix, sliced to the free dofs
+        K = coo_matrix((sK, (iK, jK)), shape=(ndof, ndof)).tocsc()[:, free].tocsr()[free, :]
+        assert allclose(_stiffness(sK, pattern).toarray(), K.toarray())
@@ -0,0 +1,83 @@
+import threading
+
+import pytest
+
+from compas.rpc import Dispatcher
+from compas.rpc import Proxy
+from compas.rpc import RemoteHandle
+from compas.rpc import RPCServerError
+from compas.rpc import Server
+
+
+class Service(Dispatcher):
+    max_objects = 2
+
+
+def start(**kwargs):
+    server = Server(('127.0.0.1', 0), logRequests=False, **kwargs)
+    server.register_function(server.ping)
+    server.register_instance(Service())
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
+
+
+@pytest.fixture
+def proxy():
+    server = start()
+    yield Proxy('operator', port=server.server_address[1])
+    server.shutdown()
+    server.server_close()
+
+
+def test_store_and_fetch(proxy):
+    handle = proxy.store([3, 1, 2])
+    assert isinstance(handle, RemoteHandle)
+    assert handle.type == 'list'
+    # the stored object is modified in place
+    proxy.setitem(handle, 0, 10)
+    assert proxy.fetch(handle) == [10, 1, 2]
+    assert proxy.getitem(handle, 1) == 1
+
+
+def test_return_handles(proxy):
+    handle = proxy.store([1, 2])
+    proxy.return_handles = True
+    result = proxy.add(handle, [3])
+    proxy.return_handles = False
+    assert isinstance(result, RemoteHandle)
+    assert proxy.fetch(result) == [1, 2, 3]
+
+
+def test_release_and_eviction(proxy):
+    a = proxy.store('a')
+    assert proxy.release(a)
+    assert not proxy.release(a)
+    with pytest.raises(RPCServerError):
+        proxy.fetch(a)
+
+    b = proxy.store('b')
+    proxy.store('c')
+    proxy.fetch(b)
+    proxy.store('d')
+    # the least recently used object is evicted
+    assert proxy.fetch(b) == 'b'
+    assert proxy._invoke(proxy._server.object_store_info, (), {})['count'] == 2
+
+
+def test_process_pool():
+    server = start(workers=2, pool='processes')
+    try:
+        proxy = Proxy('operator', port=server.server_address[1])
+        with pytest.raises(RPCServerError) as e:
+            proxy.store([1, 2])
+        assert 'worker processes' in str(e.value)
+        proxy.return_handles = True
+        with pytest.raises(RPCServerError):
+            proxy.add([1], [2])
+        proxy.return_handles = False
+        assert proxy.add([1], [2]) == [1, 2]
+    finally:
+        server.shutdown()
+        server.server_close()
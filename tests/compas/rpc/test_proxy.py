@@ -0,0 +1,90 @@
+import threading
+
+import pytest
+
+from compas.rpc import Dispatcher
+from compas.rpc import Future
+from compas.rpc import Proxy
+from compas.rpc import RPCServerError
+from compas.rpc import Server
+from compas.utilities import await_callback
+
+
+@pytest.fixture
+def proxy():
+    server = Server(('127.0.0.1', 0), logRequests=False)
+    server.register_function(server.ping)
+    server.register_instance(Dispatcher())
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield Proxy('operator', port=server.server_address[1])
+    server.shutdown()
+    server.server_close()
+
+
+def test_batch(proxy):
+    with proxy.batch() as batch:
+        assert batch.add(1, 2) == 0
+        batch.mul(3, 4)
+        batch.neg(5)
+        assert len(batch) == 3
+    assert batch.results == [3, 12, -5]
+    assert len(batch) == 0
+    assert batch.execute() == []
+
+
+def test_batch_error(proxy):
+    batch = proxy.batch()
+    batch.add(1, 2)
+    batch.truediv(1, 0)
+    with pytest.raises(RPCServerError):
+        batch.execute()
+
+
+def test_batch_async(proxy):
+    batch = proxy.batch()
+    batch.add(1, 2)
+    batch.sub(1, 2)
+    future = batch.execute_async()
+    assert future.result(timeout=10) == [3, -1]
+
+
+def test_call_async(proxy):
+    results = []
+    done = threading.Event()
+
+    def callback(result):
+        results.append(result)
+        done.set()
+
+    future = proxy.call_async('add', (1, 2), callback=callback)
+    assert isinstance(future, Future)
+    assert future.result(timeout=10) == 3
+    assert future.done()
+    assert future.exception() is None
+    done.wait(10)
+    assert results == [3]
+
+
+def test_call_async_error(proxy):
+    future = proxy.call_async('truediv', (1, 0))
+    assert isinstance(future.exception(timeout=10), RPCServerError)
+    with pytest.raises(RPCServerError):
+        future.result()
+
+
+def test_done_callback(proxy):
+    future = proxy.call_async('add', (1, 2))
+    future.result(timeout=10)
+    futures = []
+    future.add_done_callback(futures.append)
+    assert futures == [future]
+
+
+def test_await_callback(proxy):
+    result = await_callback(proxy.call_async, 'callback', 'errback', name='mul', args=(3, 4))
+    assert result == 12
+
+    with pytest.raises(RPCServerError):
+        await_callback(proxy.call_async, 'callback', 'errback', name='truediv', args=(1, 0))
@@ -0,0 +1,118 @@
+import json
+import os
+import threading
+import time
+
+from compas.rpc import Dispatcher
+from compas.rpc import Server
+
+try:
+    from xmlrpclib import ServerProxy
+except ImportError:
+    from xmlrpc.client import ServerProxy
+
+
+class PidService(Dispatcher):
+
+    def getpid(self):
+        return os.getpid()
+
+
+class MeetingService(Dispatcher):
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.count = 0
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def meet(self, n):
+        # wait until n calls are in progress at the same time
+        # the timeout only prevents the test from hanging if they never are
+        deadline = time.time() + 10
+        with self.condition:
+            self.count += 1
+            self.condition.notify_all()
+            while self.count < n:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False
+                self.condition.wait(remaining)
+        return True
+
+    def block(self):
+        self.entered.set()
+        self.release.wait(10)
+        return True
+
+
+def start(service, **kwargs):
+    server = Server(('127.0.0.1', 0), logRequests=False, **kwargs)
+    server.register_function(server.ping)
+    server.register_instance(service)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server, 'http://127.0.0.1:{}'.format(server.server_address[1])
+
+
+def call(address, name, args, results):
+    ostring = getattr(ServerProxy(address), name)(json.dumps({'args': args, 'kwargs': {}}))
+    results.append(json.loads(ostring))
+
+
+def concurrent_calls(address, n, name, args):
+    results = []
+    threads = [threading.Thread(target=call, args=(address, name, args, results)) for _ in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def stop(server):
+    server.shutdown()
+    server.server_close()
+
+
+def test_server_threads():
+    server, address = start(MeetingService(), workers=2)
+    try:
+        # both calls can only return True if they are handled at the same time
+        results = concurrent_calls(address, 2, 'meet', [2])
+        assert [result['error'] for result in results] == [None, None]
+        assert [result['data'] for result in results] == [True, True]
+    finally:
+        stop(server)
+
+
+def test_server_queue_size():
+    service = MeetingService()
+    server, address = start(service, workers=1, queue_size=0)
+    try:
+        results = []
+        thread = threading.Thread(target=call, args=(address, 'block', [], results))
+        thread.start()
+        assert service.entered.wait(10)
+        # the only worker is busy and no request can wait
+        call(address, 'block', [], results)
+        assert 'busy' in results[0]['error']
+        # registered functions are never rejected
+        assert ServerProxy(address).ping() == 1
+        service.release.set()
+        thread.join()
+        assert results[1]['error'] is None
+    finally:
+        service.release.set()
+        stop(server)
+
+
+def test_server_processes():
+    server, address = start(PidService(), workers=2, pool='processes')
+    try:
+        results = concurrent_calls(address, 2, 'getpid', [])
+        assert all(result['error'] is None for result in results)
+        assert all(result['data'] != os.getpid() for result in results)
+    finally:
+        stop(server)
@@ -0,0 +1,28 @@
+import compas
+from compas.topology import face_adjacency
+from compas.topology import unify_cycles
+
+
+def soup():
+    n = 12
+    vertices = [[i, j, 0] for i in range(n) for j in range(n)]
+    faces = [[i * n + j, (i + 1) * n + j, (i + 1) * n + j + 1, i * n + j + 1] for i in range(n - 1) for j in range(n - 1)]
+    for index in range(0, len(faces), 3):
+        faces[index] = faces[index][::-1]
+    return vertices, faces
+
+
+def test_face_adjacency():
+    vertices, faces = soup()
+    adjacency = face_adjacency(vertices, faces)
+    assert sorted(adjacency[0]) == [1, 11]
+    assert sorted(adjacency[12]) == [1, 11, 13, 23]
+    if not compas.IPY:
+        from compas.topology import face_adjacency_numpy
+        assert face_adjacency_numpy(vertices, faces) == adjacency
+
+
+def test_unify_cycles():
+    vertices, faces = soup()
+    faces = unify_cycles(vertices, faces, root=1)
+    assert faces[0] == [0, 12, 13, 1]
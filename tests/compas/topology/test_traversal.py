@@ -0,0 +1,95 @@
+import random
+
+import pytest
+
+import compas
+from compas.datastructures import Network
+from compas.topology import dijkstra_distances
+from compas.topology import dijkstra_multi_distances
+from compas.topology import dijkstra_path
+
+
+def grid(n):
+    random.seed(0)
+    adjacency = {(i, j): [] for i in range(n) for j in range(n)}
+    weight = {}
+    for i, j in adjacency:
+        for a, b in ((i + 1, j), (i, j + 1)):
+            if (a, b) in adjacency:
+                adjacency[i, j].append((a, b))
+                adjacency[a, b].append((i, j))
+                weight[(i, j), (a, b)] = weight[(a, b), (i, j)] = random.random()
+    return adjacency, weight
+
+
+def test_dijkstra_distances():
+    adjacency, weight = grid(10)
+    distance = dijkstra_distances(adjacency, weight, (0, 0))
+    assert distance[0, 0] == 0
+    for u in adjacency:
+        for v in adjacency[u]:
+            assert distance[v] <= distance[u] + weight[u, v] + 1e-12
+
+
+def test_dijkstra_multi_distances():
+    adjacency, weight = grid(10)
+    targets = [(0, 0), (9, 9)]
+    distance = dijkstra_multi_distances(adjacency, weight, targets)
+    first = dijkstra_distances(adjacency, weight, targets[0])
+    second = dijkstra_distances(adjacency, weight, targets[1])
+    for key in adjacency:
+        assert abs(distance[key] - min(first[key], second[key])) < 1e-12
+    cutoff = dijkstra_multi_distances(adjacency, weight, targets, cutoff=1.0)
+    for key in adjacency:
+        assert cutoff[key] == (distance[key] if distance[key] <= 1.0 else 1e+17)
+    if not compas.IPY:
+        from compas.topology import dijkstra_distances_numpy
+        result = dijkstra_distances_numpy(adjacency, weight, targets)
+        for key in adjacency:
+            assert abs(result[key] - distance[key]) < 1e-12
+
+
+def test_dijkstra_distances_numpy_without_min_only(monkeypatch):
+    if compas.IPY:
+        return
+    from scipy.sparse.csgraph import dijkstra
+    from compas.topology import dijkstra_distances_numpy
+    from compas.topology import traversal_numpy
+
+    def dijkstra_without_min_only(*args, **kwargs):
+        # SciPy before 1.3
+        if 'min_only' in kwargs:
+            raise TypeError("dijkstra() got an unexpected keyword argument 'min_only'")
+        return dijkstra(*args, **kwargs)
+
+    adjacency, weight = grid(10)
+    targets = [(0, 0), (9, 9)]
+    expected = dijkstra_distances_numpy(adjacency, weight, targets, cutoff=1.0)
+    monkeypatch.setattr(traversal_numpy, 'dijkstra', dijkstra_without_min_only)
+    assert dijkstra_distances_numpy(adjacency, weight, targets, cutoff=1.0) == expected
+
+
+def test_dijkstra_path():
+    adjacency, weight = grid(10)
+    distance = dijkstra_distances(adjacency, weight, (9, 9))
+    path = dijkstra_path(adjacency, weight, (0, 0), (9, 9))
+    assert path[0] == (0, 0) and path[-1] == (9, 9)
+    assert abs(sum(weight[u, v] for u, v in zip(path[:-1], path[1:])) - distance[0, 0]) < 1e-12
+    assert dijkstra_path(adjacency, weight, (0, 0), (9, 9), dist=distance) == path
+    adjacency[(10, 10)] = []
+    assert dijkstra_path(adjacency, weight, (10, 10), (0, 0)) is None
+
+
+def test_network_dijkstra():
+    network = Network()
+    for i in range(4):
+        network.add_node(i, x=float(i), y=0.0, z=0.0)
+    network.add_edge(0, 1)
+    network.add_edge(1, 2)
+    network.add_edge(0, 3)
+    assert network.dijkstra_distances([0]) == {0: 0, 1: 1.0, 2: 2.0, 3: 3.0}
+    assert network.dijkstra_distances([0], method='python') == {0: 0, 1: 1.0, 2: 2.0, 3: 3.0}
+    assert network.dijkstra_distances([2, 3], cutoff=0.5, method='python') == network.dijkstra_distances([2, 3], cutoff=0.5)
+    with pytest.raises(ValueError):
+        network.dijkstra_distances([0], method='heap')
+    assert network.dijkstra_path(2, 3) == [2, 1, 0, 3]
@@ -0,0 +1,38 @@
+import base64
+import json
+import struct
+
+import compas
+from compas.utilities import DataDecoder
+from compas.utilities import DataEncoder
+
+
+def tolist(values):
+    return values.tolist() if hasattr(values, 'tolist') else values
+
+
+def test_decode_binary_array():
+    data = {
+        '__ndarray__': base64.b64encode(struct.pack('<6d', *range(6))).decode('ascii'),
+        'type': '<f8',
+        'shape': [2, 3]
+    }
+    result = json.loads(json.dumps({'data': data}), cls=DataDecoder)
+    assert tolist(result['data']) == [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]]
+
+
+def test_encode_binary_array():
+    if compas.IPY:
+        return
+    import numpy as np
+
+    a = np.arange(12, dtype=np.int32).reshape((3, 4))
+    s = json.dumps({'a': a, 'b': a.astype(float) > 5}, cls=DataEncoder, binary_arrays=True)
+    assert '__ndarray__' in s
+    result = json.loads(s, cls=DataDecoder)
+    assert result['a'].dtype == np.int32
+    assert (result['a'] == a).all()
+    assert result['b'].tolist() == (a > 5).tolist()
+
+    # without binary arrays, the encoding is unchanged
+    assert json.loads(json.dumps(a, cls=DataEncoder), cls=DataDecoder) == a.tolist()
@@ -0,0 +1,109 @@
+import os
+import tempfile
+import threading
+
+import pytest
+
+import compas
+from compas.utilities import XFunc
+from compas.utilities import XFuncWorker
+
+
+SAMPLE = """
+import os
+
+
+def add(a, b):
+    print('adding {} and {}'.format(a, b))
+    return [a + b, os.getpid()]
+
+
+def fail():
+    raise ValueError('failed')
+
+
+def warn(message):
+    import sys
+    sys.stderr.write(message + '\\n')
+    print('warned')
+    return message
+
+
+def progress(n):
+    import sys
+    for i in range(n):
+        sys.stdout.write('.')
+    return n
+"""
+
+
+@pytest.fixture
+def basedir():
+    path = tempfile.mkdtemp()
+    with open(os.path.join(path, 'xfunc_sample.py'), 'w') as f:
+        f.write(SAMPLE)
+    return path
+
+
+def test_xfunc_worker(basedir):
+    if compas.IPY:
+        return
+    lines = []
+    with XFuncWorker(python='python') as worker:
+        add = XFunc('xfunc_sample.add', basedir=basedir, worker=worker, verbose=False,
+                    callback=lambda line, args: lines.append(line))
+        result1, pid1 = add(1, 2)
+        result2, pid2 = add(3, 4)
+        assert (result1, result2) == (3, 7)
+        # the same process handles both calls
+        assert pid1 == pid2 != os.getpid()
+        assert lines == ['adding 1 and 2', 'adding 3 and 4']
+
+        fail = XFunc('xfunc_sample.fail', basedir=basedir, worker=worker, verbose=False)
+        with pytest.raises(Exception):
+            fail()
+        # the worker survives errors in the wrapped function
+        assert add(5, 6)[1] == pid1
+    assert not worker.is_running
+
+
+def test_xfunc_worker_partial_line(basedir):
+    if compas.IPY:
+        return
+    lines = []
+    with XFuncWorker(python='python') as worker:
+        progress = XFunc('xfunc_sample.progress', basedir=basedir, worker=worker, verbose=False,
+                         callback=lambda line, args: lines.append(line))
+        assert progress(3) == 3
+        assert progress(0) == 0
+    assert lines == ['...']
+
+
+def test_xfunc_worker_stderr(basedir):
+    if compas.IPY:
+        return
+    lines = []
+    with XFuncWorker(python='python') as worker:
+        warn = XFunc('xfunc_sample.warn', basedir=basedir, worker=worker, verbose=False,
+                     callback=lambda line, args: lines.append(line))
+        assert warn('careful') == 'careful'
+    # only stdout is passed on to the callback
+    assert lines == ['warned']
+
+
+def test_xfunc_worker_threads(basedir):
+    if compas.IPY:
+        return
+    results = {}
+
+    def run(worker, a):
+        add = XFunc('xfunc_sample.add', basedir=basedir, worker=worker, verbose=False)
+        results[a] = [add(a, b)[0] for b in range(20)]
+
+    with XFuncWorker(python='python') as worker:
+        threads = [threading.Thread(target=run, args=(worker, a * 100)) for a in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert results == {a * 100: [a * 100 + b for b in range(20)] for a in range(4)}